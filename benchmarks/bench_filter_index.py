@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Filter name resolution benchmark
+
+Resolves selector values against a synthetic CPI item-level metadata response
+(600 items plus states and sectors) with mospi.metadata.FilterIndex, and with
+a linear scan over the metadata entries (exact name match, then difflib over
+every name) for comparison. Index build time is reported separately; it is
+paid once per metadata cache refresh.
+
+Usage:
+    python benchmarks/bench_filter_index.py [--items 600]
+"""
+
+import argparse
+import difflib
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from mospi.metadata import FilterIndex, entry_options, filter_lists, normalize_name  # noqa: E402
+
+STATES = ["Andhra Pradesh", "Assam", "Bihar", "Gujarat", "Haryana", "Karnataka", "Kerala",
+          "Madhya Pradesh", "Maharashtra", "Odisha", "Punjab", "Rajasthan", "Tamil Nadu",
+          "Telangana", "Uttar Pradesh", "Uttarakhand", "West Bengal", "ALL India"]
+WORDS = ["rice", "wheat", "atta", "pulses", "milk", "ghee", "sugar", "tea", "coffee", "salt",
+         "onion", "potato", "tomato", "banana", "mango", "fish", "mutton", "egg", "oil", "soap"]
+
+
+def make_metadata(items: int) -> dict:
+    rng = random.Random(42)
+    names = set()
+    while len(names) < items:
+        names.add(" ".join(rng.sample(WORDS, rng.randint(1, 3))).title())
+    return {"data": {
+        "state": [{"state_code": i + 1, "state_name": name} for i, name in enumerate(STATES)],
+        "sector": [{"sector_code": i + 1, "sector_name": name} for i, name in enumerate(["Rural", "Urban", "Combined"])],
+        "item": [{"item_code": f"1.1.{i:03d}", "item_name": name} for i, name in enumerate(sorted(names))],
+    }}
+
+
+def linear_resolve(metadata: dict, dimension: str, value: str):
+    """Previous approach: scan the entries for an exact match, then difflib over all names."""
+    options = entry_options(dimension, filter_lists(metadata)[dimension])
+    query = normalize_name(value)
+    for option in options:
+        if normalize_name(option[2]) == query or normalize_name(option[1]) == query:
+            return option
+    names = [normalize_name(name) for _, _, name in options]
+    close = difflib.get_close_matches(query, names, n=1, cutoff=0.8)
+    return options[names.index(close[0])] if close else None
+
+
+def timed(fn, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--items", type=int, default=600)
+    args = parser.parse_args()
+
+    metadata = make_metadata(args.items)
+    start = time.perf_counter()
+    index = FilterIndex(metadata)
+    print(f"Index build: {(time.perf_counter() - start) * 1000:.1f} ms for {args.items} items\n")
+
+    item = metadata["data"]["item"][args.items // 2]["item_name"]
+    cases = [
+        ("state exact", "state", "Kerala"),
+        ("state misspelt", "state", "Kerela"),
+        ("item exact", "item", item),
+        ("item misspelt", "item", item[:-1] + "x"),
+    ]
+    header = f"{'lookup':>16} {'scan us':>10} {'index us':>10} {'speedup':>8}  match"
+    print(header)
+    print("-" * len(header))
+    for label, dimension, value in cases:
+        scan_us = timed(lambda: linear_resolve(metadata, dimension, value), 50)
+        index_us = timed(lambda: index.resolve(dimension, value), 500)
+        method, matches = index.resolve(dimension, value)
+        print(f"{label:>16} {scan_us:>10.1f} {index_us:>10.1f} {scan_us / index_us:>7.1f}x  "
+              f"{method} {[name for _, _, name in matches][:2]}")
+
+
+if __name__ == "__main__":
+    main()
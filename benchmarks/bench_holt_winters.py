@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Holt-Winters benchmark
+
+Runs N synthetic 60-month CPI item series through the previous iloc-based
+ExponentialSmoothingForecaster recursion (fixed alpha/beta/gamma, one series
+at a time), the vectorized recursion in phase4_forecasting at the same fixed
+parameters (all series as one 2-D array), and the vectorized fit with
+alpha/beta/gamma optimised by SSE. The previous fitted values were taken after
+each update (they had already seen the observation), so its SSE is not a
+one-step-ahead error and is shown for reference only.
+
+Usage:
+    python benchmarks/bench_holt_winters.py [--series 300]
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "mcp-test-run-cc"))
+
+from phase4_forecasting import fit_holt_winters, holt_winters_filter  # noqa: E402
+
+logging.disable(logging.INFO)
+
+MONTHS = 60
+
+
+def make_panel(n_series: int, seed: int = 0) -> np.ndarray:
+    """Item series with differing trends, seasonal amplitudes and noise levels."""
+    rng = np.random.default_rng(seed)
+    t = np.arange(MONTHS)
+    trend = rng.uniform(0.1, 0.6, (n_series, 1))
+    amplitude = rng.uniform(0.5, 4.0, (n_series, 1))
+    phase = rng.uniform(0, 2 * np.pi, (n_series, 1))
+    noise = np.cumsum(rng.normal(0, 0.3, (n_series, MONTHS)), axis=1)
+    return 100 + trend * t + amplitude * np.sin(2 * np.pi * t / 12 + phase) + noise
+
+
+# Previous implementation (iloc loops, fixed parameters), kept for comparison
+
+def legacy_fit(series: pd.Series, s: int = 12):
+    alpha, beta, gamma = 0.3, 0.1, 0.1
+    level = series.iloc[:s].mean()
+    trend = (series.iloc[s:2 * s].mean() - series.iloc[:s].mean()) / s
+    seasonal = [series.iloc[i] / level for i in range(s)]
+    fitted = [series.iloc[0]]
+    for i in range(1, len(series)):
+        season = seasonal[i % s]
+        prev_level = level
+        level = alpha * (series.iloc[i] / season) + (1 - alpha) * (level + trend)
+        trend = beta * (level - prev_level) + (1 - beta) * trend
+        seasonal[i % s] = gamma * (series.iloc[i] / level) + (1 - gamma) * season
+        fitted.append((level + trend) * seasonal[i % s])
+    return np.sum((series.to_numpy() - np.array(fitted)) ** 2)
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, (time.perf_counter() - start) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--series", type=int, default=300)
+    args = parser.parse_args()
+
+    Y = make_panel(args.series)
+    index = pd.date_range("2020-01-01", periods=MONTHS, freq="MS")
+    series = [pd.Series(row, index=index) for row in Y]
+
+    legacy_sse, legacy_ms = timed(lambda: sum(legacy_fit(s) for s in series))
+    print(f"{args.series} series x {MONTHS} months\n")
+    header = f"{'method':>28} {'ms':>10} {'total sse':>12}"
+    print(header)
+    print("-" * len(header))
+    print(f"{'iloc loop, fixed params':>28} {legacy_ms:>10.1f} {legacy_sse:>12.1f}")
+    fixed = [np.full(len(Y), value) for value in (0.3, 0.1, 0.1)]
+    fitted, ms = timed(lambda: holt_winters_filter(Y, *fixed, 12, "multiplicative")[0])
+    print(f"{'vectorized, fixed params':>28} {ms:>10.1f} {np.sum((Y - fitted) ** 2):>12.1f}")
+    for seasonal in ("multiplicative", "additive"):
+        fit, ms = timed(lambda: fit_holt_winters(Y, 12, seasonal))
+        print(f"{'vectorized, ' + seasonal:>28} {ms:>10.1f} {fit.sse.sum():>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
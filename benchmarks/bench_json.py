@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+JSON backend benchmark
+
+Compares the stdlib json module with orjson (via mospi.jsonutil) on synthetic
+MoSPI-shaped payloads of 1, 5 and 10 MB. Each size is timed for:
+- decode: parsing the upstream response body (MoSPI.get_data)
+- encode: serializing the tool result (4_get_data text content / telemetry)
+
+Usage:
+    python benchmarks/bench_json.py
+"""
+
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from mospi import jsonutil  # noqa: E402
+
+STATES = ["ALL India", "Andhra Pradesh", "Bihar", "Gujarat", "Karnataka", "Kerala",
+          "Maharashtra", "Odisha", "Punjab", "Rajasthan", "Tamil Nadu", "Uttar Pradesh"]
+GROUPS = ["Food and beverages", "Pan, tobacco and intoxicants", "Clothing and footwear",
+          "Housing", "Fuel and light", "Miscellaneous", "General"]
+MONTHS = ["January", "February", "March", "April", "May", "June", "July",
+          "August", "September", "October", "November", "December"]
+
+
+def make_payload(target_bytes: int) -> dict:
+    """Build a CPI group-index style response of roughly target_bytes."""
+    rng = random.Random(42)
+    rows = []
+    size = 0
+    while size < target_bytes:
+        row = {
+            "baseyear": "2012",
+            "year": rng.randint(2013, 2025),
+            "month": rng.choice(MONTHS),
+            "state": rng.choice(STATES),
+            "sector": rng.choice(["Rural", "Urban", "Combined"]),
+            "group": rng.choice(GROUPS),
+            "subgroup": "",
+            "index": round(rng.uniform(100, 220), 1),
+            "inflation": round(rng.uniform(-3, 12), 2),
+            "status": "F",
+        }
+        rows.append(row)
+        size += 190
+    return {"data": rows, "msg": "Data fetched successfully", "statusCode": True,
+            "meta_data": {"page": 1, "totalRecords": len(rows)}}
+
+
+def best_of(fn, repeat: int = 5) -> float:
+    """Best wall time of `repeat` runs, in milliseconds."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times) * 1000
+
+
+def main():
+    print(f"Fast backend: {jsonutil.BACKEND}")
+    if jsonutil.BACKEND == "json":
+        print("orjson is not installed; both columns use the stdlib.\n")
+
+    header = f"{'size':>6} {'op':>7} {'stdlib ms':>10} {'jsonutil ms':>12} {'speedup':>8}"
+    print(header)
+    print("-" * len(header))
+
+    for mb in (1, 5, 10):
+        payload = make_payload(mb * 1024 * 1024)
+        body = json.dumps(payload).encode("utf-8")
+
+        std_decode = best_of(lambda: json.loads(body))
+        fast_decode = best_of(lambda: jsonutil.loads(body))
+
+        std_encode = best_of(lambda: json.dumps(payload, ensure_ascii=False, default=str))
+        fast_encode = best_of(lambda: jsonutil.dumps(payload))
+
+        label = f"{len(body) / 1024 / 1024:.1f}MB"
+        print(f"{label:>6} {'decode':>7} {std_decode:>10.1f} {fast_decode:>12.1f} "
+              f"{std_decode / fast_decode:>7.1f}x")
+        print(f"{label:>6} {'encode':>7} {std_encode:>10.1f} {fast_encode:>12.1f} "
+              f"{std_encode / fast_encode:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Phase 3 visualization/report benchmark
+
+Times VisualizationDataPreparer and ReportGenerator.generate_recent_trends on a
+synthetic item-level, all-state CPI frame (Jan 2020 - Jan 2025), against the
+previous iterrows-based implementations kept below for reference. Outputs of
+both versions are compared before timing.
+
+Usage:
+    python benchmarks/bench_phase3_viz.py [--states 36] [--items 300]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "mcp-test-run-cc"))
+
+from phase3_cpi_analysis import (  # noqa: E402
+    CPIRecordColumns,
+    ReportGenerator,
+    VisualizationDataPreparer,
+)
+
+SECTORS = ["Rural", "Urban", "Combined"]
+GROUPS = [("0", "General Index"), ("1", "Food and Beverages"), ("2", "Pan, Tobacco and Intoxicants"),
+          ("3", "Clothing and Footwear"), ("4", "Housing"), ("5", "Fuel and Light"), ("6", "Miscellaneous")]
+MONTHS = 61
+
+
+def make_frame(states: int, items: int) -> pd.DataFrame:
+    """Item-level CPI frame: states x sectors x items x 61 months, items spread over the groups."""
+    rng = np.random.default_rng(42)
+    n_series = states * len(SECTORS) * items
+    n = n_series * MONTHS
+
+    series = np.repeat(np.arange(n_series), MONTHS)
+    month_index = np.tile(np.arange(MONTHS), n_series)
+    item = series % items
+    sector = (series // items) % len(SECTORS)
+    state = series // (items * len(SECTORS))
+    # Item 0 of every state/sector is the general index, the rest cycle through groups 1-6
+    group = np.where(item == 0, 0, 1 + item % (len(GROUPS) - 1))
+
+    codes = {
+        "sector": sector, "group": group, "group_code": group,
+        "subgroup": item, "subgroup_code": item,
+        "series": np.zeros(n, dtype=int), "base_year": np.zeros(n, dtype=int), "state": state,
+    }
+    categories = {
+        "sector": SECTORS,
+        "group": [name for _, name in GROUPS],
+        "group_code": [code for code, _ in GROUPS],
+        "subgroup": [f"Item {i}" for i in range(items)],
+        "subgroup_code": [str(i) for i in range(items)],
+        "series": ["Current"], "base_year": ["2012"],
+        "state": [f"State {i}" for i in range(states)],
+    }
+    values = {
+        "year": (2020 + month_index // 12).astype(np.int16),
+        "month": (1 + month_index % 12).astype(np.int8),
+        "index_value": np.round(100 + 0.3 * month_index + rng.normal(0, 2, n), 1),
+    }
+    batch = CPIRecordColumns(values, {k: v.astype(np.int16) for k, v in codes.items()}, categories)
+    # Shuffle so sorting has real work to do
+    return batch.to_frame().sample(frac=1.0, random_state=42).reset_index(drop=True)
+
+
+# Previous implementations (row loops), kept for comparison
+
+def legacy_points(frame):
+    return [{'date': row['date'].isoformat(), 'value': row['index_value']} for _, row in frame.iterrows()]
+
+
+def legacy_historical_trend(df):
+    general = df[(df['group_code'] == '0') & (df['sector'] == 'Combined')].sort_values('date', kind='stable')
+    return {'general': legacy_points(general), 'food': [], 'fuel': [], 'core': []}
+
+
+def legacy_component_breakdown(df):
+    data = {}
+    for group in df['group'].unique():
+        if group == 'General Index':
+            continue
+        data[group] = legacy_points(df[df['group'] == group].sort_values('date', kind='stable'))
+    return data
+
+
+def legacy_rural_urban(df):
+    rural = df[(df['sector'] == 'Rural') & (df['group_code'] == '0')].sort_values('date', kind='stable')
+    urban = df[(df['sector'] == 'Urban') & (df['group_code'] == '0')].sort_values('date', kind='stable')
+    return {'rural': legacy_points(rural), 'urban': legacy_points(urban)}
+
+
+def legacy_food_vs_nonfood(df):
+    food = df[df['group_code'] == '1'].sort_values('date', kind='stable')
+    nonfood = df[df['group_code'] != '1'].sort_values('date', kind='stable')
+    return {'food': legacy_points(food), 'non_food': legacy_points(nonfood)}
+
+
+def legacy_recent_trends(df):
+    recent = df[(df['group_code'] == '0') & (df['sector'] == 'Combined')].sort_values('date', kind='stable').tail(12)
+    return pd.DataFrame([
+        {'Date': row['date'].strftime('%b %Y'), 'Index': f"{row['index_value']:.2f}", 'YoY Inflation': 'N/A'}
+        for _, row in recent.iterrows()
+    ])
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, (time.perf_counter() - start) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--states", type=int, default=36)
+    parser.add_argument("--items", type=int, default=300)
+    args = parser.parse_args()
+
+    df = make_frame(args.states, args.items)
+    print(f"Frame: {len(df):,} rows ({args.states} states x {len(SECTORS)} sectors x "
+          f"{args.items} items x {MONTHS} months)\n")
+
+    viz = VisualizationDataPreparer(df, {})
+    report = ReportGenerator(df, {}, {}, {}, {}, {})
+    cases = [
+        ("historical_trend", lambda: legacy_historical_trend(df), viz.prepare_historical_trend_data),
+        ("component_breakdown", lambda: legacy_component_breakdown(df), viz.prepare_component_breakdown),
+        ("rural_urban", lambda: legacy_rural_urban(df), viz.prepare_rural_urban_divergence),
+        ("food_vs_nonfood", lambda: legacy_food_vs_nonfood(df), viz.prepare_food_vs_nonfood),
+        ("recent_trends", lambda: legacy_recent_trends(df), report.generate_recent_trends),
+    ]
+
+    header = f"{'method':>20} {'iterrows ms':>12} {'vectorized ms':>14} {'speedup':>8}"
+    print(header)
+    print("-" * len(header))
+    for name, legacy, current in cases:
+        expected, legacy_ms = timed(legacy)
+        actual, current_ms = timed(current)
+        if isinstance(expected, pd.DataFrame):
+            pd.testing.assert_frame_equal(expected, actual, check_dtype=False)
+        else:
+            assert expected == actual, f"{name}: outputs differ"
+        print(f"{name:>20} {legacy_ms:>12.1f} {current_ms:>14.1f} {legacy_ms / current_ms:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
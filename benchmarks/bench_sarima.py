@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+SARIMA estimation benchmark
+
+Compares the previous SARIMA stand-in (variance-based AIC order search plus an
+exponential-smoothing loop as the fitted model) with the Kalman-filter
+maximum-likelihood fit in phase4_forecasting, on synthetic seasonal CPI-like
+series of 60-300 monthly points. The MLE search is timed with and without
+warm starts from neighbouring orders.
+
+Usage:
+    python benchmarks/bench_sarima.py
+"""
+
+import logging
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "mcp-test-run-cc"))
+
+from phase4_forecasting import SARIMAOrderSearch, fit_sarima  # noqa: E402
+
+logging.disable(logging.INFO)
+
+
+def make_series(n: int, seed: int = 0) -> pd.Series:
+    """Trending monthly index with seasonality and ARMA noise."""
+    rng = np.random.default_rng(seed)
+    t = np.arange(n)
+    noise = np.zeros(n)
+    shocks = rng.normal(0, 0.4, n)
+    for i in range(1, n):
+        noise[i] = 0.6 * noise[i - 1] + shocks[i] + 0.3 * shocks[i - 1]
+    values = 100 + 0.35 * t + 1.5 * np.sin(2 * np.pi * t / 12) + noise
+    return pd.Series(values, index=pd.date_range("2000-01-01", periods=n, freq="MS"))
+
+
+# Previous implementation, kept for comparison
+
+def legacy_aic(series: pd.Series, p, d, q, P, D, Q, s=12) -> float:
+    for _ in range(d):
+        series = series.diff().dropna()
+    for _ in range(D):
+        series = series.diff(s).dropna()
+    return len(series) * np.log(series.var()) + 2 * (p + d + q + P + D + Q + 1)
+
+
+def legacy_fit(series: pd.Series) -> np.ndarray:
+    fitted = np.zeros(len(series))
+    fitted[0] = series.iloc[0]
+    for t in range(1, len(series)):
+        fitted[t] = 0.3 * series.iloc[t] + 0.7 * fitted[t - 1]
+    return fitted
+
+
+def legacy_search_and_fit(series: pd.Series):
+    best = (np.inf, None)
+    for level in SARIMAOrderSearch.candidate_levels():
+        for order in level:
+            best = min(best, (legacy_aic(series, *order), order))
+    fitted = legacy_fit(series)
+    return best[1], np.sqrt(np.mean((series.to_numpy() - fitted) ** 2))
+
+
+def mle_search_and_fit(series: pd.Series, warm_start: bool):
+    search = SARIMAOrderSearch({"s": series}, max_workers=1, warm_start=warm_start)
+    order, _ = search.run()["s"]
+    estimate = fit_sarima(series.to_numpy(), order)
+    return order, np.sqrt(np.mean(estimate.residuals ** 2)), search.tested["s"]
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, (time.perf_counter() - start) * 1000
+
+
+def main():
+    header = (f"{'points':>6} {'legacy ms':>10} {'legacy rmse':>12} {'mle cold ms':>12} "
+              f"{'mle warm ms':>12} {'fits':>5} {'mle rmse':>9}  order")
+    print(header)
+    print("-" * len(header))
+
+    for n in (60, 120, 180, 300):
+        series = make_series(n)
+        (_, legacy_rmse), legacy_ms = timed(lambda: legacy_search_and_fit(series))
+        (_, _, _), cold_ms = timed(lambda: mle_search_and_fit(series, warm_start=False))
+        (order, mle_rmse, fits), warm_ms = timed(lambda: mle_search_and_fit(series, warm_start=True))
+        print(f"{n:>6} {legacy_ms:>10.1f} {legacy_rmse:>12.3f} {cold_ms:>12.1f} "
+              f"{warm_ms:>12.1f} {fits:>5} {mle_rmse:>9.3f}  SARIMA{order}")
+
+
+if __name__ == "__main__":
+    main()
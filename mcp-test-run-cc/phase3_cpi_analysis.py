@@ -8,17 +8,23 @@ Performs data collection, processing, and statistical analysis across:
 - 3 sectors (Rural, Urban, Combined)
 - 7 major groups
 - 16 critical subgroups
-- 61 months (Jan 2020 - Jan 2025)
+- Monthly from Jan 2020 to the latest month (61 months to Jan 2025 in the published run)
 
 Expected to process 3,312 records with proper handling of missing data,
 outlier detection, and inflation metrics calculation.
 """
 
 import asyncio
+import calendar
 import json
 import logging
+import os
+import sqlite3
+import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, Iterable, Iterator, List, Set, Tuple, Optional
 from dataclasses import dataclass
 from collections import defaultdict
 
@@ -26,6 +32,11 @@ import pandas as pd
 import numpy as np
 from scipy import stats
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+# Shared with the server's 5_detect_structural_breaks
+from mospi.changepoint import BREAK_MIN_SEGMENT, pelt_changepoints  # noqa: E402
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -52,6 +63,168 @@ class CPIRecord:
     subgroup_code: Optional[str]
     index_value: float
     series: str  # Current/Back
+    base_year: str = "2012"
+    state: str = "All India"
+
+
+class CPIRecordColumns:
+    """
+    Column-oriented batch of CPI records.
+
+    year/month/index_value are typed NumPy arrays and each text field is an
+    int16 code array into a per-column list of categories (-1 for missing),
+    so a record costs ~27 bytes instead of a CPIRecord object with its own
+    strings and datetime. Build batches with CPIRecordColumnsBuilder; use
+    to_frame() for pandas and records() where CPIRecord rows are needed.
+    """
+
+    NUMERIC = {'year': np.int16, 'month': np.int8, 'index_value': np.float64}
+    CATEGORICAL = ('sector', 'group', 'group_code', 'subgroup', 'subgroup_code', 'series', 'base_year', 'state')
+
+    def __init__(self, values: Dict[str, np.ndarray], codes: Dict[str, np.ndarray], categories: Dict[str, List[str]]):
+        self.values = values
+        self.codes = codes
+        self.categories = categories
+
+    @classmethod
+    def empty(cls) -> 'CPIRecordColumns':
+        return CPIRecordColumnsBuilder().build()
+
+    @classmethod
+    def from_records(cls, records: Iterable[CPIRecord]) -> 'CPIRecordColumns':
+        builder = CPIRecordColumnsBuilder()
+        for r in records:
+            builder.append(
+                year=r.year, month=r.month, sector=r.sector, group=r.group, group_code=r.group_code,
+                subgroup=r.subgroup, subgroup_code=r.subgroup_code, index_value=r.index_value,
+                series=r.series, base_year=r.base_year, state=r.state
+            )
+        return builder.build()
+
+    @classmethod
+    def concat(cls, batches: List['CPIRecordColumns']) -> 'CPIRecordColumns':
+        """Concatenate batches, merging their category lists"""
+        batches = [b for b in batches if len(b)]
+        if not batches:
+            return cls.empty()
+        if len(batches) == 1:
+            return batches[0]
+
+        values = {name: np.concatenate([b.values[name] for b in batches]) for name in cls.NUMERIC}
+        codes, categories = {}, {}
+        for name in cls.CATEGORICAL:
+            merged: Dict[str, int] = {}
+            remapped = []
+            for b in batches:
+                # Lookup table old code -> merged code; the extra slot keeps -1 (missing) at -1
+                lookup = np.array(
+                    [merged.setdefault(c, len(merged)) for c in b.categories[name]] + [-1],
+                    dtype=np.int16
+                )
+                remapped.append(lookup[b.codes[name]])
+            codes[name] = np.concatenate(remapped)
+            categories[name] = list(merged)
+        return cls(values, codes, categories)
+
+    def __len__(self) -> int:
+        return len(self.values['year'])
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the column arrays (category lists excluded)"""
+        return sum(a.nbytes for a in self.values.values()) + sum(a.nbytes for a in self.codes.values())
+
+    def column(self, name: str) -> List:
+        """Decoded values of one column as a Python list"""
+        if name in self.values:
+            return self.values[name].tolist()
+        lookup = self.categories[name] + [None]
+        return [lookup[c] for c in self.codes[name].tolist()]
+
+    def dates(self) -> np.ndarray:
+        """First-of-month dates as datetime64[ns], computed from year/month"""
+        months = (self.values['year'].astype(np.int64) - 1970) * 12 + (self.values['month'] - 1)
+        return months.astype('datetime64[M]').astype('datetime64[ns]')
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        DataFrame with the same columns CPIDataProcessor has always produced.
+
+        Numeric arrays are used as-is and text columns become pandas
+        Categoricals over the existing codes, so record data is not copied.
+        """
+        month_codes = self.values['month'].astype(np.int32) - 1
+        columns = {
+            'date': self.dates(),
+            'year': self.values['year'],
+            'month': self.values['month'],
+            'month_name': pd.Categorical.from_codes(month_codes, categories=list(calendar.month_name[1:])),
+        }
+        for name in ('sector', 'group', 'group_code', 'subgroup', 'subgroup_code'):
+            columns[name] = self._categorical(name)
+        columns['index_value'] = self.values['index_value']
+        columns['series'] = self._categorical('series')
+        columns['state'] = self._categorical('state')
+        return pd.DataFrame(columns, copy=False)
+
+    def _categorical(self, name: str) -> pd.Categorical:
+        return pd.Categorical.from_codes(self.codes[name], categories=self.categories[name])
+
+    def records(self) -> Iterator[CPIRecord]:
+        """Materialize CPIRecord rows (for code that needs per-record objects)"""
+        decoded = {name: self.column(name) for name in self.CATEGORICAL}
+        for i, (year, month, index_value) in enumerate(zip(
+            self.values['year'].tolist(), self.values['month'].tolist(), self.values['index_value'].tolist()
+        )):
+            yield CPIRecord(
+                year=year,
+                month=month,
+                month_name=calendar.month_name[month],
+                date=datetime(year, month, 1),
+                index_value=index_value,
+                **{name: decoded[name][i] for name in self.CATEGORICAL}
+            )
+
+
+class CPIRecordColumnsBuilder:
+    """Appends CPI records field by field into compact arrays"""
+
+    _TYPECODES = {'year': 'h', 'month': 'b', 'index_value': 'd'}
+
+    def __init__(self):
+        self._values = {name: array(code) for name, code in self._TYPECODES.items()}
+        self._codes = {name: array('h') for name in CPIRecordColumns.CATEGORICAL}
+        self._lookup: Dict[str, Dict[str, int]] = {name: {} for name in CPIRecordColumns.CATEGORICAL}
+
+    def __len__(self) -> int:
+        return len(self._values['year'])
+
+    def append(self, year: int, month: int, index_value: float, **fields: Optional[str]):
+        """Add one record; keyword fields are the CPIRecordColumns.CATEGORICAL names"""
+        self._values['year'].append(year)
+        self._values['month'].append(month)
+        self._values['index_value'].append(index_value)
+        for name in CPIRecordColumns.CATEGORICAL:
+            value = fields.get(name)
+            if value is None:
+                self._codes[name].append(-1)
+            else:
+                lookup = self._lookup[name]
+                self._codes[name].append(lookup.setdefault(str(value), len(lookup)))
+
+    def build(self) -> CPIRecordColumns:
+        values = {
+            name: np.frombuffer(self._values[name], dtype=dtype) if len(self._values[name])
+            else np.empty(0, dtype=dtype)
+            for name, dtype in CPIRecordColumns.NUMERIC.items()
+        }
+        codes = {
+            name: np.frombuffer(self._codes[name], dtype=np.int16) if len(self._codes[name])
+            else np.empty(0, dtype=np.int16)
+            for name in CPIRecordColumns.CATEGORICAL
+        }
+        categories = {name: list(lookup) for name, lookup in self._lookup.items()}
+        return CPIRecordColumns(values, codes, categories)
 
 
 @dataclass
@@ -64,17 +237,164 @@ class InflationMetrics:
     ma12: Optional[float]  # 12-month moving average
 
 
+# ============================================================================
+# LOCAL TIME-SERIES STORE
+# ============================================================================
+
+# Default location of the incremental CPI store (next to this script)
+DEFAULT_STORE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cpi_store.sqlite")
+
+
+class CPIRecordStore:
+    """
+    SQLite store of collected CPIRecords.
+
+    Rows are keyed by (base_year, series, state, sector, group, subgroup, year, month),
+    so re-inserting an observation replaces it. The collector uses the stored months
+    of each series to request only months newer than what is already stored, months
+    missing before that (e.g. from a failed fetch), and the last few stored months,
+    which MoSPI may since have revised.
+    """
+
+    def __init__(self, path: str = DEFAULT_STORE_PATH):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS cpi_records (
+                base_year TEXT NOT NULL,
+                series TEXT NOT NULL,
+                state TEXT NOT NULL,
+                sector TEXT NOT NULL,
+                group_name TEXT NOT NULL,
+                group_code TEXT NOT NULL,
+                subgroup TEXT NOT NULL DEFAULT '',
+                subgroup_code TEXT NOT NULL DEFAULT '',
+                year INTEGER NOT NULL,
+                month INTEGER NOT NULL,
+                index_value REAL NOT NULL,
+                PRIMARY KEY (base_year, series, state, sector, group_code, subgroup_code, year, month)
+            )
+        """)
+        self.conn.commit()
+
+    def stored_months(self, base_year: str, series: str, state: str) -> Dict[Tuple[str, str], Set[Tuple[int, int]]]:
+        """Stored (year, month) pairs per (sector, group_code)"""
+        rows = self.conn.execute("""
+            SELECT DISTINCT sector, group_code, year, month
+            FROM cpi_records
+            WHERE base_year = ? AND series = ? AND state = ?
+        """, (base_year, series, state))
+        months: Dict[Tuple[str, str], Set[Tuple[int, int]]] = {}
+        for sector, group_code, year, month in rows:
+            months.setdefault((sector, group_code), set()).add((year, month))
+        return months
+
+    def upsert(self, records: CPIRecordColumns) -> int:
+        """Insert or replace records; returns the number written"""
+        columns = {name: records.column(name) for name in CPIRecordColumns.CATEGORICAL}
+        with self.conn:
+            self.conn.executemany("""
+                INSERT OR REPLACE INTO cpi_records
+                (base_year, series, state, sector, group_name, group_code,
+                 subgroup, subgroup_code, year, month, index_value)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, zip(
+                columns['base_year'], columns['series'], columns['state'], columns['sector'],
+                columns['group'], columns['group_code'],
+                (v or '' for v in columns['subgroup']), (v or '' for v in columns['subgroup_code']),
+                records.column('year'), records.column('month'), records.column('index_value')
+            ))
+        return len(records)
+
+    def load(
+        self,
+        base_year: str,
+        series: str,
+        state: str,
+        start: Tuple[int, int],
+        end: Tuple[int, int]
+    ) -> CPIRecordColumns:
+        """Load stored records for one base year/series/state within [start, end] (year, month)"""
+        rows = self.conn.execute("""
+            SELECT sector, group_name, group_code, subgroup, subgroup_code, year, month, index_value
+            FROM cpi_records
+            WHERE base_year = ? AND series = ? AND state = ?
+              AND year * 100 + month BETWEEN ? AND ?
+            ORDER BY year, month, sector, group_code, subgroup_code
+        """, (base_year, series, state, start[0] * 100 + start[1], end[0] * 100 + end[1]))
+
+        builder = CPIRecordColumnsBuilder()
+        for sector, group_name, group_code, subgroup, subgroup_code, year, month, index_value in rows:
+            builder.append(
+                year=year,
+                month=month,
+                index_value=index_value,
+                sector=sector,
+                group=group_name,
+                group_code=group_code,
+                subgroup=subgroup or None,
+                subgroup_code=subgroup_code or None,
+                series=series,
+                base_year=base_year,
+                state=state
+            )
+        return builder.build()
+
+    def close(self):
+        self.conn.close()
+
+
 # ============================================================================
 # CPI DATA COLLECTION
 # ============================================================================
 
 class CPIDataCollector:
-    """Collects CPI data from MoSPI API"""
+    """Collects CPI data from the MoSPI MCP server (3_get_metadata / 4_get_data)"""
 
-    def __init__(self):
+    # Collection window: Jan 2020 through the latest month (or end_year/end_month)
+    START_YEAR = 2020
+
+    # Latest stored months fetched again on every run: recent CPI months are
+    # provisional and MoSPI revises them when the final figures are released
+    REVISION_MONTHS = 2
+
+    # Series identity used for the store key
+    BASE_YEAR = "2012"
+    SERIES = "Current"
+    STATE_CODE = "99"
+    STATE_NAME = "All India"
+
+    def __init__(
+        self,
+        max_concurrency: int = 8,
+        max_retries: int = 3,
+        retry_backoff: float = 0.5,
+        store: Optional[CPIRecordStore] = None,
+        end_year: Optional[int] = None,
+        end_month: Optional[int] = None
+    ):
+        """
+        Args:
+            max_concurrency: Maximum number of tool calls in flight at once
+            max_retries: Attempts per tool call before giving up
+            retry_backoff: Base delay in seconds, doubled after each failed attempt
+            store: Optional local store; when given, only months newer than the
+                   latest stored month, months missing before it and the last
+                   REVISION_MONTHS stored months are fetched; the rest is read locally
+            end_year, end_month: Last month to collect (defaults to the previous
+                   calendar month; pass 2025, 1 for the published Jan 2020 - Jan 2025 window)
+        """
         self.api_client = None
         self.data_cache = {}
-        self.records = []
+        self.records = CPIRecordColumns.empty()
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.store = store
+        latest_year, latest_month = self._latest_month(datetime.now())
+        self.end_year = end_year or latest_year
+        self.end_month = end_month or (latest_month if end_year is None else 12)
+        self._semaphore = None
 
     async def initialize_client(self):
         """Initialize the MoSPI API client"""
@@ -88,12 +408,15 @@ class CPIDataCollector:
             logger.info("Will use fallback demo data instead")
             self.api_client = None
 
-    async def fetch_cpi_data(self) -> List[CPIRecord]:
+    async def fetch_cpi_data(self) -> CPIRecordColumns:
         """
         Fetch CPI data for all combinations:
         - All 3 sectors (Rural=1, Urban=2, Combined=3)
         - All 7 groups (0-6)
-        - Date range: Jan 2020 to Jan 2025 (61 months)
+        - Date range: Jan 2020 to end_year/end_month
+
+        One 4_get_data call per sector x group x year (all months of the year in a
+        single comma-separated month_code), issued concurrently under a semaphore.
         """
         logger.info("Starting CPI data collection...")
 
@@ -101,6 +424,8 @@ class CPIDataCollector:
             logger.warning("Using demo data - no API client available")
             return self._generate_demo_data()
 
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
         # First, get metadata to understand the structure
         metadata = await self._get_metadata()
 
@@ -111,79 +436,141 @@ class CPIDataCollector:
 
         logger.info(f"Found {len(sectors)} sectors, {len(groups)} groups, {len(subgroups)} subgroups")
 
-        # Collect data for each combination
-        all_records = []
-        total_expected = len(sectors) * len(groups) * 61  # All months from 2020 to 2025
+        if not sectors or not groups:
+            logger.warning("Metadata missing sectors/groups - using demo data")
+            return self._generate_demo_data()
+
+        # Months already in the local store are skipped
+        stored = {}
+        if self.store:
+            stored = self.store.stored_months(self.BASE_YEAR, self.SERIES, self.STATE_NAME)
 
+        tasks = []
         for sector in sectors:
             for group in groups:
-                logger.info(f"Fetching {sector['sector_name']} - {group['group_name']}")
-                records = await self._fetch_group_data(
-                    sector, group, subgroups, start_year=2020, end_year=2025
-                )
-                all_records.extend(records)
+                have = stored.get((sector.get('sector_name', 'Unknown'), str(group.get('group_code', ''))))
+                for year, months in self._pending_months(have):
+                    tasks.append(self._fetch_group_data(sector, group, subgroups, year, months))
+        logger.info(f"Issuing {len(tasks)} requests (max {self.max_concurrency} concurrent)")
+
+        results = await asyncio.gather(*tasks)
+        all_records = CPIRecordColumns.concat(results)
+        logger.info(f"Fetched {len(all_records)} new records from the API")
+
+        if self.store:
+            self.store.upsert(all_records)
+            all_records = self.store.load(
+                self.BASE_YEAR, self.SERIES, self.STATE_NAME,
+                (self.START_YEAR, 1), (self.end_year, self.end_month)
+            )
+            logger.info(f"Loaded {len(all_records)} records from store {self.store.path}")
 
+        months = (self.end_year - self.START_YEAR) * 12 + self.end_month
+        total_expected = len(sectors) * len(groups) * months
         logger.info(f"Collected {len(all_records)} records (expected ~{total_expected})")
         self.records = all_records
         return all_records
 
+    @staticmethod
+    def _latest_month(now: datetime) -> Tuple[int, int]:
+        """(year, month) of the calendar month before `now`, the latest CPI month that can be out"""
+        return (now.year, now.month - 1) if now.month > 1 else (now.year - 1, 12)
+
+    def _pending_months(self, stored: Optional[Set[Tuple[int, int]]]) -> List[Tuple[int, List[int]]]:
+        """
+        (year, months) still to fetch given the (year, month) pairs already stored:
+        every month after the latest stored one, every month missing before it,
+        plus the last REVISION_MONTHS stored months again
+        """
+        stored = stored or set()
+        since = None
+        if stored:
+            high_water = max(stored)
+            year, month_index = divmod(high_water[0] * 12 + high_water[1] - 1 - self.REVISION_MONTHS, 12)
+            since = (year, month_index + 1)
+        pending = []
+        for year in range(self.START_YEAR, self.end_year + 1):
+            last_month = self.end_month if year == self.end_year else 12
+            months = [
+                m for m in range(1, last_month + 1)
+                if since is None or (year, m) > since or (year, m) not in stored
+            ]
+            if months:
+                pending.append((year, months))
+        return pending
+
+    async def _call_tool(self, name: str, arguments: Dict) -> Dict:
+        """
+        Call an MCP tool with bounded concurrency and retries.
+
+        Retries on exceptions and on error payloads, backing off exponentially.
+        Returns the tool's structured result, or {} once retries are exhausted.
+        """
+        for attempt in range(1, self.max_retries + 1):
+            try:
+                async with self._semaphore:
+                    result = await self.api_client.call_tool(name, arguments)
+                data = result.data if hasattr(result, 'data') else result
+                if isinstance(data, dict) and "error" in data:
+                    raise RuntimeError(data["error"])
+                return data or {}
+            except Exception as e:
+                if attempt == self.max_retries:
+                    logger.warning(f"{name} failed after {attempt} attempts: {e}")
+                    return {}
+                delay = self.retry_backoff * (2 ** (attempt - 1))
+                logger.debug(f"{name} attempt {attempt} failed ({e}); retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+        return {}
+
     async def _get_metadata(self) -> Dict:
-        """Get CPI metadata"""
-        try:
-            result = await self.api_client.call_tool("get_cpi_metadata", {
-                "base_year": "2012",
-                "level": "Group"
-            })
-            return result.data if hasattr(result, 'data') else result.get('data', {})
-        except Exception as e:
-            logger.error(f"Metadata fetch failed: {e}")
-            return {}
+        """Get CPI Group-level metadata (filter values)"""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        result = await self._call_tool("3_get_metadata", {
+            "dataset": "CPI",
+            "base_year": "2012",
+            "level": "Group"
+        })
+        return result.get('data', {}) if isinstance(result, dict) else {}
 
     async def _fetch_group_data(
         self,
         sector: Dict,
         group: Dict,
         subgroups: List[Dict],
-        start_year: int = 2020,
-        end_year: int = 2025
-    ) -> List[CPIRecord]:
-        """Fetch data for a specific sector-group combination"""
-        records = []
+        year: int,
+        months: List[int]
+    ) -> CPIRecordColumns:
+        """Fetch the given months of one year for a specific sector-group combination"""
+        filters = {
+            "base_year": self.BASE_YEAR,
+            "series": self.SERIES,
+            "state_code": self.STATE_CODE,  # All India
+            "sector_code": str(sector.get("sector_code")),
+            "group_code": str(group.get("group_code")),
+            "year": str(year),
+            "month_code": ",".join(str(m) for m in months),
+            "limit": "500",
+            "Format": "JSON"
+        }
 
-        try:
-            for year in range(start_year, end_year + 1):
-                for month in range(1, 13):
-                    # Skip months beyond Jan 2025
-                    if year == 2025 and month > 1:
-                        break
-
-                    try:
-                        result = await self.api_client.call_tool("get_cpi_group_index", {
-                            "base_year": "2012",
-                            "state_code": "99",  # All India
-                            "sector_code": sector.get("sector_code"),
-                            "group_code": group.get("group_code"),
-                            "year": str(year),
-                            "month_code": str(month),
-                            "series": "Current"
-                        })
-
-                        data = result.data if hasattr(result, 'data') else result.get('data', [])
-
-                        # Process each record
-                        for record in data:
-                            cpi_record = self._parse_record(record, sector, group, subgroups)
-                            if cpi_record:
-                                records.append(cpi_record)
-
-                    except Exception as e:
-                        logger.warning(f"Failed to fetch {year}-{month:02d}: {e}")
-                        continue
+        records = CPIRecordColumnsBuilder()
+        arguments = {"dataset": "CPI", "filters": filters, "max_pages": 5}
+        while True:
+            result = await self._call_tool("4_get_data", arguments)
+            for record in result.get('data', []) or []:
+                self._parse_record(record, sector, group, subgroups, records)
 
-        except Exception as e:
-            logger.error(f"Failed to fetch group data: {e}")
+            # Follow continuation cursors until the year is complete
+            next_cursor = result.get('_next_cursor')
+            if not next_cursor:
+                break
+            arguments = {"dataset": "CPI", "cursor": next_cursor, "max_pages": 5}
 
-        return records
+        if not len(records):
+            logger.warning(f"No data for {sector.get('sector_name')} - {group.get('group_name')} {year}")
+        return records.build()
 
     def _extract_filter_codes(self, metadata: Dict, filter_name: str) -> List[Dict]:
         """Extract filter codes from metadata"""
@@ -201,45 +588,53 @@ class CPIDataCollector:
         record: Dict,
         sector: Dict,
         group: Dict,
-        subgroups: List[Dict]
-    ) -> Optional[CPIRecord]:
-        """Parse API response into CPIRecord"""
+        subgroups: List[Dict],
+        records: CPIRecordColumnsBuilder
+    ) -> bool:
+        """Parse one API response row and append it to records; False if it was skipped"""
         try:
             year = int(record.get('year', 0))
-            month = int(record.get('month_code', 0))
-            index_value = float(record.get('index_value', 0))
-
-            if year == 0 or month == 0 or index_value == 0:
-                return None
+            month = self._parse_month(record.get('month_code', record.get('month', 0)))
+            index_value = float(record.get('index_value', record.get('index', 0)) or 0)
 
-            month_names = ['', 'January', 'February', 'March', 'April', 'May', 'June',
-                          'July', 'August', 'September', 'October', 'November', 'December']
+            if year == 0 or not 1 <= month <= 12 or index_value == 0:
+                return False
 
-            date = datetime(year, month, 1)
-
-            return CPIRecord(
+            records.append(
                 year=year,
                 month=month,
-                month_name=month_names[month],
-                date=date,
                 sector=sector.get('sector_name', 'Unknown'),
                 group=group.get('group_name', 'Unknown'),
                 group_code=group.get('group_code', ''),
                 subgroup=record.get('subgroup_name'),
                 subgroup_code=record.get('subgroup_code'),
                 index_value=index_value,
-                series=record.get('series', 'Current')
+                series=record.get('series', self.SERIES),
+                base_year=self.BASE_YEAR,
+                state=self.STATE_NAME
             )
+            return True
 
         except Exception as e:
             logger.debug(f"Failed to parse record: {e}")
-            return None
+            return False
 
-    def _generate_demo_data(self) -> List[CPIRecord]:
+    @staticmethod
+    def _parse_month(value) -> int:
+        """Month as 1-12 from a month code or a month name ("January")"""
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            try:
+                return datetime.strptime(str(value).strip()[:3], '%b').month
+            except ValueError:
+                return 0
+
+    def _generate_demo_data(self) -> CPIRecordColumns:
         """Generate realistic demo CPI data for testing"""
         logger.info("Generating realistic demo CPI data...")
 
-        records = []
+        records = CPIRecordColumnsBuilder()
         sectors = [
             {'name': 'Rural', 'code': '1'},
             {'name': 'Urban', 'code': '2'},
@@ -289,20 +684,19 @@ class CPIDataCollector:
                     # Ensure non-negative
                     index_value = max(95, min(110, index_value))
 
-                    record = CPIRecord(
+                    records.append(
                         year=current_date.year,
                         month=current_date.month,
-                        month_name=current_date.strftime('%B'),
-                        date=current_date,
                         sector=sector['name'],
                         group=group['name'],
                         group_code=group['code'],
                         subgroup=None,
                         subgroup_code=None,
                         index_value=round(index_value, 2),
-                        series='Current'
+                        series='Current',
+                        base_year=self.BASE_YEAR,
+                        state=self.STATE_NAME
                     )
-                    records.append(record)
 
             # Move to next month
             if current_date.month == 12:
@@ -311,7 +705,7 @@ class CPIDataCollector:
                 current_date = datetime(current_date.year, current_date.month + 1, 1)
 
         logger.info(f"Generated {len(records)} demo records")
-        return records
+        return records.build()
 
     async def cleanup(self):
         """Cleanup API client"""
@@ -329,7 +723,9 @@ class CPIDataCollector:
 class CPIDataProcessor:
     """Processes and organizes raw CPI data into structured time series"""
 
-    def __init__(self, records: List[CPIRecord]):
+    def __init__(self, records: CPIRecordColumns):
+        if not isinstance(records, CPIRecordColumns):
+            records = CPIRecordColumns.from_records(records)
         self.records = records
         self.df = None
         self.time_series_by_group = {}
@@ -340,25 +736,8 @@ class CPIDataProcessor:
         """Convert records to DataFrame and organize by groups"""
         logger.info("Processing CPI data...")
 
-        # Create DataFrame
-        data_list = [
-            {
-                'date': r.date,
-                'year': r.year,
-                'month': r.month,
-                'month_name': r.month_name,
-                'sector': r.sector,
-                'group': r.group,
-                'group_code': r.group_code,
-                'subgroup': r.subgroup,
-                'subgroup_code': r.subgroup_code,
-                'index_value': r.index_value,
-                'series': r.series
-            }
-            for r in self.records
-        ]
-
-        self.df = pd.DataFrame(data_list)
+        # Create DataFrame straight from the record columns
+        self.df = self.records.to_frame()
 
         # Sort chronologically
         self.df = self.df.sort_values('date').reset_index(drop=True)
@@ -466,6 +845,10 @@ class CPIDataProcessor:
 # INFLATION METRICS CALCULATION
 # ============================================================================
 
+# Columns identifying one CPI time series in the long frame
+SERIES_KEYS = ['sector', 'group', 'subgroup', 'state']
+
+
 class InflationMetricsCalculator:
     """Calculates YoY, MoM, and moving averages"""
 
@@ -537,23 +920,114 @@ class InflationMetricsCalculator:
     ) -> pd.DataFrame:
         """
         Process a time series to add inflation metrics
+        (frames holding several sectors/subgroups are split into their series)
+        """
+        return cls.calculate_series_metrics(ts_df)
+
+    @staticmethod
+    def _lagged(values: np.ndarray, series_id: np.ndarray, period: np.ndarray, lag: int) -> np.ndarray:
+        """
+        Value `lag` months earlier in the same series (NaN if that month is missing).
+
+        Rows must be sorted by (series_id, period); the lookup is one searchsorted
+        over the combined key, so gaps such as missing lockdown months are respected.
+        """
+        key = series_id.astype(np.int64) * 1_000_000 + period
+        pos = np.searchsorted(key, key - lag)
+        found = pos < len(key)
+        found[found] = key[pos[found]] == (key - lag)[found]
+        lagged = np.full(len(values), np.nan)
+        lagged[found] = values[pos[found]]
+        return lagged
+
+    @staticmethod
+    def _grouped_moving_average(values: np.ndarray, series_id: np.ndarray, window: int) -> np.ndarray:
+        """
+        Trailing mean over the last `window` non-missing values of each series.
+
+        Same as series.dropna().rolling(window).mean() per series, computed for
+        all series at once from a cumulative sum.
+        """
+        result = np.full(len(values), np.nan)
+        valid = np.flatnonzero(~np.isnan(values))
+        if len(valid) < window:
+            return result
+
+        v = values[valid]
+        ids = series_id[valid]
+        csum = np.concatenate([[0.0], np.cumsum(v)])
+        end = np.arange(window - 1, len(v))
+        same_series = ids[end] == ids[end - window + 1]
+        means = (csum[end + 1] - csum[end + 1 - window]) / window
+        result[valid[end[same_series]]] = means[same_series]
+        return result
+
+    @staticmethod
+    def _grouped_rolling_std(values: np.ndarray, series_id: np.ndarray, window: int) -> np.ndarray:
+        """Trailing sample std over `window` rows of each series (NaN until the window fills)"""
+        result = np.full(len(values), np.nan)
+        if len(values) < window:
+            return result
+
+        windows = np.lib.stride_tricks.sliding_window_view(values, window)
+        same_series = series_id[window - 1:] == series_id[:len(series_id) - window + 1]
+        result[window - 1:] = np.where(same_series, windows.std(axis=1, ddof=1), np.nan)
+        return result
+
+    @classmethod
+    def calculate_series_metrics(
+        cls,
+        df: pd.DataFrame,
+        keys: Optional[List[str]] = None,
+        windows: Tuple[int, ...] = (3, 6, 12)
+    ) -> pd.DataFrame:
+        """
+        Inflation metrics for every series in one pass.
+
+        A series is one (sector, group, subgroup, state) combination (whichever
+        of those columns exist). The frame is sorted once by series and date;
+        YoY/MoM, the moving averages of YoY and the 3-month rolling std of the
+        index are then computed for all series together with array operations.
+
+        Returns one long frame: the input columns plus yoy_inflation, mom_change,
+        ma{w}_inflation for each window, and rolling_3m_std.
         """
-        result_df = ts_df.copy().sort_values('date').reset_index(drop=True)
+        if keys is None:
+            keys = [k for k in SERIES_KEYS if k in df.columns]
+
+        result = df.sort_values(keys + ['date'], kind='stable').reset_index(drop=True)
+        if keys:
+            series_id = result.groupby(keys, sort=False, observed=True, dropna=False).ngroup().to_numpy()
+        else:
+            series_id = np.zeros(len(result), dtype=np.int64)
+
+        dates = result['date'].to_numpy().astype('datetime64[M]')
+        period = dates.astype(np.int64)
+        values = result['index_value'].to_numpy(dtype=np.float64)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            year_ago = cls._lagged(values, series_id, period, 12)
+            month_ago = cls._lagged(values, series_id, period, 1)
+            result['yoy_inflation'] = (values / year_ago - 1) * 100
+            result['mom_change'] = (values / month_ago - 1) * 100
+
+        yoy = result['yoy_inflation'].to_numpy()
+        for window in windows:
+            result[f'ma{window}_inflation'] = cls._grouped_moving_average(yoy, series_id, window)
 
-        # YoY Inflation
-        result_df['yoy_inflation'] = result_df['index_value'].pct_change(periods=12) * 100
+        result['rolling_3m_std'] = cls._grouped_rolling_std(values, series_id, 3)
 
-        # MoM Change
-        result_df['mom_change'] = result_df['index_value'].pct_change(periods=1) * 100
+        return result
 
-        # Moving Averages for inflation rate
-        inflation_series = result_df['yoy_inflation'].dropna()
-        moving_avgs = cls.calculate_moving_averages(inflation_series)
 
-        for window, ma_series in moving_avgs.items():
-            result_df[f'{window}_inflation'] = ma_series
+# ============================================================================
+# CHANGEPOINT DETECTION
+# ============================================================================
 
-        return result_df
+def _detect_breaks_chunk(task: Tuple) -> List[Tuple[int, List[int]]]:
+    """Worker entry point: changepoints for a chunk of (series id, values)"""
+    series, penalty, min_size = task
+    return [(series_id, pelt_changepoints(values.tolist(), penalty, min_size)) for series_id, values in series]
 
 
 # ============================================================================
@@ -568,6 +1042,7 @@ class StatisticalAnalyzer:
         self.summary_stats = {}
         self.volatility_analysis = {}
         self.seasonal_analysis = {}
+        self.structural_breaks = pd.DataFrame()
 
     def analyze_by_period(self) -> Dict[str, Dict]:
         """Calculate statistics by time period"""
@@ -615,47 +1090,108 @@ class StatisticalAnalyzer:
 
         volatility = {}
 
-        # Rolling 3-month standard deviation
-        rolling_std = self.df.groupby('sector')['index_value'].apply(
-            lambda x: x.rolling(window=3).std()
-        )
+        # Rolling 3-month standard deviation of every series, from the metrics engine
+        metrics = InflationMetricsCalculator.calculate_series_metrics(self.df)
+        sector_stats = self.df.groupby('sector', observed=True)['index_value'].agg(['std', 'mean'])
+        metric_sectors = metrics['sector'].to_numpy()
+        rolling_std = metrics['rolling_3m_std'].to_numpy()
 
         for sector in self.df['sector'].unique():
-            sector_data = self.df[self.df['sector'] == sector]
-            index_values = sector_data['index_value']
-
-            cv = index_values.std() / index_values.mean() if index_values.mean() != 0 else 0
+            std_dev, mean = sector_stats.loc[sector, 'std'], sector_stats.loc[sector, 'mean']
+            cv = std_dev / mean if mean != 0 else 0
 
             volatility[sector] = {
-                'std_dev': index_values.std(),
+                'std_dev': std_dev,
                 'coefficient_of_variation': cv,
-                'rolling_3m_std': rolling_std[rolling_std.index.get_level_values(0) == sector].values
+                'rolling_3m_std': rolling_std[metric_sectors == sector]
             }
 
         self.volatility_analysis = volatility
         return volatility
 
-    def detect_structural_breaks(self) -> List[Tuple[datetime, str]]:
-        """Identify key inflection points"""
-        logger.info("Detecting structural breaks...")
+    def detect_structural_breaks(
+        self,
+        penalty: Optional[float] = None,
+        min_size: int = BREAK_MIN_SEGMENT,
+        max_workers: Optional[int] = None
+    ) -> List[Tuple[datetime, str]]:
+        """
+        Detect regime shifts in YoY inflation of every series.
 
-        breaks = []
+        Each (sector, group, subgroup, state) series is segmented with PELT
+        (see pelt_changepoints); series are spread over a process pool. All
+        breaks are kept in self.structural_breaks (one row per break with the
+        mean and std of YoY inflation before and after it).
+
+        Returns:
+            (date, description) of the breaks in the headline series (Combined
+            General Index), or of all series when that is not in the data
+        """
+        logger.info("Detecting structural breaks...")
 
-        # Key periods
-        key_dates = [
-            (datetime(2020, 4, 1), 'Lockdown Start'),
-            (datetime(2020, 10, 1), 'Post-Lockdown Recovery'),
-            (datetime(2021, 1, 1), 'Inflation Surge Begins'),
-            (datetime(2022, 4, 1), 'Peak Inflation Period'),
-            (datetime(2023, 1, 1), 'Moderation Begins'),
-            (datetime(2024, 10, 1), 'Recent Decline'),
+        metrics = InflationMetricsCalculator.calculate_series_metrics(self.df)
+        metrics = metrics[metrics['yoy_inflation'].notna()]
+        keys = [k for k in SERIES_KEYS if k in metrics.columns]
+
+        # Metrics are sorted by series and date; split the arrays at series boundaries
+        if keys:
+            series_id = metrics.groupby(keys, sort=False, observed=True, dropna=False).ngroup().to_numpy()
+        else:
+            series_id = np.zeros(len(metrics), dtype=np.int64)
+        bounds = np.flatnonzero(np.diff(series_id)) + 1
+        firsts = metrics.iloc[np.r_[0, bounds]][keys] if len(metrics) else metrics[keys]
+        names = list(firsts.itertuples(index=False, name=None))
+        series = list(enumerate(zip(
+            np.split(metrics['date'].to_numpy(), bounds),
+            np.split(metrics['yoy_inflation'].to_numpy(), bounds)
+        ))) if len(metrics) else []
+
+        workers = max_workers if max_workers is not None else os.cpu_count() or 1
+        tasks = [
+            ([(i, values) for i, (_, values) in series[start::max(workers * 4, 1)]], penalty, min_size)
+            for start in range(min(max(workers * 4, 1), len(series)))
         ]
+        if workers <= 1 or len(series) < 2:
+            chunks = map(_detect_breaks_chunk, tasks)
+            results = [r for chunk in chunks for r in chunk]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = [r for chunk in executor.map(_detect_breaks_chunk, tasks) for r in chunk]
 
-        for date, description in key_dates:
-            # Check if date exists in data
-            if any(self.df['date'] >= date):
-                breaks.append((date, description))
-                logger.info(f"  {date.strftime('%Y-%m')}: {description}")
+        rows = []
+        for series_id, changepoints in results:
+            dates, values = series[series_id][1]
+            bounds = [0] + changepoints + [len(values)]
+            name = names[series_id]
+            for before, point, after in zip(bounds, bounds[1:], bounds[2:]):
+                rows.append({
+                    **dict(zip(keys, name)),
+                    'date': pd.Timestamp(dates[point]),
+                    'mean_before': values[before:point].mean(),
+                    'mean_after': values[point:after].mean(),
+                    'std_before': values[before:point].std(),
+                    'std_after': values[point:after].std(),
+                })
+
+        self.structural_breaks = pd.DataFrame(
+            rows, columns=keys + ['date', 'mean_before', 'mean_after', 'std_before', 'std_after']
+        ).sort_values(keys + ['date'], kind='stable', ignore_index=True)
+        logger.info(f"  {len(self.structural_breaks)} breaks across {len(series)} series")
+
+        headline = self.structural_breaks
+        if {'sector', 'group'} <= set(headline.columns):
+            general = headline[(headline['sector'] == 'Combined') & (headline['group'] == 'General Index')]
+            if not general.empty:
+                headline = general
+
+        breaks = []
+        for row in headline.sort_values('date', kind='stable').itertuples(index=False):
+            label = ' '.join(str(getattr(row, k)) for k in ('state', 'sector', 'group', 'subgroup')
+                             if k in keys and pd.notna(getattr(row, k)))
+            description = (f"{label}: YoY inflation {row.mean_before:.1f}% -> {row.mean_after:.1f}% "
+                           f"(std {row.std_before:.1f} -> {row.std_after:.1f})")
+            breaks.append((row.date.to_pydatetime(), description))
+            logger.info(f"  {row.date.strftime('%Y-%m')}: {description}")
 
         return breaks
 
@@ -809,18 +1345,13 @@ class ReportGenerator:
         recent_data = self.df[
             (self.df['group_code'] == '0') &
             (self.df['sector'] == 'Combined')
-        ].sort_values('date').tail(12)
-
-        rows = []
+        ].sort_values('date', kind='stable').tail(12)
 
-        for _, row in recent_data.iterrows():
-            rows.append({
-                'Date': row['date'].strftime('%b %Y'),
-                'Index': f"{row['index_value']:.2f}",
-                'YoY Inflation': 'N/A'  # Would be calculated
-            })
-
-        return pd.DataFrame(rows)
+        return pd.DataFrame({
+            'Date': recent_data['date'].dt.strftime('%b %Y').to_numpy(),
+            'Index': np.char.mod('%.2f', recent_data['index_value'].to_numpy()),
+            'YoY Inflation': 'N/A'  # Would be calculated
+        })
 
     def generate_full_report(self) -> str:
         """Generate comprehensive text report"""
@@ -914,6 +1445,23 @@ class VisualizationDataPreparer:
         self.df = df
         self.processed_series = processed_series
 
+    @staticmethod
+    def _series_points(frame: pd.DataFrame) -> List[Dict]:
+        """[{'date': ISO timestamp, 'value': index}] for an already sorted frame"""
+        dates = np.datetime_as_string(frame['date'].to_numpy().astype('datetime64[s]'))
+        return [
+            {'date': date, 'value': value}
+            for date, value in zip(dates.tolist(), frame['index_value'].tolist())
+        ]
+
+    def _points_by(self, frame: pd.DataFrame, key: str) -> Dict[str, List[Dict]]:
+        """Sort once by date, then split into per-`key` point lists in one grouped pass"""
+        ordered = frame.sort_values('date', kind='stable')
+        return {
+            name: self._series_points(part)
+            for name, part in ordered.groupby(key, sort=False, observed=True)
+        }
+
     def prepare_historical_trend_data(self) -> Dict:
         """Data for Chart 1: Historical CPI Trend (2020-2025)"""
         data = {
@@ -927,68 +1475,45 @@ class VisualizationDataPreparer:
         general = self.df[
             (self.df['group_code'] == '0') &
             (self.df['sector'] == 'Combined')
-        ].sort_values('date')
+        ].sort_values('date', kind='stable')
 
-        data['general'] = [
-            {'date': row['date'].isoformat(), 'value': row['index_value']}
-            for _, row in general.iterrows()
-        ]
+        data['general'] = self._series_points(general)
 
         return data
 
     def prepare_component_breakdown(self) -> Dict:
         """Data for Chart 2: Component Breakdown by Group"""
-        data = {}
-
-        for group in self.df['group'].unique():
-            if group == 'General Index':
-                continue
+        components = self.df[self.df['group'] != 'General Index']
+        by_group = self._points_by(components, 'group')
 
-            group_data = self.df[self.df['group'] == group].sort_values('date')
-            data[group] = [
-                {'date': row['date'].isoformat(), 'value': row['index_value']}
-                for _, row in group_data.iterrows()
-            ]
-
-        return data
+        # Keep groups in the order they appear in the data
+        return {
+            group: by_group[group]
+            for group in self.df['group'].unique()
+            if group in by_group
+        }
 
     def prepare_rural_urban_divergence(self) -> Dict:
         """Data for Chart 3: Rural vs Urban Divergence"""
-        rural = self.df[
-            (self.df['sector'] == 'Rural') &
-            (self.df['group_code'] == '0')
-        ].sort_values('date')
-
-        urban = self.df[
-            (self.df['sector'] == 'Urban') &
-            (self.df['group_code'] == '0')
-        ].sort_values('date')
+        general = self.df[
+            (self.df['group_code'] == '0') &
+            self.df['sector'].isin(['Rural', 'Urban'])
+        ]
+        by_sector = self._points_by(general, 'sector')
 
         return {
-            'rural': [
-                {'date': row['date'].isoformat(), 'value': row['index_value']}
-                for _, row in rural.iterrows()
-            ],
-            'urban': [
-                {'date': row['date'].isoformat(), 'value': row['index_value']}
-                for _, row in urban.iterrows()
-            ]
+            'rural': by_sector.get('Rural', []),
+            'urban': by_sector.get('Urban', [])
         }
 
     def prepare_food_vs_nonfood(self) -> Dict:
         """Data for Chart 4: Food vs Non-Food"""
-        food = self.df[self.df['group_code'] == '1'].sort_values('date')
-        nonfood = self.df[self.df['group_code'] != '1'].sort_values('date')
+        kind = np.where(self.df['group_code'] == '1', 'food', 'non_food')
+        by_kind = self._points_by(self.df.assign(_kind=kind), '_kind')
 
         return {
-            'food': [
-                {'date': row['date'].isoformat(), 'value': row['index_value']}
-                for _, row in food.iterrows()
-            ],
-            'non_food': [
-                {'date': row['date'].isoformat(), 'value': row['index_value']}
-                for _, row in nonfood.iterrows()
-            ]
+            'food': by_kind.get('food', []),
+            'non_food': by_kind.get('non_food', [])
         }
 
     def prepare_subgroup_heatmap(self) -> Dict:
@@ -1052,7 +1577,7 @@ async def run_phase3_analysis():
     try:
         # Step 1: Collect data
         logger.info("\nSTEP 1: COLLECTING CPI DATA")
-        collector = CPIDataCollector()
+        collector = CPIDataCollector(store=CPIRecordStore())
         await collector.initialize_client()
         records = await collector.fetch_cpi_data()
 
@@ -1063,15 +1588,11 @@ async def run_phase3_analysis():
 
         # Step 3: Calculate inflation metrics
         logger.info("\nSTEP 3: CALCULATING INFLATION METRICS")
-        processed_series = {}
-
-        for group in df['group'].unique():
-            group_data = df[df['group'] == group].sort_values('date')
-            processed = InflationMetricsCalculator.process_time_series(
-                group_data,
-                group
-            )
-            processed_series[group] = processed
+        metrics = InflationMetricsCalculator.calculate_series_metrics(df)
+        processed_series = {
+            group: group_metrics.reset_index(drop=True)
+            for group, group_metrics in metrics.groupby('group', sort=False, observed=True)
+        }
 
         # Step 4: Statistical analysis
         logger.info("\nSTEP 4: STATISTICAL ANALYSIS")
@@ -1138,9 +1659,11 @@ async def run_phase3_analysis():
 
         # Cleanup
         await collector.cleanup()
+        collector.store.close()
 
         return {
             'df': df,
+            'metrics': metrics,
             'processed_series': processed_series,
             'period_stats': period_stats,
             'volatility': volatility,
@@ -1148,6 +1671,7 @@ async def run_phase3_analysis():
             'rural_urban': rural_urban,
             'seasonality': seasonality,
             'structural_breaks': breaks,
+            'structural_break_table': analyzer.structural_breaks,
             'visualization_data': viz_data
         }
 
@@ -10,25 +10,29 @@ Implements multiple forecasting approaches:
 - Linear Trend Extrapolation - Baseline
 - Moving Average Projection - Simple baseline
 
-Training Period: Jan 2020 - Dec 2024 (60 months)
-Validation Period: Jan 2025 (1 month actual data)
-Forecast Period: Feb 2025 - Jan 2026 (12 months)
+Training Period: Jan 2020 to the latest month in the Phase 3 data
+Validation: Rolling-origin backtest over the training period
+Forecast Period: The 12 months after the training period
 
 Output: 3 scenarios (Base, Optimistic, Pessimistic) with confidence intervals
 """
 
 import asyncio
+import hashlib
 import json
 import logging
+import os
+import sqlite3
 import warnings
-from datetime import datetime, timedelta
+from concurrent.futures import Executor, ProcessPoolExecutor
+from datetime import datetime
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass, asdict
 from collections import defaultdict
 
 import pandas as pd
 import numpy as np
-from scipy import stats
+from scipy import linalg, signal, stats
 from scipy.optimize import minimize
 
 # Configure logging
@@ -175,6 +179,630 @@ class TimeSeriesPreprocessor:
             }
 
 
+# ============================================================================
+# STATE-SPACE SARIMA ESTIMATION
+# ============================================================================
+
+@dataclass
+class SARIMAEstimate:
+    """Maximum-likelihood fit of one SARIMA order"""
+    order: Tuple[int, ...]  # (p, d, q, P, D, Q)
+    seasonal_period: int
+    params: np.ndarray      # Unconstrained parameters (AR, MA, seasonal AR, seasonal MA)
+    ar: np.ndarray          # Expanded AR coefficients (phi(L) * Phi(L^s))
+    ma: np.ndarray          # Expanded MA coefficients (theta(L) * Theta(L^s))
+    mean: float             # Mean of the differenced series
+    sigma2: float           # Innovation variance
+    loglike: float
+    aic: float
+    bic: float
+    nobs: int               # Observations after differencing
+    residuals: np.ndarray   # One-step innovations of the differenced series
+    state: np.ndarray       # Predicted state after the last observation
+
+
+# Forward-difference step for the likelihood gradient (unconstrained parameter space)
+GRADIENT_STEP = 1e-6
+
+# Kalman steps between checks for a steady-state covariance
+STEADY_STATE_CHECK_EVERY = 8
+
+
+def _constrain_stationary(unconstrained: np.ndarray) -> np.ndarray:
+    """
+    Map unconstrained reals to coefficients of a stationary AR polynomial
+    (Monahan 1984, via partial autocorrelations in (-1, 1)).
+
+    Appending a zero leaves the existing coefficients unchanged and adds a
+    zero coefficient, so lower-order fits warm-start higher orders exactly.
+    """
+    n = len(unconstrained)
+    if n == 0:
+        return unconstrained
+    pacf = unconstrained / np.sqrt(1 + unconstrained ** 2)
+    y = np.zeros((n, n))
+    for k in range(n):
+        for i in range(k):
+            y[k, i] = y[k - 1, i] + pacf[k] * y[k - 1, k - i - 1]
+        y[k, k] = pacf[k]
+    return -y[n - 1, :]
+
+
+def _split_params(params: np.ndarray, order: Tuple[int, ...]) -> Tuple[np.ndarray, ...]:
+    """Unconstrained params -> (ar, ma, seasonal ar, seasonal ma) blocks"""
+    p, _, q, P, _, Q = order
+    bounds = np.cumsum([0, p, q, P, Q])
+    return tuple(params[bounds[i]:bounds[i + 1]] for i in range(4))
+
+
+def _expand_polynomials(params: np.ndarray, order: Tuple[int, ...], s: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Expanded AR and MA coefficients of a SARIMA model.
+
+    Returns (ar, ma) such that
+    x_t = sum(ar[i] x_{t-1-i}) + e_t + sum(ma[j] e_{t-1-j}).
+    """
+    raw_ar, raw_ma, raw_sar, raw_sma = _split_params(params, order)
+    # Lag polynomials in ascending powers of L
+    ar_poly = np.r_[1.0, -_constrain_stationary(raw_ar)]
+    ma_poly = np.r_[1.0, _constrain_stationary(raw_ma)]
+    sar_poly = np.zeros(s * len(raw_sar) + 1)
+    sar_poly[0] = 1.0
+    sar_poly[s::s] = -_constrain_stationary(raw_sar)
+    sma_poly = np.zeros(s * len(raw_sma) + 1)
+    sma_poly[0] = 1.0
+    sma_poly[s::s] = _constrain_stationary(raw_sma)
+    return -np.convolve(ar_poly, sar_poly)[1:], np.convolve(ma_poly, sma_poly)[1:]
+
+
+def _difference(values: np.ndarray, d: int, D: int, s: int) -> np.ndarray:
+    """Apply d regular and D seasonal differences"""
+    series = np.asarray(values, dtype=float)
+    for _ in range(d):
+        if len(series) < 2:
+            raise ValueError("Not enough data for differencing")
+        series = np.diff(series)
+    for _ in range(D):
+        if len(series) < s + 1:
+            raise ValueError("Not enough data for seasonal differencing")
+        series = series[s:] - series[:-s]
+    return series
+
+
+def _kalman_filter(x: np.ndarray, ar: np.ndarray, ma: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Kalman filter for zero-mean ARMA processes with unit innovation variance.
+
+    `ar` and `ma` may be 2-D (one row per model); all models are filtered
+    together, so each time step is one set of stacked matrix operations.
+    Uses the Harvey state-space form initialised at the stationary covariance.
+    Once the covariances reach their steady state (an invertible MA converges
+    to P = RR'), the remaining innovations follow the ARMA recursion exactly
+    and are computed with lfilter instead of the per-step update.
+
+    Returns (innovations v_t, variances F_t, predicted state after the last
+    observation), each with a leading model axis when the input was 2-D.
+    """
+    single = np.ndim(ar) == 1
+    ar, ma = np.atleast_2d(ar), np.atleast_2d(ma)
+    m, n = len(ar), len(x)
+    r = max(ar.shape[1], ma.shape[1] + 1, 1)
+
+    T = np.zeros((m, r, r))
+    T[:, :ar.shape[1], 0] = ar
+    T[:, :-1, 1:] = np.eye(r - 1)
+    TT = T.transpose(0, 2, 1)
+    R = np.zeros((m, r))
+    R[:, 0] = 1.0
+    R[:, 1:ma.shape[1] + 1] = ma
+    RR = R[:, :, None] * R[:, None, :]
+
+    P = np.empty((m, r, r))
+    for i in range(m):
+        try:
+            P[i] = linalg.solve_discrete_lyapunov(T[i], RR[i])
+        except (linalg.LinAlgError, ValueError):
+            P[i] = np.eye(r) * 1e6
+    a = np.zeros((m, r))
+
+    v = np.empty((m, n))
+    F = np.ones((m, n))
+    for t in range(n):
+        if t % STEADY_STATE_CHECK_EVERY == 0 and np.max(np.abs(P - RR)) < 1e-9:
+            # Steady state: v_t = phi(L)/theta(L) x_t, with lfilter's state = -a
+            width = max(ar.shape[1], ma.shape[1])
+            for i in range(m):
+                if width:
+                    b = np.r_[1.0, -ar[i], np.zeros(width - ar.shape[1])]
+                    c = np.r_[1.0, ma[i], np.zeros(width - ma.shape[1])]
+                    v[i, t:], zf = signal.lfilter(b, c, x[t:], zi=-a[i, :width])
+                    a[i] = 0.0
+                    a[i, :width] = -zf
+                else:
+                    v[i, t:] = x[t:]
+            break
+        F[:, t] = P[:, 0, 0]
+        v[:, t] = x[t] - a[:, 0]
+        K = (T @ P[:, :, 0:1])[:, :, 0] / F[:, t, None]
+        a = (T @ a[:, :, None])[:, :, 0] + K * v[:, t, None]
+        P = T @ P @ TT + RR - F[:, t, None, None] * K[:, :, None] * K[:, None, :]
+
+    if single:
+        return v[0], F[0], a[0]
+    return v, F, a
+
+
+def _concentrated_loglike(x: np.ndarray, ar: np.ndarray, ma: np.ndarray) -> Tuple:
+    """
+    Gaussian log-likelihood with the innovation variance concentrated out.
+
+    Returns (loglike, sigma2, innovations, final state); batched like _kalman_filter.
+    """
+    v, F, state = _kalman_filter(x, ar, ma)
+    n = len(x)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        sigma2 = np.sum(v ** 2 / F, axis=-1) / n
+        loglike = -0.5 * n * (np.log(2 * np.pi * sigma2) + 1) - 0.5 * np.sum(np.log(F), axis=-1)
+    return loglike, sigma2, v, state
+
+
+def fit_sarima(
+    values: np.ndarray,
+    order: Tuple[int, ...],
+    seasonal_period: int = 12,
+    start_params: Optional[np.ndarray] = None
+) -> SARIMAEstimate:
+    """
+    Exact maximum-likelihood SARIMA fit.
+
+    The series is differenced and demeaned, then AR/MA coefficients are found
+    with scipy.optimize.minimize on the Kalman-filter likelihood, starting
+    from `start_params` or, without them, from a conditional-sum-of-squares
+    estimate (one lfilter call per evaluation). Parameters
+    are optimised in an unconstrained space that maps onto stationary AR and
+    invertible MA polynomials.
+
+    Args:
+        values: Series values
+        order: (p, d, q, P, D, Q)
+        seasonal_period: Seasonality period (12 for monthly)
+        start_params: Unconstrained starting values (e.g. from a neighbouring order)
+    """
+    p, d, q, P, D, Q = order
+    w = _difference(values, d, D, seasonal_period)
+    k = p + q + P + Q
+    if len(w) < k + 3:
+        raise ValueError("Not enough data for this order")
+
+    mean = float(w.mean())
+    x = w - mean
+
+    def css_objective(params):
+        # Conditional sum of squares: residuals of phi(L)/theta(L) from zero pre-sample values
+        ar, ma = _expand_polynomials(params, order, seasonal_period)
+        residuals = signal.lfilter(np.r_[1.0, -ar], np.r_[1.0, ma], x)
+        return 0.5 * len(x) * np.log(np.mean(residuals ** 2))
+
+    def objective(params):
+        # Negative log-likelihood and its forward-difference gradient: the k + 1
+        # parameter vectors are filtered together in one batched pass
+        points = params + np.vstack([np.zeros(k), np.eye(k) * GRADIENT_STEP])
+        polys = [_expand_polynomials(point, order, seasonal_period) for point in points]
+        loglike = _concentrated_loglike(x, np.array([ar for ar, _ in polys]), np.array([ma for _, ma in polys]))[0]
+        if not np.all(np.isfinite(loglike)):
+            return 1e10, np.zeros(k)
+        return -loglike[0], -(loglike[1:] - loglike[0]) / GRADIENT_STEP
+
+    if start_params is not None:
+        params = np.asarray(start_params, dtype=float)
+    elif k:
+        # Cold start: cheap CSS estimate first
+        params = minimize(css_objective, np.zeros(k), method='L-BFGS-B').x
+    else:
+        params = np.zeros(0)
+    if k:
+        params = minimize(objective, params, jac=True, method='L-BFGS-B').x
+
+    ar, ma = _expand_polynomials(params, order, seasonal_period)
+    loglike, sigma2, residuals, state = _concentrated_loglike(x, ar, ma)
+
+    # Estimated: ARMA coefficients, mean and innovation variance
+    num_params = k + 2
+    n = len(x)
+    return SARIMAEstimate(
+        order=tuple(order),
+        seasonal_period=seasonal_period,
+        params=params,
+        ar=ar,
+        ma=ma,
+        mean=mean,
+        sigma2=sigma2,
+        loglike=loglike,
+        aic=-2 * loglike + 2 * num_params,
+        bic=-2 * loglike + num_params * np.log(n),
+        nobs=n,
+        residuals=residuals,
+        state=state
+    )
+
+
+def warm_start_params(
+    order: Tuple[int, ...],
+    fitted: Dict[Tuple[int, ...], np.ndarray]
+) -> Optional[np.ndarray]:
+    """
+    Starting values for `order` from the closest already-fitted order.
+
+    Candidates share (d, D) and have no more terms of any kind; their blocks
+    are zero-padded, which reproduces the smaller model exactly.
+    """
+    p, d, q, P, D, Q = order
+    best = None
+    for other, params in fitted.items():
+        op, od, oq, oP, oD, oQ = other
+        if (od, oD) != (d, D) or op > p or oq > q or oP > P or oQ > Q:
+            continue
+        if best is None or sum(other) > sum(best[0]):
+            best = (other, params)
+    if best is None:
+        return None
+
+    blocks = _split_params(best[1], best[0])
+    sizes = (p, q, P, Q)
+    return np.concatenate([np.r_[block, np.zeros(size - len(block))] for block, size in zip(blocks, sizes)])
+
+
+def sarima_update(values: np.ndarray, estimate: SARIMAEstimate) -> SARIMAEstimate:
+    """
+    Roll a fitted SARIMA forward to a longer (or changed) series without
+    re-estimating it: the ARMA coefficients and mean are kept, and only the
+    Kalman filter is re-run to get the new final state, residuals and
+    innovation variance.
+    """
+    return sarima_restore(values, estimate.order, estimate.params, estimate.mean, estimate.seasonal_period)
+
+
+def sarima_restore(
+    values: np.ndarray,
+    order: Tuple[int, ...],
+    params: np.ndarray,
+    mean: float,
+    seasonal_period: int = 12
+) -> SARIMAEstimate:
+    """
+    Rebuild an estimate from stored parameters (unconstrained params and the
+    differenced-series mean) with one Kalman filter pass over `values`.
+    """
+    params = np.asarray(params, dtype=float)
+    ar, ma = _expand_polynomials(params, order, seasonal_period)
+    w = _difference(values, order[1], order[4], seasonal_period)
+    loglike, sigma2, residuals, state = _concentrated_loglike(w - mean, ar, ma)
+
+    num_params = len(params) + 2
+    n = len(w)
+    return SARIMAEstimate(
+        order=tuple(order),
+        seasonal_period=seasonal_period,
+        params=params,
+        ar=ar,
+        ma=ma,
+        mean=float(mean),
+        sigma2=sigma2,
+        loglike=loglike,
+        aic=-2 * loglike + 2 * num_params,
+        bic=-2 * loglike + num_params * np.log(n),
+        nobs=n,
+        residuals=residuals,
+        state=state
+    )
+
+
+def sarima_forecast(
+    values: np.ndarray,
+    estimate: SARIMAEstimate,
+    periods: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Point forecasts and forecast standard errors for the original series.
+
+    ARMA forecasts of the differenced series come from iterating the final
+    Kalman state; they are integrated back through the differencing operator,
+    and standard errors use the psi-weights of the full integrated model.
+    """
+    p, d, q, P, D, Q = estimate.order
+    s = estimate.seasonal_period
+    r = len(estimate.state)
+
+    T = np.zeros((r, r))
+    T[:len(estimate.ar), 0] = estimate.ar
+    T[:-1, 1:] = np.eye(r - 1)
+    state = estimate.state.copy()
+    w_forecast = np.empty(periods)
+    for h in range(periods):
+        w_forecast[h] = state[0] + estimate.mean
+        state = T @ state
+
+    diff_poly = _differencing_polynomial(d, D, s)
+    history = list(np.asarray(values, dtype=float))
+    for h in range(periods):
+        history.append(w_forecast[h] - np.dot(diff_poly[1:], history[::-1][:len(diff_poly) - 1]))
+    forecast = np.array(history[-periods:])
+
+    psi = sarima_psi_weights(estimate, periods)
+    std_errors = np.sqrt(estimate.sigma2 * np.cumsum(psi ** 2))
+
+    return forecast, std_errors
+
+
+def _differencing_polynomial(d: int, D: int, s: int) -> np.ndarray:
+    """Differencing operator (1 - L)^d (1 - L^s)^D in ascending powers of L"""
+    diff_poly = np.array([1.0])
+    for _ in range(d):
+        diff_poly = np.convolve(diff_poly, [1.0, -1.0])
+    seasonal_diff = np.zeros(s + 1)
+    seasonal_diff[[0, s]] = [1.0, -1.0]
+    for _ in range(D):
+        diff_poly = np.convolve(diff_poly, seasonal_diff)
+    return diff_poly
+
+
+def sarima_psi_weights(estimate: SARIMAEstimate, periods: int) -> np.ndarray:
+    """First `periods` psi-weights of theta(L) / (phi(L) * diff(L)), the
+    response of the original series to one innovation"""
+    p, d, q, P, D, Q = estimate.order
+    diff_poly = _differencing_polynomial(d, D, estimate.seasonal_period)
+    impulse = np.zeros(periods)
+    impulse[0] = 1.0
+    return signal.lfilter(np.r_[1.0, estimate.ma], np.convolve(np.r_[1.0, -estimate.ar], diff_poly), impulse)
+
+
+def sarima_standardized_innovations(values: np.ndarray, estimate: SARIMAEstimate) -> np.ndarray:
+    """
+    One-step innovations rescaled to the steady-state variance sigma2
+    (early innovations have inflated Kalman variance F_t), for resampling.
+    """
+    w = _difference(values, estimate.order[1], estimate.order[4], estimate.seasonal_period)
+    v, F, _ = _kalman_filter(w - estimate.mean, estimate.ar, estimate.ma)
+    return v / np.sqrt(F)
+
+
+# ============================================================================
+# SARIMA ORDER SEARCH
+# ============================================================================
+
+# Candidate orders (reduced set for efficiency)
+SARIMA_KEY_PARAMS = [
+    (0, 0, 1), (0, 1, 1), (1, 0, 1), (1, 1, 0), (1, 1, 1), (2, 1, 1),
+]
+SARIMA_SEASONAL_PARAMS = [
+    (0, 0, 0), (0, 1, 0), (0, 1, 1), (1, 0, 0), (1, 1, 1),
+]
+
+# KPSS level-stationarity statistic above which a difference is taken (5% critical value)
+KPSS_CRITICAL_VALUE = 0.463
+
+# Seasonal strength above which a seasonal difference is taken (Wang, Smith & Hyndman 2006)
+SEASONAL_STRENGTH_THRESHOLD = 0.64
+
+# Series shared with search workers, set once per process by the pool initializer
+_SHARED_SERIES: Dict[str, np.ndarray] = {}
+
+
+def kpss_statistic(values: np.ndarray) -> float:
+    """
+    KPSS statistic for level stationarity (Kwiatkowski et al. 1992), with a
+    Bartlett-weighted long-run variance over int(4 * (n / 100) ** 0.25) lags.
+    """
+    x = np.asarray(values, dtype=float)
+    x = x - x.mean()
+    n = len(x)
+    lags = min(int(4 * (n / 100) ** 0.25), n - 1)
+    long_run = np.dot(x, x) / n
+    for lag in range(1, lags + 1):
+        long_run += 2 * (1 - lag / (lags + 1)) * np.dot(x[lag:], x[:-lag]) / n
+    if long_run <= 0:
+        return 0.0
+    return float(np.sum(np.cumsum(x) ** 2) / (n ** 2 * long_run))
+
+
+def seasonal_strength(values: np.ndarray, s: int) -> float:
+    """
+    Strength of seasonality in [0, 1] from a classical decomposition:
+    max(0, 1 - Var(remainder) / Var(seasonal + remainder)), where the trend
+    is a centred 2 x s moving average.
+    """
+    x = np.asarray(values, dtype=float)
+    if len(x) < 2 * s + 1:
+        return 0.0
+    kernel = np.r_[0.5, np.ones(s - 1), 0.5] / s
+    trend = np.convolve(x, kernel, mode='valid')
+    offset = s // 2
+    detrended = x[offset:offset + len(trend)] - trend
+    positions = (np.arange(len(detrended)) + offset) % s
+    seasonal = np.array([detrended[positions == i].mean() for i in range(s)])
+    remainder = detrended - (seasonal - seasonal.mean())[positions]
+    total = np.var(detrended)
+    if total <= 0:
+        return 0.0
+    return float(max(0.0, 1 - np.var(remainder) / total))
+
+
+def select_differencing(
+    values: np.ndarray,
+    seasonal_period: int = 12,
+    max_d: int = 1,
+    max_D: int = 1
+) -> Tuple[int, int]:
+    """
+    (d, D) for a series, chosen before any AIC comparison: a seasonal
+    difference when the seasonal strength passes SEASONAL_STRENGTH_THRESHOLD,
+    then regular differences while the KPSS test rejects level stationarity.
+
+    Likelihoods of different (d, D) are computed on differenced series of
+    different lengths and cannot be compared by AIC, so the order search only
+    ranks orders that share the (d, D) chosen here.
+    """
+    x = np.asarray(values, dtype=float)
+    D = 0
+    if max_D > 0 and seasonal_strength(x, seasonal_period) > SEASONAL_STRENGTH_THRESHOLD:
+        x = _difference(x, 0, 1, seasonal_period)
+        D = 1
+    d = 0
+    while d < max_d and len(x) > 3 and kpss_statistic(x) > KPSS_CRITICAL_VALUE:
+        x = np.diff(x)
+        d += 1
+    return d, D
+
+
+def sarima_order_aic(values: np.ndarray, order: Tuple[int, ...], seasonal_period: int = 12) -> float:
+    """AIC of the maximum-likelihood fit of one SARIMA order"""
+    return fit_sarima(values, order, seasonal_period).aic
+
+
+def _init_search_worker(series: Dict[str, np.ndarray]):
+    """Pool initializer: keep the read-only series in the worker process"""
+    global _SHARED_SERIES
+    _SHARED_SERIES = series
+
+
+def _evaluate_order(task: Tuple) -> Tuple[str, Tuple[int, ...], float, Optional[np.ndarray]]:
+    """
+    Worker entry point: fit one (series key, order, seasonal period, start params).
+
+    Returns (key, order, AIC, fitted params); AIC is inf if the order cannot be fitted.
+    """
+    key, order, seasonal_period, start_params = task
+    try:
+        estimate = fit_sarima(_SHARED_SERIES[key], order, seasonal_period, start_params=start_params)
+        return key, order, estimate.aic, estimate.params
+    except Exception as e:
+        logger.debug(f"SARIMA{order} failed for {key}: {str(e)[:50]}")
+        return key, order, np.inf, None
+
+
+class SARIMAOrderSearch:
+    """
+    AIC-based SARIMA order search over one or many series.
+
+    Differencing is chosen first for each series (`select_differencing`), and
+    AIC is compared only among candidate orders with that (d, D), whose
+    likelihoods are computed on the same differenced sample.
+
+    All (series, order) candidates of a complexity level (total number of
+    order terms) are evaluated together on one process pool, so the pool is
+    busy across sectors/groups as well as across orders. Levels are tried from
+    simplest to most complex; a series drops out once its best AIC has not
+    improved for `patience` levels. Each fit warm-starts from the closest
+    smaller order already fitted for the same series.
+    """
+
+    def __init__(
+        self,
+        series: Dict[str, pd.Series],
+        seasonal_period: int = 12,
+        max_workers: Optional[int] = None,
+        patience: int = 2,
+        executor: Optional[Executor] = None,
+        warm_start: bool = True,
+        max_d: int = 1,
+        max_D: int = 1
+    ):
+        """
+        Args:
+            series: Training series by key (e.g. sector or group name)
+            seasonal_period: Seasonality period (12 for monthly)
+            max_workers: Worker processes (1 = run in-process, None = one per CPU)
+            patience: Complexity levels without improvement before a series stops
+            executor: Existing pool to use instead of creating one; it must have
+                      been created with initializer=_init_search_worker for the
+                      same series
+            warm_start: Start each fit from a neighbouring order's estimate
+            max_d, max_D: Most regular / seasonal differences select_differencing may choose
+        """
+        self.series = {key: s.dropna().to_numpy(dtype=float) for key, s in series.items()}
+        # (d, D) per series, fixed before any AIC comparison and capped at what the candidates cover
+        max_d = min(max_d, max(d for _, d, _ in SARIMA_KEY_PARAMS))
+        max_D = min(max_D, max(D for _, D, _ in SARIMA_SEASONAL_PARAMS))
+        self.differencing = {
+            key: select_differencing(values, seasonal_period, max_d, max_D)
+            for key, values in self.series.items()
+        }
+        self.seasonal_period = seasonal_period
+        self.max_workers = max_workers if max_workers is not None else os.cpu_count()
+        self.patience = patience
+        self.executor = executor
+        self.warm_start = warm_start
+        self.tested: Dict[str, int] = defaultdict(int)
+        # Unconstrained parameter estimates by key and order
+        self.fitted: Dict[str, Dict[Tuple[int, ...], np.ndarray]] = defaultdict(dict)
+
+    @staticmethod
+    def candidate_levels() -> List[List[Tuple[int, ...]]]:
+        """Candidate orders grouped by complexity, simplest first"""
+        levels = defaultdict(list)
+        for p, d, q in SARIMA_KEY_PARAMS:
+            for P, D, Q in SARIMA_SEASONAL_PARAMS:
+                levels[p + d + q + P + D + Q].append((p, d, q, P, D, Q))
+        return [levels[k] for k in sorted(levels)]
+
+    def run(self) -> Dict[str, Tuple[Tuple[int, ...], float]]:
+        """Best (order, AIC) per series key"""
+        if self.executor is not None:
+            return self._search(self.executor.map)
+
+        if self.max_workers <= 1:
+            # Restore the caller's series afterwards: an in-process search may
+            # run inside a backtest worker that still needs them
+            shared = _SHARED_SERIES
+            _init_search_worker(self.series)
+            try:
+                return self._search(map)
+            finally:
+                _init_search_worker(shared)
+
+        with ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            initializer=_init_search_worker,
+            initargs=(self.series,)
+        ) as executor:
+            return self._search(executor.map)
+
+    def _search(self, map_fn) -> Dict[str, Tuple[Tuple[int, ...], float]]:
+        best = {key: ((1, 1, 1, 1, 1, 1), np.inf) for key in self.series}
+        stale = {key: 0 for key in self.series}
+
+        for level in self.candidate_levels():
+            active = [key for key in self.series if stale[key] < self.patience]
+            if not active:
+                break
+
+            tasks = [
+                (key, order, self.seasonal_period,
+                 warm_start_params(order, self.fitted[key]) if self.warm_start else None)
+                for key in active for order in level
+                if (order[1], order[4]) == self.differencing[key]
+            ]
+            searched = {task[0] for task in tasks}
+            improved = set()
+            for key, order, aic, params in map_fn(_evaluate_order, tasks):
+                self.tested[key] += 1
+                if params is not None:
+                    self.fitted[key][order] = params
+                if aic < best[key][1]:
+                    best[key] = (order, aic)
+                    improved.add(key)
+                    logger.debug(f"{key}: new best SARIMA{order} with AIC={aic:.2f}")
+
+            for key in searched:
+                # Levels before the first finite AIC do not count against patience
+                if key in improved or not np.isfinite(best[key][1]):
+                    stale[key] = 0
+                else:
+                    stale[key] += 1
+
+        return best
+
+
 # ============================================================================
 # SARIMA MODEL IMPLEMENTATION
 # ============================================================================
@@ -194,56 +822,52 @@ class SARIMAForecaster:
         self.name = name
         self.model = None
         self.fitted_model = None
+        self.estimate = None
         self.diagnostics = None
         self.forecast = None
+        # Estimates from the order search, reused to warm-start fit()
+        self.searched_params: Dict[Tuple[int, ...], np.ndarray] = {}
 
     def auto_select_parameters(self, max_p=3, max_d=2, max_q=3,
                                max_P=2, max_D=1, max_Q=2,
-                               seasonal_period=12) -> Tuple[int, int, int, int, int, int]:
+                               seasonal_period=12,
+                               max_workers: Optional[int] = 1,
+                               patience: int = 2) -> Tuple[int, int, int, int, int, int]:
         """
         Auto-select ARIMA parameters using grid search based on AIC
 
         For computational efficiency, uses simplified approach with
         key parameter combinations rather than exhaustive grid search.
+        d and D are chosen first (KPSS test, seasonal strength) and AIC only
+        ranks candidates with those differences. Candidates are tried from
+        simplest to most complex and the search stops once AIC has not
+        improved for `patience` complexity levels.
 
         Args:
             max_p, max_d, max_q: Max values for non-seasonal parameters
             max_P, max_D, max_Q: Max values for seasonal parameters
             seasonal_period: Seasonality period (12 for monthly)
+            max_workers: Worker processes for the search (1 = in-process,
+                         None = one per CPU)
+            patience: Complexity levels without improvement before stopping
 
         Returns:
             Tuple of (p, d, q, P, D, Q) with lowest AIC
         """
         logger.info(f"Auto-selecting ARIMA parameters for {self.name}...")
 
-        # Test key parameter combinations (reduced set for efficiency)
-        best_aic = np.inf
-        best_params = (1, 1, 1, 1, 1, 1)
-
-        key_params = [
-            (0, 0, 1), (0, 1, 1), (1, 0, 1), (1, 1, 0), (1, 1, 1), (2, 1, 1),
-        ]
-        seasonal_params = [
-            (0, 0, 0), (0, 1, 0), (0, 1, 1), (1, 0, 0), (1, 1, 1),
-        ]
-
-        tested_count = 0
-        for p, d, q in key_params:
-            for P, D, Q in seasonal_params:
-                tested_count += 1
-                try:
-                    # Fit model (simple approach without ARIMA library)
-                    aic = self._fit_and_get_aic(p, d, q, P, D, Q, seasonal_period)
-
-                    if aic < best_aic:
-                        best_aic = aic
-                        best_params = (p, d, q, P, D, Q)
-                        logger.debug(f"New best: SARIMA{best_params} with AIC={best_aic:.2f}")
-                except Exception as e:
-                    logger.debug(f"SARIMA({p},{d},{q})({P},{D},{Q},12) failed: {str(e)[:50]}")
-                    continue
-
-        logger.info(f"Auto-selection complete. Tested {tested_count} combinations.")
+        search = SARIMAOrderSearch(
+            {self.name: self.series},
+            seasonal_period=seasonal_period,
+            max_workers=max_workers,
+            patience=patience,
+            max_d=max_d,
+            max_D=max_D
+        )
+        best_params, best_aic = search.run()[self.name]
+        self.searched_params = search.fitted[self.name]
+
+        logger.info(f"Auto-selection complete. Tested {search.tested[self.name]} combinations.")
         logger.info(f"Selected: SARIMA{best_params} with AIC={best_aic:.2f}")
 
         return best_params
@@ -251,36 +875,9 @@ class SARIMAForecaster:
     def _fit_and_get_aic(self, p, d, q, P, D, Q, seasonal_period) -> float:
         """
         Fit ARIMA model and return AIC
-        Uses simple exponential smoothing-based approach
-        """
-        # For computational efficiency, estimate AIC based on differencing
-        # and autocorrelation structure
-        series = self.series.copy()
-
-        # Apply differencing
-        for _ in range(d):
-            if len(series) < 2:
-                raise ValueError("Not enough data for differencing")
-            series = series.diff().dropna()
-
-        # Seasonal differencing
-        for _ in range(D):
-            if len(series) < seasonal_period + 1:
-                raise ValueError("Not enough data for seasonal differencing")
-            series = series.diff(seasonal_period).dropna()
-
-        # Estimate AIC based on variance
-        if len(series) > 0:
-            variance = series.var()
-            n = len(series)
-            num_params = p + d + q + P + D + Q + 1  # +1 for mean/intercept
-
-            # BIC approximation: -2*loglik + k*log(n)
-            # Simplified: AIC ≈ n*log(variance) + 2*num_params
-            aic = n * np.log(variance) + 2 * num_params
-            return aic
-        else:
-            raise ValueError("Series is empty after differencing")
+        Uses the Kalman-filter maximum-likelihood fit
+        """
+        return sarima_order_aic(self.series.to_numpy(dtype=float), (p, d, q, P, D, Q), seasonal_period)
 
     def fit(self, p=1, d=1, q=1, P=1, D=1, Q=1, seasonal_period=12):
         """
@@ -297,11 +894,12 @@ class SARIMAForecaster:
             # Store parameters
             self.parameters = (p, d, q, P, D, Q)
 
-            # Fit using exponential smoothing as base
-            self.fitted_model = self._fit_exponential_smoothing()
-
-            # Calculate diagnostics
-            self._calculate_diagnostics(p, d, q, P, D, Q)
+            # Maximum-likelihood fit, warm-started from the order search when available
+            values = self.series.to_numpy(dtype=float)
+            self._set_estimate(fit_sarima(
+                values, self.parameters, seasonal_period,
+                start_params=warm_start_params(self.parameters, self.searched_params)
+            ))
 
             logger.info(f"Model fitted successfully. RMSE={self.diagnostics['rmse']:.4f}")
             return True
@@ -310,31 +908,45 @@ class SARIMAForecaster:
             logger.error(f"Failed to fit SARIMA model: {e}")
             return False
 
-    def _fit_exponential_smoothing(self):
+    def restore(self, order: Tuple[int, ...], params: np.ndarray, mean: float, seasonal_period=12):
         """
-        Fit exponential smoothing model as base forecasting mechanism
+        Use previously estimated parameters (e.g. from ForecastCache) instead
+        of fitting: the Kalman filter is run over the current series once,
+        which also rolls the model forward over any months added since.
         """
-        series = self.series.copy()
-        n = len(series)
+        logger.info(f"Restoring SARIMA{tuple(order)} from stored parameters...")
 
-        # Simple exponential smoothing initialization
-        alpha = 0.3  # Smoothing parameter
+        try:
+            self.parameters = tuple(order)
+            self._set_estimate(sarima_restore(
+                self.series.to_numpy(dtype=float), order, params, mean, seasonal_period
+            ))
+            return True
 
-        # Initialize
-        fitted = np.zeros(n)
-        fitted[0] = series.iloc[0]
+        except Exception as e:
+            logger.error(f"Failed to restore SARIMA model: {e}")
+            return False
+
+    def _set_estimate(self, estimate: SARIMAEstimate):
+        """Keep an estimate with its one-step predictions and diagnostics"""
+        self.estimate = estimate
 
-        # Apply exponential smoothing
-        for t in range(1, n):
-            fitted[t] = alpha * series.iloc[t] + (1 - alpha) * fitted[t-1]
+        # One-step-ahead predictions; the first d + s*D points are used up by differencing
+        values = self.series.to_numpy(dtype=float)
+        fitted = values.copy()
+        fitted[len(values) - estimate.nobs:] -= estimate.residuals
+        self.fitted_model = pd.Series(fitted, index=self.series.index)
 
-        return pd.Series(fitted, index=series.index)
+        # Calculate diagnostics
+        self._calculate_diagnostics(*estimate.order)
 
     def _calculate_diagnostics(self, p, d, q, P, D, Q):
         """Calculate model diagnostic metrics"""
 
-        # Calculate residuals
-        residuals = self.series - self.fitted_model
+        # Calculate residuals (points consumed by differencing have no prediction)
+        burn_in = len(self.series) - self.estimate.nobs
+        residuals = (self.series - self.fitted_model).iloc[burn_in:]
+        actual = self.series.iloc[burn_in:]
 
         # RMSE
         rmse = np.sqrt(np.mean(residuals**2))
@@ -343,9 +955,9 @@ class SARIMAForecaster:
         mae = np.mean(np.abs(residuals))
 
         # MAPE (avoid division by zero)
-        non_zero_idx = self.series.abs() > 0.001
+        non_zero_idx = actual.abs() > 0.001
         if non_zero_idx.sum() > 0:
-            mape = 100 * np.mean(np.abs(residuals[non_zero_idx] / self.series[non_zero_idx]))
+            mape = 100 * np.mean(np.abs(residuals[non_zero_idx] / actual[non_zero_idx]))
         else:
             mape = np.nan
 
@@ -363,11 +975,9 @@ class SARIMAForecaster:
             ljung_box_p = np.nan
             is_white_noise = False
 
-        # AIC/BIC
-        n = len(self.series)
-        num_params = p + d + q + P + D + Q + 1
-        aic = n * np.log(np.var(residuals)) + 2 * num_params
-        bic = n * np.log(np.var(residuals)) + num_params * np.log(n)
+        # AIC/BIC from the exact likelihood
+        aic = self.estimate.aic
+        bic = self.estimate.bic
 
         self.diagnostics = {
             'model_name': f'SARIMA({p},{d},{q})({P},{D},{Q},12)',
@@ -380,7 +990,9 @@ class SARIMAForecaster:
             'ljung_box_p_value': ljung_box_p,
             'is_white_noise': is_white_noise,
             'training_rmse': rmse,
-            'residuals_std': np.std(residuals)
+            'residuals_std': np.std(residuals),
+            'sigma2': self.estimate.sigma2,
+            'log_likelihood': self.estimate.loglike
         }
 
     def forecast_periods(self, periods=12, confidence_level=0.95) -> List[ForecastPoint]:
@@ -404,72 +1016,33 @@ class SARIMAForecaster:
 
         # Get last date in training data
         last_date = self.series.index[-1]
-        last_value = self.series.iloc[-1]
+        values = self.series.to_numpy(dtype=float)
 
         # Determine confidence level multiplier
-        if confidence_level == 0.95:
-            z_95 = 1.96
-            z_80 = 1.28
-        else:
-            z_95 = 1.96
-            z_80 = 1.28
+        z_95 = 1.96
+        z_80 = 1.28
 
-        # Generate forecast
-        residuals_std = self.diagnostics.get('residuals_std', 1.0)
+        # Model forecasts and standard errors for every horizon
+        forecasts, std_errors = sarima_forecast(values, self.estimate, periods)
+        path = np.concatenate([values, forecasts])
 
         for i in range(1, periods + 1):
             # Forecast date
-            forecast_date = last_date + timedelta(days=30*i)  # Approximate
-            month = forecast_date.month
+            forecast_date = last_date + pd.DateOffset(months=i)
             year = forecast_date.year
             month_name = forecast_date.strftime('%B')
 
-            # Simple exponential smoothing forecast with trend
-            # Base forecast increases slightly with trend
-            trend = 0.05  # Slight upward trend
-            base_forecast = last_value + (trend * i)
-
-            # Add seasonal component (seasonal variation around trend)
-            seasonal_factors = {
-                1: -0.2,   # January: slight dip
-                2: 0.0,    # February: baseline
-                3: 0.3,    # March: seasonal rise
-                4: 0.5,    # April: spring rise
-                5: 0.2,    # May: decline
-                6: -0.3,   # June: summer dip
-                7: -0.8,   # July: monsoon dip
-                8: -0.7,   # August: monsoon dip
-                9: -0.4,   # September: post-monsoon
-                10: 0.2,   # October: harvest
-                11: 0.6,   # November: rise
-                12: 1.0,   # December: peak
-            }
-
-            seasonal_adjustment = seasonal_factors.get(month, 0.0)
-            forecast_index = base_forecast + seasonal_adjustment
-
-            # Confidence intervals (widen with forecast horizon)
-            ci_multiplier = np.sqrt(i / 12)  # Increases with time horizon
-            std_error = residuals_std * ci_multiplier
+            forecast_index = float(forecasts[i - 1])
+            std_error = float(std_errors[i - 1])
 
             lower_95 = forecast_index - (z_95 * std_error)
             upper_95 = forecast_index + (z_95 * std_error)
             lower_80 = forecast_index - (z_80 * std_error)
             upper_80 = forecast_index + (z_80 * std_error)
 
-            # Calculate YoY inflation rate
-            # Use last year same month value
-            prior_year_date = last_date - timedelta(days=365)
-
-            # Get prior year value (approximate)
-            if month == 1:
-                # Jan 2025 vs Jan 2024
-                prior_year_value = 108.14  # From data: Jan 2024 was 108.14
-            else:
-                # Estimate from current year
-                months_back = i + 12
-                prior_year_value = last_value - (0.05 * months_back)  # Approx
-
+            # YoY inflation against the actual (or forecast) value 12 months earlier
+            prior_position = len(values) - 1 + i - 12
+            prior_year_value = path[prior_position] if prior_position >= 0 else values[0]
             yoy_inflation = ((forecast_index / prior_year_value) - 1) * 100
 
             point = ForecastPoint(
@@ -494,6 +1067,168 @@ class SARIMAForecaster:
         return forecast_points
 
 
+# ============================================================================
+# HOLT-WINTERS (VECTORIZED)
+# ============================================================================
+
+@dataclass
+class HoltWintersFit:
+    """Holt-Winters fit of one or more equal-length series (one row per series)"""
+    seasonal: str            # "additive" or "multiplicative"
+    season_length: int
+    alpha: np.ndarray        # Level smoothing
+    beta: np.ndarray         # Trend smoothing
+    gamma: np.ndarray        # Seasonal smoothing
+    level: np.ndarray        # Final level
+    trend: np.ndarray        # Final trend
+    seasonals: np.ndarray    # (series, season_length) factors by position t % season_length
+    fitted: np.ndarray       # (series, n) one-step-ahead predictions
+    sse: np.ndarray          # Sum of squared one-step errors per series
+    nobs: int
+
+    def forecast(self, periods: int) -> np.ndarray:
+        """(series, periods) point forecasts after the last observation"""
+        steps = np.arange(1, periods + 1)
+        positions = (self.nobs - 1 + steps) % self.season_length
+        base = self.level[:, None] + steps[None, :] * self.trend[:, None]
+        if self.seasonal == 'multiplicative':
+            return base * self.seasonals[:, positions]
+        return base + self.seasonals[:, positions]
+
+
+def _holt_winters_initial_state(Y: np.ndarray, s: int, seasonal: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Initial level, trend and seasonal factors from the first two seasons"""
+    first = Y[:, :s].mean(axis=1)
+    second = Y[:, s:2 * s].mean(axis=1)
+    level = first
+    trend = (second - first) / s
+    if seasonal == 'multiplicative':
+        seasonals = Y[:, :s] / first[:, None]
+    else:
+        seasonals = Y[:, :s] - first[:, None]
+    return level, trend, seasonals
+
+
+def holt_winters_filter(
+    Y: np.ndarray,
+    alpha: np.ndarray,
+    beta: np.ndarray,
+    gamma: np.ndarray,
+    season_length: int = 12,
+    seasonal: str = 'additive'
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Run Holt-Winters smoothing over a (series, time) array.
+
+    The time recursion is sequential, but each step updates every series (and
+    every parameter set, when rows repeat a series) with one array operation.
+
+    Returns (one-step predictions, final level, final trend, seasonal factors).
+    """
+    s = season_length
+    level, trend, seasonals = _holt_winters_initial_state(Y, s, seasonal)
+    seasonals = seasonals.copy()
+    m, n = Y.shape
+    fitted = np.empty((m, n))
+    multiplicative = seasonal == 'multiplicative'
+
+    for t in range(n):
+        y = Y[:, t]
+        season = seasonals[:, t % s]
+        base = level + trend
+        if multiplicative:
+            fitted[:, t] = base * season
+            new_level = alpha * y / season + (1 - alpha) * base
+            seasonals[:, t % s] = gamma * y / new_level + (1 - gamma) * season
+        else:
+            fitted[:, t] = base + season
+            new_level = alpha * (y - season) + (1 - alpha) * base
+            seasonals[:, t % s] = gamma * (y - new_level) + (1 - gamma) * season
+        trend = beta * (new_level - level) + (1 - beta) * trend
+        level = new_level
+
+    return fitted, level, trend, seasonals
+
+
+def fit_holt_winters(
+    Y: np.ndarray,
+    season_length: int = 12,
+    seasonal: str = 'additive',
+    start: Tuple[float, float, float] = (0.3, 0.1, 0.1)
+) -> HoltWintersFit:
+    """
+    Fit Holt-Winters to one series or a (series, time) array, choosing
+    alpha/beta/gamma in [0, 1] per series by minimising the one-step SSE.
+
+    Series are independent, so the total SSE is minimised over all parameters
+    at once with L-BFGS-B; the finite-difference gradient for every series
+    comes from the same batched filter pass as the SSE itself.
+
+    Args:
+        Y: Series values, 1-D or (series, time); at least two full seasons
+        season_length: Seasonality period (12 for monthly)
+        seasonal: "additive" or "multiplicative"
+        start: Starting (alpha, beta, gamma)
+    """
+    Y = np.atleast_2d(np.asarray(Y, dtype=float))
+    m, n = Y.shape
+    if n < 2 * season_length:
+        raise ValueError(f"Need at least {2 * season_length} observations, got {n}")
+
+    # Rows: the series at the current parameters, then with alpha, beta and
+    # gamma perturbed in turn, so the value and gradient take one filter pass
+    stacked = np.tile(Y, (4, 1))
+    perturbation = np.zeros((3, 4 * m))
+    for i in range(3):
+        perturbation[i, (i + 1) * m:(i + 2) * m] = GRADIENT_STEP
+
+    def objective(flat):
+        params = np.tile(flat.reshape(3, m), (1, 4)) + perturbation
+        fitted = holt_winters_filter(stacked, *params, season_length, seasonal)[0]
+        sse = np.sum((stacked - fitted) ** 2, axis=1).reshape(4, m)
+        total = sse[0].sum()
+        if not np.isfinite(total):
+            return 1e300, np.zeros(3 * m)
+        return total, ((sse[1:] - sse[0]) / GRADIENT_STEP).ravel()
+
+    x0 = np.repeat(np.asarray(start, dtype=float), m)
+    result = minimize(objective, x0, jac=True, method='L-BFGS-B', bounds=[(0.0, 1.0)] * (3 * m))
+    alpha, beta, gamma = result.x.reshape(3, m)
+
+    return holt_winters_state(Y, alpha, beta, gamma, season_length, seasonal)
+
+
+def holt_winters_state(
+    Y: np.ndarray,
+    alpha: np.ndarray,
+    beta: np.ndarray,
+    gamma: np.ndarray,
+    season_length: int = 12,
+    seasonal: str = 'additive'
+) -> HoltWintersFit:
+    """
+    Filter one series or a (series, time) array with given smoothing
+    parameters and return the resulting fit, without re-optimising them.
+    Used to roll a fitted model forward over new observations.
+    """
+    Y = np.atleast_2d(np.asarray(Y, dtype=float))
+    alpha, beta, gamma = (np.broadcast_to(np.asarray(v, dtype=float), Y.shape[:1]) for v in (alpha, beta, gamma))
+    fitted, level, trend, seasonals = holt_winters_filter(Y, alpha, beta, gamma, season_length, seasonal)
+    return HoltWintersFit(
+        seasonal=seasonal,
+        season_length=season_length,
+        alpha=alpha,
+        beta=beta,
+        gamma=gamma,
+        level=level,
+        trend=trend,
+        seasonals=seasonals,
+        fitted=fitted,
+        sse=np.sum((Y - fitted) ** 2, axis=1),
+        nobs=Y.shape[1]
+    )
+
+
 # ============================================================================
 # EXPONENTIAL SMOOTHING FORECASTER
 # ============================================================================
@@ -501,57 +1236,98 @@ class SARIMAForecaster:
 class ExponentialSmoothingForecaster:
     """Holt-Winters Exponential Smoothing forecaster"""
 
-    def __init__(self, series: pd.Series, seasonal_period=12):
+    def __init__(self, series: pd.Series, seasonal_period=12, seasonal: str = 'multiplicative'):
         """
         Initialize exponential smoothing forecaster
 
         Args:
             series: Time series data
             seasonal_period: Seasonality period (12 for monthly)
+            seasonal: "multiplicative" or "additive" seasonal component
         """
         self.series = series.dropna()
         self.seasonal_period = seasonal_period
+        self.seasonal_type = seasonal
         self.fitted_model = None
         self.forecast = None
 
+    @classmethod
+    def fit_many(
+        cls,
+        series: Dict[str, pd.Series],
+        seasonal_period=12,
+        seasonal: str = 'multiplicative'
+    ) -> Dict[str, 'ExponentialSmoothingForecaster']:
+        """
+        Fit many series together: series of equal length are stacked into one
+        2-D array and fitted by a single vectorized optimisation.
+
+        Returns fitted forecasters by key (series that cannot be fitted are left out).
+        """
+        forecasters = {key: cls(s, seasonal_period, seasonal) for key, s in series.items()}
+        by_length = defaultdict(list)
+        for key, forecaster in forecasters.items():
+            by_length[len(forecaster.series)].append(key)
+
+        fitted = {}
+        for length, keys in by_length.items():
+            if length < 2 * seasonal_period:
+                logger.warning(f"Skipping {len(keys)} series shorter than {2 * seasonal_period} points")
+                continue
+            Y = np.vstack([forecasters[key].series.to_numpy(dtype=float) for key in keys])
+            result = fit_holt_winters(Y, seasonal_period, seasonal)
+            for row, key in enumerate(keys):
+                forecasters[key]._set_fit(result, row)
+                fitted[key] = forecasters[key]
+
+        logger.info(f"Fitted {len(fitted)} Exponential Smoothing models in {len(by_length)} batch(es)")
+        return fitted
+
     def fit(self):
         """Fit exponential smoothing model"""
         logger.info("Fitting Exponential Smoothing model...")
 
         try:
-            # Estimate smoothing parameters
-            self.alpha = 0.3   # Level smoothing
-            self.beta = 0.1    # Trend smoothing
-            self.gamma = 0.1   # Seasonal smoothing
-
-            # Initialize components
-            self._initialize_components()
+            # Smoothing parameters chosen by minimising the one-step SSE
+            result = fit_holt_winters(
+                self.series.to_numpy(dtype=float), self.seasonal_period, self.seasonal_type
+            )
+            self._set_fit(result, 0)
 
-            logger.info("Exponential Smoothing model fitted successfully")
+            logger.info(
+                f"Exponential Smoothing model fitted successfully "
+                f"(alpha={self.alpha:.3f}, beta={self.beta:.3f}, gamma={self.gamma:.3f})"
+            )
             return True
 
         except Exception as e:
             logger.error(f"Failed to fit Exponential Smoothing: {e}")
             return False
 
-    def _initialize_components(self):
-        """Initialize level, trend, and seasonal components"""
-
-        n = len(self.series)
-
-        # Initial level: average of first season
-        self.level = self.series.iloc[:self.seasonal_period].mean()
+    def restore(self, alpha: float, beta: float, gamma: float):
+        """Use previously optimised smoothing parameters instead of fitting"""
+        try:
+            result = holt_winters_state(
+                self.series.to_numpy(dtype=float), alpha, beta, gamma,
+                self.seasonal_period, self.seasonal_type
+            )
+            self._set_fit(result, 0)
+            return True
 
-        # Initial trend: average change per month
-        self.trend = (self.series.iloc[self.seasonal_period:2*self.seasonal_period].mean() -
-                     self.series.iloc[:self.seasonal_period].mean()) / self.seasonal_period
+        except Exception as e:
+            logger.error(f"Failed to restore Exponential Smoothing: {e}")
+            return False
 
-        # Initial seasonal factors
-        self.seasonal = np.ones(self.seasonal_period)
-        for i in range(self.seasonal_period):
-            indices = list(range(i, n, self.seasonal_period))
-            if indices:
-                self.seasonal[i] = np.mean([self.series.iloc[j] for j in indices]) / self.level
+    def _set_fit(self, result: HoltWintersFit, row: int):
+        """Take this series' parameters and final state from a (possibly batched) fit"""
+        self.alpha = float(result.alpha[row])   # Level smoothing
+        self.beta = float(result.beta[row])     # Trend smoothing
+        self.gamma = float(result.gamma[row])   # Seasonal smoothing
+        self.level = float(result.level[row])
+        self.trend = float(result.trend[row])
+        self.seasonal = result.seasonals[row]
+        self.fitted_model = pd.Series(result.fitted[row], index=self.series.index)
+        self._forecast_row = (result, row)
 
     def forecast_periods(self, periods=12, confidence_level=0.95) -> List[ForecastPoint]:
         """
@@ -577,16 +1353,17 @@ class ExponentialSmoothingForecaster:
         z_95 = 1.96
         z_80 = 1.28
 
+        result, row = self._forecast_row
+        forecasts = result.forecast(periods)[row]
+
         for i in range(1, periods + 1):
             # Forecast date
-            forecast_date = last_date + timedelta(days=30*i)
-            month = forecast_date.month
+            forecast_date = last_date + pd.DateOffset(months=i)
             year = forecast_date.year
             month_name = forecast_date.strftime('%B')
 
-            # Point forecast: level + trend + seasonal
-            seasonal_index = (i - 1) % self.seasonal_period
-            forecast_index = (self.level + i * self.trend) * self.seasonal[seasonal_index]
+            # Point forecast: level + trend with the seasonal factor for that month
+            forecast_index = float(forecasts[i - 1])
 
             # Confidence intervals
             ci_std = std_error * np.sqrt(1 + (i / 12))
@@ -619,22 +1396,72 @@ class ExponentialSmoothingForecaster:
         return forecast_points
 
     def _fitted_values(self):
-        """Calculate fitted values using exponential smoothing"""
-        fitted = np.zeros(len(self.series))
-        fitted[0] = self.series.iloc[0]
-
-        for t in range(1, len(self.series)):
-            seasonal_index = (t - 1) % self.seasonal_period
-            fitted[t] = (self.alpha * self.series.iloc[t] +
-                        (1 - self.alpha) * (fitted[t-1] + self.trend))
-
-        return pd.Series(fitted, index=self.series.index)
+        """One-step-ahead fitted values from the Holt-Winters recursion"""
+        return self.fitted_model
 
 
 # ============================================================================
 # LINEAR TREND FORECASTER
 # ============================================================================
 
+@dataclass
+class LinearTrendFit:
+    """OLS trend fit of aligned series (one column per series)"""
+    intercept: np.ndarray    # (series,)
+    slope: np.ndarray        # (series,)
+    sigma2: np.ndarray       # Residual variance per series (n - 2 degrees of freedom)
+    fitted: np.ndarray       # (n, series) fitted trend values
+    nobs: int
+
+    def predict(self, periods: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Point forecasts and prediction standard errors for the next `periods`
+        steps, both (periods, series).
+
+        Uses the closed-form OLS prediction variance
+        sigma2 * (1 + 1/n + (x0 - x_mean)^2 / Sxx) for time index x0.
+        """
+        n = self.nobs
+        x = np.arange(n, n + periods, dtype=float)
+        x_mean = (n - 1) / 2
+        sxx = n * (n * n - 1) / 12  # sum((x - x_mean)^2) for x = 0..n-1
+        forecast = self.intercept[None, :] + x[:, None] * self.slope[None, :]
+        leverage = 1 + 1 / n + (x - x_mean) ** 2 / sxx
+        std_errors = np.sqrt(leverage[:, None] * self.sigma2[None, :])
+        return forecast, std_errors
+
+
+def fit_linear_trends(Y: np.ndarray) -> LinearTrendFit:
+    """
+    Fit y = intercept + slope * t to every column of Y with one least-squares
+    solve (the design matrix is shared by all aligned series).
+
+    Args:
+        Y: (time, series) array, or a 1-D series; no missing values
+    """
+    Y = np.asarray(Y, dtype=float)
+    if Y.ndim == 1:
+        Y = Y[:, None]
+    n = Y.shape[0]
+    if n < 3:
+        raise ValueError(f"Need at least 3 observations, got {n}")
+    if np.isnan(Y).any():
+        raise ValueError("Series must be aligned with no missing values")
+
+    X = np.column_stack([np.ones(n), np.arange(n, dtype=float)])
+    coef, _, _, _ = np.linalg.lstsq(X, Y, rcond=None)
+    fitted = X @ coef
+    sigma2 = np.sum((Y - fitted) ** 2, axis=0) / (n - 2)
+
+    return LinearTrendFit(
+        intercept=coef[0],
+        slope=coef[1],
+        sigma2=sigma2,
+        fitted=fitted,
+        nobs=n
+    )
+
+
 class LinearTrendForecaster:
     """Simple linear regression trend forecaster (baseline)"""
 
@@ -648,22 +1475,46 @@ class LinearTrendForecaster:
         self.series = series.dropna()
         self.slope = None
         self.intercept = None
+        self.trend_fit = None
+        self._column = 0
+
+    @classmethod
+    def fit_many(cls, frame: pd.DataFrame) -> Dict[str, 'LinearTrendForecaster']:
+        """
+        Fit the trend of every column of an aligned frame (date index, one
+        column per sector/group/state) in a single least-squares call.
+
+        Returns a fitted forecaster per column, all sharing the batch fit.
+        """
+        frame = frame.sort_index()
+        trend_fit = fit_linear_trends(frame.to_numpy(dtype=float))
+
+        forecasters = {}
+        for column, key in enumerate(frame.columns):
+            forecaster = cls(frame[key])
+            forecaster._set_fit(trend_fit, column)
+            forecasters[key] = forecaster
+
+        logger.info(f"Fitted {len(forecasters)} Linear Trend models in one batch")
+        return forecasters
 
     def fit(self):
         """Fit linear trend"""
         logger.info("Fitting Linear Trend model...")
 
-        # X: time index (0, 1, 2, ...)
-        # Y: series values
-        x = np.arange(len(self.series))
-        y = self.series.values
-
-        # Linear regression: y = intercept + slope * x
-        self.slope, self.intercept = np.polyfit(x, y, 1)
+        # Linear regression on the time index: y = intercept + slope * t
+        self._set_fit(fit_linear_trends(self.series.values), 0)
 
         logger.info(f"Linear Trend fitted. Slope={self.slope:.4f}, Intercept={self.intercept:.2f}")
         return True
 
+    def _set_fit(self, trend_fit: LinearTrendFit, column: int):
+        """Take this series' coefficients from a (possibly batched) fit"""
+        self.trend_fit = trend_fit
+        self._column = column
+        self.slope = float(trend_fit.slope[column])
+        self.intercept = float(trend_fit.intercept[column])
+
     def forecast_periods(self, periods=12, confidence_level=0.95) -> List[ForecastPoint]:
         """
         Generate forecast using linear trend
@@ -679,31 +1530,27 @@ class LinearTrendForecaster:
 
         forecast_points = []
 
-        # Calculate residuals
-        x = np.arange(len(self.series))
-        y_fitted = self.intercept + self.slope * x
-        residuals = self.series.values - y_fitted
-        std_error = np.std(residuals)
+        # Point forecasts and closed-form OLS prediction standard errors
+        forecasts, std_errors = self.trend_fit.predict(periods)
+        forecasts = forecasts[:, self._column]
+        std_errors = std_errors[:, self._column]
 
         last_date = self.series.index[-1]
-        last_index = len(self.series) - 1
 
         z_95 = 1.96
         z_80 = 1.28
 
         for i in range(1, periods + 1):
             # Forecast date
-            forecast_date = last_date + timedelta(days=30*i)
-            month = forecast_date.month
+            forecast_date = last_date + pd.DateOffset(months=i)
             year = forecast_date.year
             month_name = forecast_date.strftime('%B')
 
             # Point forecast using linear trend
-            x_future = last_index + i
-            forecast_index = self.intercept + self.slope * x_future
+            forecast_index = float(forecasts[i - 1])
 
-            # Confidence intervals
-            ci_std = std_error * np.sqrt(1 + (i / 12))
+            # Prediction intervals
+            ci_std = std_errors[i - 1]
             lower_95 = forecast_index - z_95 * ci_std
             upper_95 = forecast_index + z_95 * ci_std
             lower_80 = forecast_index - z_80 * ci_std
@@ -733,6 +1580,82 @@ class LinearTrendForecaster:
         return forecast_points
 
 
+# ============================================================================
+# FORECAST ARRAYS
+# ============================================================================
+
+# Numeric ForecastPoint fields, in the order of the last axis of forecast arrays
+FORECAST_FIELDS = (
+    'forecast_index', 'lower_95_ci', 'upper_95_ci', 'lower_80_ci', 'upper_80_ci', 'yoy_inflation_rate'
+)
+INDEX, LOWER_95, UPPER_95, LOWER_80, UPPER_80, YOY = range(len(FORECAST_FIELDS))
+
+
+def forecast_array(points: List[ForecastPoint], periods: Optional[int] = None) -> np.ndarray:
+    """(horizon, field) array of ForecastPoints, NaN-padded to `periods` rows"""
+    periods = len(points) if periods is None else periods
+    array = np.full((periods, len(FORECAST_FIELDS)), np.nan)
+    if points:
+        values = np.array([[getattr(p, field) for field in FORECAST_FIELDS] for p in points[:periods]], dtype=float)
+        array[:len(values)] = values
+    return array
+
+
+def stack_forecasts(*forecasts: List[ForecastPoint], periods: Optional[int] = None) -> np.ndarray:
+    """
+    (horizon, model, field) array of several models' forecasts; the horizon
+    is that of the first forecast unless given, missing periods are NaN.
+    """
+    if periods is None:
+        periods = len(forecasts[0]) if forecasts and forecasts[0] else 0
+    return np.stack([forecast_array(f or [], periods) for f in forecasts], axis=1)
+
+
+def ensemble_array(stacked: np.ndarray, weights: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Weighted average over the model axis of a (horizon, model, field) array.
+
+    Weights default to equal; at each horizon they are renormalised over the
+    models that have a forecast there.
+    """
+    weights = np.ones(stacked.shape[1]) if weights is None else np.asarray(weights, dtype=float)
+    available = ~np.isnan(stacked)
+    w = np.where(available, weights[None, :, None], 0.0)
+    total = w.sum(axis=1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.where(total > 0, np.sum(np.where(available, stacked, 0.0) * w, axis=1) / total, np.nan)
+
+
+def forecast_dates(last_date: datetime, periods: int) -> List[datetime]:
+    """The `periods` calendar months after `last_date`, as the forecasters date their points"""
+    return [last_date + pd.DateOffset(months=i) for i in range(1, periods + 1)]
+
+
+def points_from_array(
+    array: np.ndarray,
+    dates: List[datetime],
+    scenario: str,
+    model: str
+) -> List[ForecastPoint]:
+    """
+    ForecastPoints from a (horizon, field) array, one per date in `dates`
+    (rows without a date or with no forecast are skipped).
+    """
+    rounded = np.round(array, 2).tolist()
+    return [
+        ForecastPoint(
+            month=date.strftime('%B')[:3].upper(),
+            year=date.year,
+            date=date,
+            **dict(zip(FORECAST_FIELDS, values)),
+            scenario=scenario,
+            model=model
+        )
+        for date, values in zip(dates, rounded)
+        if not np.isnan(values[INDEX])
+    ]
+
+
 # ============================================================================
 # SCENARIO GENERATOR
 # ============================================================================
@@ -740,6 +1663,33 @@ class LinearTrendForecaster:
 class ScenarioGenerator:
     """Generates optimistic and pessimistic scenarios from base forecast"""
 
+    SCENARIOS = ('Base', 'Optimistic', 'Pessimistic')
+
+    @staticmethod
+    def scenario_arrays(base: np.ndarray) -> np.ndarray:
+        """
+        (scenario, horizon, field) array of the Base, Optimistic and
+        Pessimistic scenarios from a (horizon, field) base forecast.
+
+        Optimistic takes the lower 80% bound as its path and Pessimistic the
+        upper one, each bounded by the base forecast on the other side. YoY
+        rates are re-based on the prior-year index implied by the base YoY.
+        """
+        optimistic = base.copy()
+        optimistic[:, INDEX] = base[:, LOWER_80]
+        optimistic[:, UPPER_95] = base[:, INDEX]
+        optimistic[:, UPPER_80] = base[:, INDEX]
+
+        pessimistic = base.copy()
+        pessimistic[:, INDEX] = base[:, UPPER_80]
+        pessimistic[:, LOWER_95] = base[:, INDEX]
+        pessimistic[:, LOWER_80] = base[:, INDEX]
+
+        scenarios = np.stack([base, optimistic, pessimistic])
+        prior_index = base[:, INDEX] / (1 + base[:, YOY] / 100)
+        scenarios[1:, :, YOY] = (scenarios[1:, :, INDEX] / prior_index - 1) * 100
+        return scenarios
+
     @staticmethod
     def generate_scenarios(base_forecast: List[ForecastPoint],
                           confidence_intervals: Dict) -> Dict[str, List[ForecastPoint]]:
@@ -755,48 +1705,15 @@ class ScenarioGenerator:
         """
         logger.info("Generating scenario forecasts...")
 
-        scenarios = {
-            'Base': base_forecast,
-            'Optimistic': [],
-            'Pessimistic': []
-        }
+        scenarios = ScenarioGenerator.scenario_arrays(forecast_array(base_forecast))
+        model = base_forecast[0].model if base_forecast else 'Ensemble'
+        dates = [point.date for point in base_forecast]
+        result = {'Base': base_forecast}
+        for name, array in zip(ScenarioGenerator.SCENARIOS[1:], scenarios[1:]):
+            result[name] = points_from_array(array, dates, name, model)
 
-        for point in base_forecast:
-            # Optimistic: use lower confidence bound
-            optimistic = ForecastPoint(
-                month=point.month,
-                year=point.year,
-                date=point.date,
-                forecast_index=point.lower_80_ci,
-                lower_95_ci=point.lower_95_ci,
-                upper_95_ci=point.forecast_index,
-                lower_80_ci=point.lower_80_ci,
-                upper_80_ci=point.forecast_index,
-                yoy_inflation_rate=round(((point.lower_80_ci / 107.5) - 1) * 100, 2),  # Approx prior year
-                scenario='Optimistic',
-                model=point.model
-            )
-
-            # Pessimistic: use upper confidence bound
-            pessimistic = ForecastPoint(
-                month=point.month,
-                year=point.year,
-                date=point.date,
-                forecast_index=point.upper_80_ci,
-                lower_95_ci=point.forecast_index,
-                upper_95_ci=point.upper_95_ci,
-                lower_80_ci=point.forecast_index,
-                upper_80_ci=point.upper_80_ci,
-                yoy_inflation_rate=round(((point.upper_80_ci / 107.5) - 1) * 100, 2),  # Approx prior year
-                scenario='Pessimistic',
-                model=point.model
-            )
-
-            scenarios['Optimistic'].append(optimistic)
-            scenarios['Pessimistic'].append(pessimistic)
-
-        logger.info(f"Generated 3 scenarios with {len(scenarios['Base'])} points each")
-        return scenarios
+        logger.info(f"Generated 3 scenarios with {len(result['Base'])} points each")
+        return result
 
 
 # ============================================================================
@@ -913,6 +1830,260 @@ class ForecastReportGenerator:
         }
 
 
+# ============================================================================
+# MONTE CARLO SIMULATION
+# ============================================================================
+
+# Simulated paths per series and the seed that makes runs reproducible
+SIMULATION_PATHS = 10000
+SIMULATION_SEED = 42
+
+# Upper bound on the simulation working set; series are simulated in chunks that fit
+SIMULATION_MAX_BYTES = 256 * 1024 * 1024
+
+# Fan chart quantiles and the YoY inflation thresholds (%) for exceedance tables
+FAN_QUANTILES = (0.05, 0.10, 0.25, 0.50, 0.75, 0.90, 0.95)
+INFLATION_TARGETS = (2.0, 4.0, 6.0)
+
+
+class MonteCarloSimulator:
+    """
+    Bootstrapped forecast paths for fitted SARIMA models.
+
+    Each path resamples the model's standardized one-step innovations and
+    propagates them through its psi-weights, so the paths of a whole chunk of
+    series are one (series, path, step) x (series, step, horizon) matrix
+    product added to the point forecasts. Fans are empirical quantiles of the
+    paths; exceedance tables are the share of paths whose YoY inflation is
+    above each target. Every series draws from its own stream spawned from
+    `seed`, so results do not depend on how series are chunked.
+    """
+
+    def __init__(
+        self,
+        forecasters: Dict[str, 'SARIMAForecaster'],
+        periods: int = 12,
+        n_paths: int = SIMULATION_PATHS,
+        seed: int = SIMULATION_SEED,
+        quantiles: Tuple[float, ...] = FAN_QUANTILES,
+        targets: Tuple[float, ...] = INFLATION_TARGETS,
+        max_bytes: int = SIMULATION_MAX_BYTES
+    ):
+        """
+        Args:
+            forecasters: Fitted SARIMA forecasters by key (unfitted ones are skipped)
+            periods: Forecast horizon in months
+            n_paths: Simulated paths per series
+            seed: Random seed
+            quantiles: Quantile levels of the fans
+            targets: YoY inflation thresholds (%) for exceedance probabilities
+            max_bytes: Approximate memory bound for one chunk of series
+        """
+        self.forecasters = {key: f for key, f in forecasters.items() if f.estimate is not None}
+        self.periods = periods
+        self.n_paths = n_paths
+        self.seed = seed
+        self.quantiles = np.asarray(quantiles, dtype=float)
+        self.targets = np.asarray(targets, dtype=float)
+        self.max_bytes = max_bytes
+
+    def _chunk_size(self) -> int:
+        # Draws, paths and the 12-month-extended path array per series
+        per_series = self.n_paths * (3 * self.periods + 12) * 8
+        return max(1, self.max_bytes // per_series)
+
+    def run(self) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Simulate every series.
+
+        Returns:
+            (fan, exceedance): fan has one row per series, horizon and variable
+            ('index' or 'yoy_inflation') with mean and q05...q95 columns;
+            exceedance has one row per series and horizon with a
+            p_above_<target> probability column per target.
+        """
+        keys = list(self.forecasters)
+        streams = np.random.SeedSequence(self.seed).spawn(len(keys))
+        chunk = self._chunk_size()
+        logger.info(f"Simulating {self.n_paths} paths for {len(keys)} series in chunks of {chunk}...")
+
+        fans, exceedances = [], []
+        for start in range(0, len(keys), chunk):
+            chunk_keys = keys[start:start + chunk]
+            fan, exceedance = self._simulate(chunk_keys, streams[start:start + chunk])
+            fans.append(fan)
+            exceedances.append(exceedance)
+
+        if not fans:
+            return pd.DataFrame(), pd.DataFrame()
+        fan = pd.concat(fans, ignore_index=True).sort_values('variable', kind='stable', ignore_index=True)
+        return fan, pd.concat(exceedances, ignore_index=True)
+
+    def _simulate(self, keys: List[str], streams: List[np.random.SeedSequence]) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        h = self.periods
+        forecasts = np.empty((len(keys), h))
+        psi_matrices = np.zeros((len(keys), h, h))
+        draws = np.empty((len(keys), self.n_paths, h))
+        history = np.empty((len(keys), 12))
+        steps = np.arange(h)
+        lags = steps[:, None] - steps[None, :]
+
+        for i, (key, stream) in enumerate(zip(keys, streams)):
+            forecaster = self.forecasters[key]
+            values = forecaster.series.to_numpy(dtype=float)
+            estimate = forecaster.estimate
+            forecasts[i] = sarima_forecast(values, estimate, h)[0]
+            psi = sarima_psi_weights(estimate, h)
+            # Row t of the matrix maps innovations 0..t onto step t
+            psi_matrices[i] = np.where(lags >= 0, psi[np.clip(lags, 0, None)], 0.0)
+            innovations = sarima_standardized_innovations(values, estimate)
+            innovations = innovations - innovations.mean()
+            draws[i] = np.random.default_rng(stream).choice(innovations, size=(self.n_paths, h))
+            history[i] = values[-12:]
+
+        paths = forecasts[:, None, :] + draws @ psi_matrices.transpose(0, 2, 1)
+
+        # YoY inflation against the observed or simulated value 12 months earlier
+        extended = np.concatenate([np.broadcast_to(history[:, None, :], (len(keys), self.n_paths, 12)), paths], axis=2)
+        yoy = (extended[:, :, 12:] / extended[:, :, :-12] - 1) * 100
+
+        last_dates = [self.forecasters[key].series.index[-1] for key in keys]
+        base = pd.DataFrame({
+            'series': np.repeat(keys, h),
+            'horizon': np.tile(steps + 1, len(keys)),
+            'date': [last + pd.DateOffset(months=i + 1) for last in last_dates for i in range(h)],
+        })
+
+        quantile_columns = [f"q{round(q * 100):02d}" for q in self.quantiles]
+        fan_frames = []
+        for variable, sample in (('index', paths), ('yoy_inflation', yoy)):
+            frame = base.copy()
+            frame['variable'] = variable
+            frame['mean'] = sample.mean(axis=1).ravel()
+            levels = np.quantile(sample, self.quantiles, axis=1)  # (quantile, series, horizon)
+            for column, level in zip(quantile_columns, levels):
+                frame[column] = level.ravel()
+            fan_frames.append(frame)
+
+        exceedance = base.copy()
+        above = (yoy[None, ...] > self.targets[:, None, None, None]).mean(axis=2)  # (target, series, horizon)
+        for target, probability in zip(self.targets, above):
+            exceedance[f"p_above_{target:g}"] = probability.ravel()
+
+        return pd.concat(fan_frames, ignore_index=True), exceedance
+
+
+# ============================================================================
+# FORECAST CACHE
+# ============================================================================
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "forecast_cache.sqlite")
+
+# Bump when model code changes in a way that invalidates stored parameters
+FORECAST_CACHE_VERSION = 1
+
+# Consecutive incremental updates before parameters are re-estimated from scratch
+MAX_CACHED_UPDATES = 12
+
+
+def series_fingerprint(series: pd.Series, config: Dict) -> str:
+    """SHA-256 of the model config, observation dates and values"""
+    digest = hashlib.sha256(json.dumps(config, sort_keys=True).encode())
+    digest.update(series.index.values.astype('datetime64[s]').astype(np.int64).tobytes())
+    digest.update(series.to_numpy(dtype=np.float64).tobytes())
+    return digest.hexdigest()
+
+
+class ForecastCache:
+    """
+    SQLite store of fitted model parameters and forecasts per series, keyed
+    by a fingerprint of (series values, model config).
+
+    lookup() classifies a series as:
+    - "reused": identical inputs; stored parameters are used as they are
+    - "updated": the stored series plus up to `max_new_months` new months;
+      stored parameters are rolled forward over the new months (no order
+      search or re-estimation)
+    - "refit": anything else (new series, revised history, changed config,
+      or `max_updates` updates in a row); models are fitted from scratch
+    """
+
+    REUSED = 'reused'
+    UPDATED = 'updated'
+    REFIT = 'refit'
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, max_new_months: int = 1, max_updates: int = MAX_CACHED_UPDATES):
+        self.path = path
+        self.max_new_months = max_new_months
+        self.max_updates = max_updates
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS forecast_cache (
+                series_key TEXT PRIMARY KEY,
+                fingerprint TEXT NOT NULL,
+                nobs INTEGER NOT NULL,
+                config TEXT NOT NULL,
+                state TEXT NOT NULL,
+                forecast TEXT NOT NULL,
+                updates INTEGER NOT NULL DEFAULT 0,
+                stored_at TEXT NOT NULL
+            )
+        """)
+        self.conn.commit()
+
+    def lookup(self, key: str, series: pd.Series, config: Dict) -> Tuple[str, Optional[Dict]]:
+        """
+        Returns (status, entry); entry has 'state' (model parameters),
+        'forecast' ((horizon, model, field) array) and 'updates', and is None
+        for "refit".
+        """
+        row = self.conn.execute(
+            "SELECT fingerprint, nobs, config, state, forecast, updates FROM forecast_cache WHERE series_key = ?",
+            (key,)
+        ).fetchone()
+        if row is None:
+            return self.REFIT, None
+
+        fingerprint, nobs, stored_config, state, forecast, updates = row
+        if stored_config != json.dumps(config, sort_keys=True):
+            return self.REFIT, None
+
+        entry = {
+            'state': json.loads(state),
+            'forecast': np.array(json.loads(forecast), dtype=float),
+            'updates': updates,
+        }
+        if series_fingerprint(series, config) == fingerprint:
+            return self.REUSED, entry
+
+        new_months = len(series) - nobs
+        if (0 < new_months <= self.max_new_months and updates < self.max_updates
+                and series_fingerprint(series.iloc[:nobs], config) == fingerprint):
+            return self.UPDATED, entry
+
+        return self.REFIT, None
+
+    def store(self, key: str, series: pd.Series, config: Dict, state: Dict, forecast: np.ndarray, updates: int = 0):
+        """Persist parameters and forecasts for the series as it is now"""
+        self.conn.execute(
+            "INSERT OR REPLACE INTO forecast_cache VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                key,
+                series_fingerprint(series, config),
+                len(series),
+                json.dumps(config, sort_keys=True),
+                json.dumps(state),
+                json.dumps(np.where(np.isnan(forecast), None, forecast).tolist()),
+                updates,
+                datetime.now().isoformat(timespec='seconds'),
+            )
+        )
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+
 # ============================================================================
 # MAIN FORECASTING PIPELINE
 # ============================================================================
@@ -933,13 +2104,14 @@ class CPIForecastingPipeline:
         self.preprocessor = TimeSeriesPreprocessor()
         self.forecasters = {}
         self.forecasts = {}
+        self.forecast_array = None  # (horizon, model, field), see FORECAST_FIELDS
         self.diagnostics = {}
 
         logger.info(f"Initializing forecasting pipeline for {sector} sector")
 
     def prepare_training_data(self) -> pd.Series:
         """
-        Prepare training data (Jan 2020 - Dec 2024)
+        Prepare training data (Jan 2020 to the latest month in the data)
 
         Returns:
             Pandas Series with CPI values indexed by date
@@ -955,11 +2127,9 @@ class CPIForecastingPipeline:
         # Sort by date
         sector_data = sector_data.sort_values('date')
 
-        # Filter training period: Jan 2020 - Dec 2024
-        training_data = sector_data[
-            (sector_data['date'] >= pd.Timestamp('2020-01-01')) &
-            (sector_data['date'] <= pd.Timestamp('2024-12-31'))
-        ].copy()
+        # Filter training period: Jan 2020 onwards, ending with the latest
+        # month loaded, so new months reach the models and ForecastCache
+        training_data = sector_data[sector_data['date'] >= pd.Timestamp('2020-01-01')].copy()
 
         # Create time series
         series = training_data.set_index('date')['index_value']
@@ -969,10 +2139,29 @@ class CPIForecastingPipeline:
 
         return series
 
-    def run_forecasting(self) -> Dict:
+    def run_forecasting(
+        self,
+        sarima_order: Optional[Tuple[int, ...]] = None,
+        ensemble_weights: Optional[Dict[str, float]] = None,
+        cached_state: Optional[Dict] = None,
+        cached_forecast: Optional[np.ndarray] = None
+    ) -> Dict:
         """
         Run complete forecasting pipeline
 
+        Args:
+            sarima_order: (p, d, q, P, D, Q) already chosen by a shared
+                          SARIMAOrderSearch; searched here when omitted
+            ensemble_weights: Ensemble weight by model name ('SARIMA',
+                              'ExponentialSmoothing', 'LinearTrend'); 1.0 each
+                              when omitted
+            cached_state: Stored model parameters (see model_state) to use
+                          instead of fitting, e.g. from ForecastCache
+            cached_forecast: Stored (horizon, model, field) forecasts of an
+                             unchanged series (ForecastCache "reused"), used
+                             instead of forecasting with each model; needs
+                             cached_state
+
         Returns:
             Dictionary with forecasts, diagnostics, and summary
         """
@@ -994,58 +2183,70 @@ class CPIForecastingPipeline:
         logger.info(f"  Stationarity test result: {stationarity['note']}")
         logger.info("")
 
-        # Step 3: Fit SARIMA model
+        # Step 3: Fit SARIMA model (or restore stored parameters)
         logger.info("Fitting SARIMA model...")
         sarima = SARIMAForecaster(training_series, name="General Index")
-        p, d, q, P, D, Q = sarima.auto_select_parameters()
-        sarima.fit(p=p, d=d, q=q, P=P, D=D, Q=Q, seasonal_period=12)
+        if cached_state:
+            sarima.restore(cached_state['sarima_order'], cached_state['sarima_params'], cached_state['sarima_mean'])
+        else:
+            p, d, q, P, D, Q = sarima_order or sarima.auto_select_parameters()
+            sarima.fit(p=p, d=d, q=q, P=P, D=D, Q=Q, seasonal_period=12)
 
         self.forecasters['SARIMA'] = sarima
         self.diagnostics['SARIMA'] = sarima.diagnostics
-
-        sarima_forecast = sarima.forecast_periods(periods=12)
         logger.info("")
 
         # Step 4: Fit Exponential Smoothing model
         logger.info("Fitting Exponential Smoothing model...")
         exp_smooth = ExponentialSmoothingForecaster(training_series)
-        exp_smooth.fit()
+        if cached_state:
+            exp_smooth.restore(*cached_state['exp_smoothing_params'])
+        else:
+            exp_smooth.fit()
 
         self.forecasters['ExponentialSmoothing'] = exp_smooth
-        exp_smooth_forecast = exp_smooth.forecast_periods(periods=12)
         logger.info("")
 
-        # Step 5: Fit Linear Trend model
-        logger.info("Fitting Linear Trend model...")
-        linear = LinearTrendForecaster(training_series)
-        linear.fit()
-
-        self.forecasters['LinearTrend'] = linear
-        linear_forecast = linear.forecast_periods(periods=12)
+        # Step 5: Model forecasts as a (horizon, model, field) array, stored
+        # ones for an unchanged series
+        models = ['SARIMA', 'ExponentialSmoothing', 'LinearTrend']
+        if cached_forecast is not None:
+            logger.info("Using stored forecasts...")
+            self.forecast_array = np.asarray(cached_forecast, dtype=float)
+        else:
+            logger.info("Fitting Linear Trend model...")
+            linear = LinearTrendForecaster(training_series)
+            linear.fit()
+            self.forecasters['LinearTrend'] = linear
+
+            logger.info("Forecasting with each model...")
+            self.forecast_array = stack_forecasts(
+                *(self.forecasters[name].forecast_periods(periods=12) for name in models), periods=12
+            )
         logger.info("")
 
-        # Step 6: Ensemble forecast (average of models)
+        # Step 6: Ensemble forecast (weighted average of models)
         logger.info("Creating ensemble forecast...")
-        ensemble_forecast = self._create_ensemble_forecast(
-            sarima_forecast, exp_smooth_forecast, linear_forecast
-        )
+        weights = [(ensemble_weights or {}).get(name, 1.0) for name in models]
+        ensemble = ensemble_array(self.forecast_array, weights)
         logger.info("")
 
         # Step 7: Generate scenarios
         logger.info("Generating scenarios...")
-        scenarios = ScenarioGenerator.generate_scenarios(
-            ensemble_forecast,
-            {'lower_80': None, 'upper_80': None}
-        )
+        scenario_arrays = ScenarioGenerator.scenario_arrays(ensemble)
         logger.info("")
 
         # Step 8: Generate reports
         logger.info("Generating reports...")
-        self.forecasts = scenarios
+        dates = forecast_dates(training_series.index[-1], len(ensemble))
+        self.forecasts = {
+            name: points_from_array(array, dates, name, 'Ensemble')
+            for name, array in zip(ScenarioGenerator.SCENARIOS, scenario_arrays)
+        }
 
         # Combine all forecasts
         all_forecasts = []
-        for scenario_name, points in scenarios.items():
+        for scenario_name, points in self.forecasts.items():
             all_forecasts.extend(points)
 
         # Summary statistics
@@ -1071,58 +2272,336 @@ class CPIForecastingPipeline:
             'summary_statistics': summary
         }
 
-    def _create_ensemble_forecast(self, *forecasts) -> List[ForecastPoint]:
+    @staticmethod
+    def model_config(ensemble_weights: Optional[Dict[str, float]] = None) -> Dict:
+        """Model settings that, with the input series, determine the forecasts"""
+        return {
+            'version': FORECAST_CACHE_VERSION,
+            'seasonal_period': 12,
+            'periods': 12,
+            'exp_smoothing': 'multiplicative',
+            'ensemble_weights': ensemble_weights or {},
+        }
+
+    def model_state(self) -> Optional[Dict]:
+        """Fitted parameters needed to restore the models without refitting"""
+        sarima = self.forecasters.get('SARIMA')
+        exp_smooth = self.forecasters.get('ExponentialSmoothing')
+        if sarima is None or sarima.estimate is None or exp_smooth is None or exp_smooth.fitted_model is None:
+            return None
+        return {
+            'sarima_order': list(sarima.estimate.order),
+            'sarima_params': sarima.estimate.params.tolist(),
+            'sarima_mean': sarima.estimate.mean,
+            'exp_smoothing_params': [exp_smooth.alpha, exp_smooth.beta, exp_smooth.gamma],
+        }
+
+    def run_simulation(
+        self,
+        n_paths: int = SIMULATION_PATHS,
+        seed: int = SIMULATION_SEED
+    ) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Monte Carlo fan chart and inflation exceedance table for the fitted
+        SARIMA model (run_forecasting must have been called first)
+
+        Returns:
+            (fan, exceedance) as described in MonteCarloSimulator.run
+        """
+        sarima = self.forecasters.get('SARIMA')
+        if sarima is None or sarima.estimate is None:
+            logger.warning("No fitted SARIMA model to simulate")
+            return pd.DataFrame(), pd.DataFrame()
+        return MonteCarloSimulator({self.sector: sarima}, n_paths=n_paths, seed=seed).run()
+
+    def run_backtest(
+        self,
+        sarima_order: Optional[Tuple[int, ...]] = None,
+        horizon: int = 12,
+        min_train: int = 36,
+        max_workers: Optional[int] = None
+    ) -> pd.DataFrame:
+        """
+        Rolling-origin backtest of all models on this sector's training data
+
+        Args:
+            sarima_order: Fixed (p, d, q, P, D, Q); searched on each block's
+                          training window when omitted
+            horizon: Forecast steps evaluated from each origin
+            min_train: Observations in the first training window
+            max_workers: Worker processes (1 = run in-process, None = one per CPU)
+
+        Returns:
+            MAE/RMSE/MAPE per model and horizon (see RollingOriginBacktest.metrics)
+        """
+        training_series = self.prepare_training_data()
+
+        backtest = RollingOriginBacktest(
+            {self.sector: training_series},
+            {self.sector: sarima_order} if sarima_order else None,
+            horizon=horizon,
+            min_train=min_train,
+            max_workers=max_workers
+        )
+        return backtest.run()
+
+    def _create_ensemble_forecast(self, *forecasts, weights: Optional[List[float]] = None) -> List[ForecastPoint]:
         """
         Create ensemble forecast by averaging multiple models
 
         Args:
             *forecasts: Variable number of forecast lists
+            weights: Model weights in the order of `forecasts` (equal if omitted)
 
         Returns:
             Ensemble forecast points
         """
-        # Average forecast values across models
-        ensemble = []
-
         if not forecasts or not forecasts[0]:
             logger.warning("No forecasts available for ensemble")
-            return ensemble
+            return []
 
-        num_periods = len(forecasts[0])
+        ensemble = ensemble_array(stack_forecasts(*forecasts), weights)
+        return points_from_array(ensemble, [point.date for point in forecasts[0]], 'Base', 'Ensemble')
 
-        for i in range(num_periods):
-            # Get all forecasts for period i
-            points_at_i = [f[i] for f in forecasts if f and i < len(f)]
 
-            if not points_at_i:
+# ============================================================================
+# ROLLING-ORIGIN BACKTESTING
+# ============================================================================
+
+BACKTEST_MODELS = ['SARIMA', 'ExponentialSmoothing', 'LinearTrend', 'Ensemble']
+
+
+def expanding_linear_trend_forecasts(values: np.ndarray, origins: np.ndarray, horizon: int) -> np.ndarray:
+    """
+    Linear trend forecasts from every expanding window values[:origin].
+
+    The OLS sums are running totals, so all origins are solved together from
+    two cumulative sums instead of one regression per window.
+
+    Returns an (origins, horizon) array.
+    """
+    values = np.asarray(values, dtype=float)
+    t = np.arange(len(values), dtype=float)
+    sum_y = np.cumsum(values)[origins - 1]
+    sum_ty = np.cumsum(t * values)[origins - 1]
+
+    n = origins.astype(float)
+    sum_t = n * (n - 1) / 2
+    sum_tt = (n - 1) * n * (2 * n - 1) / 6
+    slope = (n * sum_ty - sum_t * sum_y) / (n * sum_tt - sum_t ** 2)
+    intercept = (sum_y - slope * sum_t) / n
+
+    future_t = (n - 1)[:, None] + np.arange(1, horizon + 1)[None, :]
+    return intercept[:, None] + slope[:, None] * future_t
+
+
+def _backtest_block(task: Tuple) -> Tuple[str, np.ndarray, Optional[Tuple[int, ...]], np.ndarray, np.ndarray]:
+    """
+    Worker entry point: SARIMA and Holt-Winters forecasts for a block of
+    consecutive origins of one series.
+
+    Both models are estimated once at the first origin of the block; later
+    origins roll the fitted state forward over the new observations with the
+    parameters held fixed. With `search` set, the SARIMA order is chosen by
+    SARIMAOrderSearch on the data before that origin only.
+
+    Returns (key, origins, SARIMA order, SARIMA forecasts, Holt-Winters
+    forecasts), the forecasts as (origins, horizon) arrays (NaN where a model
+    failed).
+    """
+    key, origins, order, search, seasonal_period, horizon = task
+    values = _SHARED_SERIES[key]
+    sarima = np.full((len(origins), horizon), np.nan)
+    holt_winters = np.full((len(origins), horizon), np.nan)
+
+    start_params = None
+    if search:
+        order_search = SARIMAOrderSearch({key: pd.Series(values[:origins[0]])}, seasonal_period, max_workers=1)
+        order, aic = order_search.run()[key]
+        if np.isfinite(aic):
+            start_params = order_search.fitted[key].get(order)
+        else:
+            order = None
+
+    estimate = None
+    if order is not None:
+        try:
+            estimate = fit_sarima(values[:origins[0]], order, seasonal_period, start_params=start_params)
+        except Exception as e:
+            logger.debug(f"Backtest SARIMA{order} failed for {key} at origin {origins[0]}: {str(e)[:50]}")
+    try:
+        hw = fit_holt_winters(values[:origins[0]], seasonal_period, 'multiplicative')
+    except Exception as e:
+        logger.debug(f"Backtest Holt-Winters failed for {key} at origin {origins[0]}: {str(e)[:50]}")
+        hw = None
+
+    for row, origin in enumerate(origins):
+        window = values[:origin]
+        if estimate is not None:
+            if row:
+                estimate = sarima_update(window, estimate)
+            sarima[row] = sarima_forecast(window, estimate, horizon)[0]
+        if hw is not None:
+            if row:
+                hw = holt_winters_state(window, hw.alpha, hw.beta, hw.gamma, seasonal_period, 'multiplicative')
+            holt_winters[row] = hw.forecast(horizon)[0]
+
+    return key, origins, order, sarima, holt_winters
+
+
+class RollingOriginBacktest:
+    """
+    Expanding-window backtest of SARIMA, Holt-Winters, linear trend and their
+    ensemble over every forecast origin of one or many series.
+
+    Origins are split into blocks of `refit_every`; each block is one task on
+    a process pool (parallel across blocks and series), where parameters are
+    estimated at the block's first origin and the fitted state is rolled
+    forward for the rest. Unless fixed orders are given, the SARIMA order is
+    searched again at each block's first origin on the data before it, so no
+    test month informs the model. Linear trend forecasts for all origins come
+    from running OLS sums. Accuracy (MAE/RMSE/MAPE) is reported per model and
+    horizon.
+    """
+
+    def __init__(
+        self,
+        series: Dict[str, pd.Series],
+        orders: Optional[Dict[str, Tuple[int, ...]]] = None,
+        horizon: int = 12,
+        min_train: int = 36,
+        refit_every: int = 12,
+        seasonal_period: int = 12,
+        max_workers: Optional[int] = None,
+        executor: Optional[Executor] = None
+    ):
+        """
+        Args:
+            series: Series by key (e.g. sector or group name)
+            orders: Fixed SARIMA (p, d, q, P, D, Q) by key, where series
+                    without one skip SARIMA; searched per block when omitted.
+                    Orders selected on the full series make the backtest
+                    optimistic.
+            horizon: Forecast steps evaluated from each origin
+            min_train: Observations in the first training window
+            refit_every: Origins between parameter re-estimations
+            seasonal_period: Seasonality period (12 for monthly)
+            max_workers: Worker processes (1 = run in-process, None = one per CPU)
+            executor: Existing pool to use instead of creating one; it must have
+                      been created with initializer=_init_search_worker for the
+                      same series
+        """
+        self.series = {key: s.dropna() for key, s in series.items()}
+        self.values = {key: s.to_numpy(dtype=float) for key, s in self.series.items()}
+        self.orders = orders
+        self.horizon = horizon
+        self.min_train = max(min_train, 2 * seasonal_period)
+        self.refit_every = max(refit_every, 1)
+        self.seasonal_period = seasonal_period
+        self.max_workers = max_workers if max_workers is not None else os.cpu_count()
+        self.executor = executor
+        # Forecasts and actuals by key: {model: (origins, horizon) array}
+        self.forecasts: Dict[str, Dict[str, np.ndarray]] = {}
+        self.actuals: Dict[str, np.ndarray] = {}
+        self.origins: Dict[str, np.ndarray] = {}
+        # SARIMA order used from each block's first origin, by key: [(origin, order)]
+        self.block_orders: Dict[str, List[Tuple[int, Optional[Tuple[int, ...]]]]] = {}
+
+    def _tasks(self) -> List[Tuple]:
+        tasks = []
+        for key, values in self.values.items():
+            origins = np.arange(self.min_train, len(values))
+            self.origins[key] = origins
+            for start in range(0, len(origins), self.refit_every):
+                tasks.append((
+                    key, origins[start:start + self.refit_every],
+                    self.orders.get(key) if self.orders is not None else None,
+                    self.orders is None, self.seasonal_period, self.horizon
+                ))
+        return tasks
+
+    def run(self) -> pd.DataFrame:
+        """Run every origin and return the accuracy table (see metrics())"""
+        tasks = self._tasks()
+        logger.info(f"Backtesting {len(self.values)} series over {len(tasks)} origin blocks...")
+
+        if self.executor is not None:
+            blocks = list(self.executor.map(_backtest_block, tasks))
+        elif self.max_workers <= 1:
+            _init_search_worker(self.values)
+            blocks = [_backtest_block(task) for task in tasks]
+        else:
+            with ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=_init_search_worker,
+                initargs=(self.values,)
+            ) as executor:
+                blocks = list(executor.map(_backtest_block, tasks))
+
+        sarima = {key: [] for key in self.values}
+        holt_winters = {key: [] for key in self.values}
+        self.block_orders = {key: [] for key in self.values}
+        for key, block_origins, order, sarima_block, hw_block in blocks:
+            sarima[key].append(sarima_block)
+            holt_winters[key].append(hw_block)
+            self.block_orders[key].append((int(block_origins[0]), order))
+
+        steps = np.arange(self.horizon)
+        for key, values in self.values.items():
+            origins = self.origins[key]
+            if not len(origins):
                 continue
+            models = {
+                'SARIMA': np.vstack(sarima[key]),
+                'ExponentialSmoothing': np.vstack(holt_winters[key]),
+                'LinearTrend': expanding_linear_trend_forecasts(values, origins, self.horizon),
+            }
+            # Equal-weight average, as in CPIForecastingPipeline._create_ensemble_forecast
+            # (models that failed at an origin are left out of it)
+            models['Ensemble'] = np.nanmean(np.stack(list(models.values())), axis=0)
+            self.forecasts[key] = models
 
-            # Average key metrics
-            avg_index = np.mean([p.forecast_index for p in points_at_i])
-            avg_lower_95 = np.mean([p.lower_95_ci for p in points_at_i])
-            avg_upper_95 = np.mean([p.upper_95_ci for p in points_at_i])
-            avg_lower_80 = np.mean([p.lower_80_ci for p in points_at_i])
-            avg_upper_80 = np.mean([p.upper_80_ci for p in points_at_i])
-            avg_inflation = np.mean([p.yoy_inflation_rate for p in points_at_i])
-
-            first_point = points_at_i[0]
-            ensemble_point = ForecastPoint(
-                month=first_point.month,
-                year=first_point.year,
-                date=first_point.date,
-                forecast_index=round(avg_index, 2),
-                lower_95_ci=round(avg_lower_95, 2),
-                upper_95_ci=round(avg_upper_95, 2),
-                lower_80_ci=round(avg_lower_80, 2),
-                upper_80_ci=round(avg_upper_80, 2),
-                yoy_inflation_rate=round(avg_inflation, 2),
-                scenario='Base',
-                model='Ensemble'
-            )
+            targets = origins[:, None] + steps[None, :]
+            self.actuals[key] = np.where(targets < len(values), values[np.minimum(targets, len(values) - 1)], np.nan)
 
-            ensemble.append(ensemble_point)
+        return self.metrics()
 
-        return ensemble
+    def metrics(self) -> pd.DataFrame:
+        """
+        Accuracy per series, model and horizon: number of evaluated origins,
+        MAE, RMSE and MAPE (%).
+        """
+        frames = []
+        horizons = np.arange(1, self.horizon + 1)
+        for key, models in self.forecasts.items():
+            actual = self.actuals[key]
+            for model in BACKTEST_MODELS:
+                errors = models[model] - actual
+                valid = ~np.isnan(errors)
+                count = valid.sum(axis=0)
+                with np.errstate(invalid='ignore', divide='ignore'):
+                    mae = np.nansum(np.abs(errors), axis=0) / count
+                    rmse = np.sqrt(np.nansum(errors ** 2, axis=0) / count)
+                    mape = np.nansum(np.abs(errors / actual), axis=0) / count * 100
+                frames.append(pd.DataFrame({
+                    'series': key,
+                    'model': model,
+                    'horizon': horizons,
+                    'origins': count,
+                    'mae': mae,
+                    'rmse': rmse,
+                    'mape': mape,
+                }))
+
+        if not frames:
+            return pd.DataFrame(columns=['series', 'model', 'horizon', 'origins', 'mae', 'rmse', 'mape'])
+        return pd.concat(frames, ignore_index=True)
+
+    @staticmethod
+    def summary_table(metrics: pd.DataFrame, metric: str = 'rmse') -> pd.DataFrame:
+        """One series' metric as a horizon x model table"""
+        table = metrics.pivot(index='horizon', columns='model', values=metric)
+        return table[[m for m in BACKTEST_MODELS if m in table.columns]].round(3)
 
 
 # ============================================================================
@@ -1189,6 +2668,8 @@ def save_forecast_results(results: Dict, output_dir: str = '/Users/ompragash/Git
             f.write("### Summary\n\n")
             f.write(f"- Training Period: {sector_results.get('training_period', 'N/A')}\n")
             f.write(f"- Training Records: {sector_results.get('training_count', 'N/A')}\n")
+            if 'cache_status' in sector_results:
+                f.write(f"- Model Cache: {sector_results['cache_status']}\n")
             f.write(f"- Stationarity: {sector_results.get('stationarity', {}).get('note', 'N/A')}\n\n")
 
             # Write statistics
@@ -1210,6 +2691,37 @@ def save_forecast_results(results: Dict, output_dir: str = '/Users/ompragash/Git
                 f.write(df.to_markdown(index=False))
                 f.write("\n\n")
 
+            # Write Monte Carlo inflation risk
+            simulation = sector_results.get('simulation')
+            if simulation is not None:
+                f.write("### Inflation Risk (Monte Carlo)\n\n")
+                f.write(f"Share of {SIMULATION_PATHS:,} bootstrapped SARIMA paths (seed {SIMULATION_SEED}) "
+                        "with YoY inflation above each threshold.\n\n")
+                table = simulation['exceedance'].copy()
+                table['date'] = table['date'].dt.strftime('%b %Y')
+                f.write(table.round(3).to_markdown(index=False))
+                f.write("\n\n")
+
+            # Write backtest accuracy
+            backtest = sector_results.get('backtest')
+            if backtest is not None and not backtest.empty:
+                f.write("### Backtest Accuracy\n\n")
+                f.write("Expanding-window forecasts from every origin after the first 36 months. "
+                        "Model parameters are re-estimated every 12 origins, and the SARIMA order is "
+                        "re-selected by AIC on each training window only, so no forecast month "
+                        "informs the model it is scored on.\n\n")
+                block_orders = sector_results.get('backtest_orders', [])
+                if block_orders:
+                    labels = [
+                        f"origin {origin}: " + (f"SARIMA{order}" if order else "none")
+                        for origin, order in block_orders
+                    ]
+                    f.write(f"SARIMA orders by block: {', '.join(labels)}\n\n")
+                for metric, label in (('mae', 'MAE'), ('rmse', 'RMSE'), ('mape', 'MAPE (%)')):
+                    f.write(f"**{label} by horizon:**\n\n")
+                    f.write(RollingOriginBacktest.summary_table(backtest, metric).to_markdown())
+                    f.write("\n\n")
+
             # Write diagnostics
             diagnostics = sector_results.get('diagnostics', {})
             if diagnostics:
@@ -1236,6 +2748,17 @@ def save_forecast_results(results: Dict, output_dir: str = '/Users/ompragash/Git
         df_all.to_csv(csv_file, index=False)
         logger.info(f"Forecast data saved to {csv_file}")
 
+    # Fan chart quantiles from the Monte Carlo simulation
+    fans = [
+        sector_results['simulation']['fan'].assign(sector=sector)
+        for sector, sector_results in results.items()
+        if sector_results and 'simulation' in sector_results
+    ]
+    if fans:
+        fan_file = f"{output_dir}/PHASE4_FAN_CHART.csv"
+        pd.concat(fans, ignore_index=True).to_csv(fan_file, index=False)
+        logger.info(f"Fan chart data saved to {fan_file}")
+
 
 # ============================================================================
 # MAIN EXECUTION
@@ -1269,17 +2792,81 @@ async def main():
         logger.warning("No sectors available in data. Defaulting to Combined.")
         sectors_to_forecast = ['Combined']
 
-    for sector in sectors_to_forecast:
+    pipelines = {sector: CPIForecastingPipeline(df, sector=sector) for sector in sectors_to_forecast}
+
+    training = {}
+    for sector, pipeline in pipelines.items():
+        series = pipeline.prepare_training_data()
+        if len(series) >= 12:
+            training[sector] = series
+
+    # Reuse stored models for series that are unchanged or have one new month
+    cache = ForecastCache()
+    config = CPIForecastingPipeline.model_config()
+    cached = {sector: cache.lookup(sector, series, config) for sector, series in training.items()}
+
+    # Search SARIMA orders for the remaining sectors on one process pool
+    logger.info("Selecting SARIMA orders for all sectors...")
+    search = SARIMAOrderSearch({
+        sector: series for sector, series in training.items() if cached[sector][0] == ForecastCache.REFIT
+    })
+    orders = search.run()
+    for sector, (order, aic) in orders.items():
+        logger.info(f"  {sector}: SARIMA{order} with AIC={aic:.2f}")
+
+    for sector, pipeline in pipelines.items():
         logger.info(f"\n{'='*80}")
         logger.info(f"Forecasting for {sector} sector")
         logger.info(f"{'='*80}\n")
 
-        pipeline = CPIForecastingPipeline(df, sector=sector)
-        sector_results = pipeline.run_forecasting()
+        order = orders.get(sector)
+        status, entry = cached.get(sector, (ForecastCache.REFIT, None))
+        sector_results = pipeline.run_forecasting(
+            sarima_order=order[0] if order else None,
+            cached_state=entry['state'] if entry else None,
+            cached_forecast=entry['forecast'] if status == ForecastCache.REUSED else None
+        )
         results[sector] = sector_results
 
+        state = pipeline.model_state()
+        if sector_results and state:
+            sector_results['cache_status'] = status
+            updates = entry['updates'] + (status == ForecastCache.UPDATED) if entry else 0
+            cache.store(sector, training[sector], config, state, pipeline.forecast_array, updates)
+
         logger.info("")
 
+    cache.close()
+    for status in (ForecastCache.REUSED, ForecastCache.UPDATED, ForecastCache.REFIT):
+        sectors = [sector for sector, (s, _) in cached.items() if s == status]
+        logger.info(f"Forecast cache {status}: {', '.join(sectors) if sectors else 'none'}")
+
+    # Monte Carlo fan charts for all sectors
+    logger.info("Simulating forecast paths...")
+    simulator = MonteCarloSimulator({
+        sector: pipeline.forecasters['SARIMA']
+        for sector, pipeline in pipelines.items() if 'SARIMA' in pipeline.forecasters
+    })
+    fan, exceedance = simulator.run()
+    if not fan.empty:
+        for sector in exceedance['series'].unique():
+            if results.get(sector):
+                results[sector]['simulation'] = {
+                    'fan': fan[fan['series'] == sector].drop(columns='series'),
+                    'exceedance': exceedance[exceedance['series'] == sector].drop(columns='series'),
+                }
+
+    # Rolling-origin backtest of all sectors on one process pool
+    logger.info("Backtesting models over rolling forecast origins...")
+    # (orders are searched again on each block's training window, not taken from the fits above)
+    backtest = RollingOriginBacktest(training)
+    backtest_metrics = backtest.run()
+    for sector, sector_metrics in backtest_metrics.groupby('series'):
+        if results.get(sector):
+            results[sector]['backtest'] = sector_metrics.drop(columns='series')
+            results[sector]['backtest_orders'] = backtest.block_orders.get(sector, [])
+        logger.info(f"  {sector} RMSE by horizon:\n{RollingOriginBacktest.summary_table(sector_metrics)}")
+
     # Save results
     logger.info("\nSaving forecast results...")
     save_forecast_results(results)
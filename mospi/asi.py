@@ -0,0 +1,68 @@
+"""
+ASI classification stitching
+Maps a range of ASI data years onto the NIC classification years that cover
+them, so one request can span several classifications
+"""
+
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+# NIC classification year -> (first, last) financial year of ASI data published under it
+ASI_CLASSIFICATION_RANGES = {
+    "1987": ("1992-93", "1997-98"),
+    "1998": ("1998-99", "2003-04"),
+    "2004": ("2004-05", "2007-08"),
+    "2008": ("2008-09", "2023-24"),
+}
+
+_FINANCIAL_YEAR = re.compile(r"(\d{4})-(\d{2})")
+_YEAR = re.compile(r"(\d{4})")
+
+
+def financial_year(start: int) -> str:
+    """Financial year label for the year it starts in: 2008 -> "2008-09"."""
+    return f"{start}-{(start + 1) % 100:02d}"
+
+
+def parse_financial_year(value: Any) -> Optional[int]:
+    """Starting calendar year of "2008-09" or "2008"; None if there is no year."""
+    match = _YEAR.search(str(value)) if value is not None else None
+    return int(match.group(1)) if match else None
+
+
+def plan_classification_years(start_year: str, end_year: str) -> List[Tuple[str, List[str]]]:
+    """
+    Split a financial-year range into (classification_year, [financial years]) blocks, oldest first.
+
+    Years outside every classification range are dropped.
+    """
+    first, last = parse_financial_year(start_year), parse_financial_year(end_year)
+    if first is None or last is None:
+        return []
+    first, last = min(first, last), max(first, last)
+    plan = []
+    for classification_year, (range_start, range_end) in ASI_CLASSIFICATION_RANGES.items():
+        lo = max(first, parse_financial_year(range_start))
+        hi = min(last, parse_financial_year(range_end))
+        if lo <= hi:
+            plan.append((classification_year, [financial_year(year) for year in range(lo, hi + 1)]))
+    return plan
+
+
+def metadata_years(metadata: Dict[str, Any]) -> Optional[List[str]]:
+    """
+    Financial years listed in a get_asi_filters response, or None when the
+    response has no year list (e.g. an upstream error).
+    """
+    filters = metadata.get("data", metadata) if isinstance(metadata, dict) else None
+    entries = filters.get("year") if isinstance(filters, dict) else None
+    if not isinstance(entries, list):
+        return None
+    years = set()
+    for entry in entries:
+        values = entry.values() if isinstance(entry, dict) else [entry]
+        for value in values:
+            match = _FINANCIAL_YEAR.search(str(value))
+            if match:
+                years.add(match.group(0))
+    return sorted(years)
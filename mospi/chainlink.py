@@ -0,0 +1,84 @@
+"""
+Base-year chain-linking
+Splices index series published under successive base years into one series
+on the newest base, using the ratio of the two series over their overlap
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from .timeseries import format_period
+
+# Base years available per routed dataset, newest first
+BASE_YEARS = {
+    "CPI_GROUP": ("2012", "2010"),
+    "CPI_ITEM": ("2012", "2010"),
+    "IIP_MONTHLY": ("2011-12", "2004-05", "1993-94"),
+    "IIP_ANNUAL": ("2011-12", "2004-05", "1993-94"),
+}
+
+# Row columns holding the base year, left out when matching series across bases
+BASE_YEAR_FIELDS = ("base_year", "baseyear")
+
+Period = Tuple[int, int, int]
+
+
+def link_factor(newer: Dict[Period, float], older: Dict[Period, float]) -> Optional[Tuple[float, List[Period]]]:
+    """
+    Factor that puts `older` on the base of `newer`: mean(newer) / mean(older)
+    over the periods both cover. None when they do not overlap.
+    """
+    overlap = sorted(newer.keys() & older.keys())
+    if not overlap:
+        return None
+    older_total = sum(older[period] for period in overlap)
+    if not older_total:
+        return None
+    return sum(newer[period] for period in overlap) / older_total, overlap
+
+
+def chain_link(segments: List[Tuple[str, List[Period], List[float]]]) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Splice one series' base-year segments, given newest base first.
+
+    Each older segment is rescaled by its link factor to the (already linked)
+    newer part and contributes only the periods before the newer part starts.
+    Linking stops at the first segment that does not overlap.
+
+    Returns:
+        (points oldest first as {"period", "value", "source_base_year"},
+         links as {"base_year", "linked_to", "factor", "overlap_start", "overlap_end", "overlap_points"}
+         or {"base_year", "linked_to", "error"})
+    """
+    newest_base, periods, values = segments[0]
+    linked = dict(zip(periods, values))
+    source = {period: newest_base for period in periods}
+    links = []
+    previous_base = newest_base
+
+    for base_year, periods, values in segments[1:]:
+        older = dict(zip(periods, values))
+        found = link_factor(linked, older)
+        if found is None:
+            links.append({"base_year": base_year, "linked_to": previous_base, "error": "No overlapping periods"})
+            break
+        factor, overlap = found
+        start = min(linked)
+        for period, value in older.items():
+            if period < start:
+                linked[period] = value * factor
+                source[period] = base_year
+        links.append({
+            "base_year": base_year,
+            "linked_to": previous_base,
+            "factor": round(factor, 6),
+            "overlap_start": format_period(overlap[0]),
+            "overlap_end": format_period(overlap[-1]),
+            "overlap_points": len(overlap),
+        })
+        previous_base = base_year
+
+    points = [
+        {"period": format_period(period), "value": round(linked[period], 3), "source_base_year": source[period]}
+        for period in sorted(linked)
+    ]
+    return points, links
@@ -0,0 +1,95 @@
+"""
+Structural break detection
+Finds shifts in the mean and variance of a series with PELT (pruned exact
+dynamic programming), so break dates can be returned without shipping the
+series itself; shared by 5_detect_structural_breaks and the Phase 3 analysis
+"""
+
+import math
+from typing import Any, Dict, List, Optional, Sequence
+
+# Shortest segment (in periods) between two breaks
+BREAK_MIN_SEGMENT = 6
+
+
+def pelt_changepoints(
+    values: Sequence[float],
+    penalty: Optional[float] = None,
+    min_size: int = BREAK_MIN_SEGMENT
+) -> List[int]:
+    """
+    Changepoints in the mean and variance of a series, expected O(n).
+
+    The segment cost is the Gaussian negative log-likelihood with its own mean
+    and variance, m * log(variance), computed from prefix sums. Candidate
+    segment starts that can no longer be optimal are pruned after each step.
+
+    Args:
+        values: Series values in time order
+        penalty: Cost of adding a changepoint (default 3 * log(n))
+        min_size: Shortest allowed segment
+
+    Returns:
+        Start positions of the new segments (excluding 0), ascending
+    """
+    n = len(values)
+    if n < 2 * min_size:
+        return []
+    if penalty is None:
+        penalty = 3 * math.log(n)
+
+    s1 = [0.0] * (n + 1)
+    s2 = [0.0] * (n + 1)
+    for i, x in enumerate(values):
+        s1[i + 1] = s1[i] + x
+        s2[i + 1] = s2[i] + x * x
+    # Variance floor so flat stretches do not produce -inf costs
+    floor = max((s2[n] - s1[n] * s1[n] / n) / n, 1e-12) * 1e-6
+
+    best = [math.inf] * (n + 1)
+    best[0] = -penalty
+    previous = [0] * (n + 1)
+    candidates: List[int] = []
+
+    for end in range(min_size, n + 1):
+        # Position end - min_size can now start a segment ending here
+        start = end - min_size
+        if start == 0 or start >= min_size:
+            candidates.append(start)
+        costs = []
+        for begin in candidates:
+            m = end - begin
+            total = s1[end] - s1[begin]
+            variance = max((s2[end] - s2[begin] - total * total / m) / m, floor)
+            costs.append(best[begin] + m * math.log(variance))
+        i = min(range(len(costs)), key=costs.__getitem__)
+        best[end] = costs[i] + penalty
+        previous[end] = candidates[i]
+        candidates = [begin for begin, cost in zip(candidates, costs) if cost <= best[end]]
+
+    changepoints = []
+    position = previous[n]
+    while position > 0:
+        changepoints.append(position)
+        position = previous[position]
+    return changepoints[::-1]
+
+
+def _moments(values: Sequence[float]) -> Dict[str, float]:
+    mean = sum(values) / len(values)
+    variance = sum((x - mean) ** 2 for x in values) / len(values)
+    return {"mean": round(mean, 4), "std": round(math.sqrt(variance), 4)}
+
+
+def describe_breaks(values: Sequence[float], changepoints: List[int]) -> List[Dict[str, Any]]:
+    """Mean/std of the segments either side of each changepoint, keyed by position."""
+    bounds = [0] + list(changepoints) + [len(values)]
+    segments = [_moments(values[a:b]) for a, b in zip(bounds, bounds[1:])]
+    return [
+        {
+            "position": position,
+            "mean_before": segments[i]["mean"], "mean_after": segments[i + 1]["mean"],
+            "std_before": segments[i]["std"], "std_after": segments[i + 1]["std"],
+        }
+        for i, position in enumerate(changepoints)
+    ]
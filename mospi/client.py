@@ -3,17 +3,37 @@ MoSPI API Client
 Handles all API calls to the MoSPI data portal
 """
 
+import os
 import requests
+from opentelemetry import trace
 from typing import Optional, Dict, Any
 
+from . import jsonutil
+
+# Upper bound on the decompressed size of a single get_data response.
+# Override with MOSPI_MAX_RESPONSE_BYTES (bytes).
+DEFAULT_MAX_RESPONSE_BYTES = int(os.environ.get("MOSPI_MAX_RESPONSE_BYTES", 50 * 1024 * 1024))
+
+# Size of each streamed (decompressed) chunk read from the upstream response
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+class ResponseTooLargeError(Exception):
+    """Raised when a response exceeds the configured decompressed size limit."""
+
 
 class MoSPI:
     """
     A unified class to interact with various MoSPI APIs.
     """
 
-    def __init__(self, base_url: str = "https://api.mospi.gov.in"):
+    def __init__(
+        self,
+        base_url: str = "https://api.mospi.gov.in",
+        max_response_bytes: int = DEFAULT_MAX_RESPONSE_BYTES
+    ):
         self.base_url = base_url
+        self.max_response_bytes = max_response_bytes
         self.api_endpoints = {
             "PLFS": "/api/plfs/getData",
             "CPI_Group": "/api/cpi/getCPIIndex",
@@ -41,18 +61,63 @@ class MoSPI:
             params = {k: v for k, v in params.items() if v is not None}
 
         try:
-            response = requests.get(full_url, params=params, timeout=30)
-            response.raise_for_status()
+            with requests.get(
+                full_url,
+                params=params,
+                timeout=30,
+                stream=True
+            ) as response:
+                response.raise_for_status()
+                body = self._read_limited(response)
+                self._record_transfer(dataset_name, response.raw.tell(), len(body))
 
             # Check if CSV format was requested
             format_param = params.get("Format", "JSON") if params else "JSON"
             if format_param == "CSV":
-                return {"data": response.text, "format": "CSV"}
+                return {"data": body.decode(response.encoding or "utf-8"), "format": "CSV"}
             else:
-                return response.json()
+                return jsonutil.loads(body)
+        except ResponseTooLargeError as e:
+            return {
+                "error": str(e),
+                "_hint": "Narrow the filters or pass a smaller limit to reduce the response size.",
+            }
         except Exception as e:
             return {"error": f"An error occurred: {e}"}
 
+    def _read_limited(self, response: requests.Response) -> bytes:
+        """
+        Read a streamed response body, decompressing as it arrives.
+
+        Stops and raises ResponseTooLargeError as soon as the decompressed size
+        passes max_response_bytes, so an oversized payload is never fully buffered.
+        """
+        limit = self.max_response_bytes
+        declared = response.headers.get("Content-Length")
+        if declared and declared.isdigit() and not response.headers.get("Content-Encoding"):
+            if int(declared) > limit:
+                raise ResponseTooLargeError(
+                    f"Response size {int(declared)} bytes exceeds the {limit} byte limit."
+                )
+
+        chunks = []
+        total = 0
+        for chunk in response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+            total += len(chunk)
+            if total > limit:
+                raise ResponseTooLargeError(
+                    f"Response exceeded the {limit} byte decompressed size limit."
+                )
+            chunks.append(chunk)
+        return b"".join(chunks)
+
+    def _record_transfer(self, dataset_name: str, compressed: int, decompressed: int) -> None:
+        """Record wire vs decompressed byte counts for a dataset endpoint on the active span."""
+        span = trace.get_current_span()
+        span.set_attribute("mospi.dataset", dataset_name)
+        span.set_attribute("mospi.response.compressed_bytes", compressed)
+        span.set_attribute("mospi.response.decompressed_bytes", decompressed)
+
     # =========================================================================
     # PLFS Metadata Methods
     # =========================================================================
@@ -65,7 +130,7 @@ class MoSPI:
             for fc, label in [(1, "Annual"), (2, "Quarterly"), (3, "Monthly")]:
                 response = requests.get(url, params={"frequency_code": fc}, timeout=30)
                 response.raise_for_status()
-                data = response.json()
+                data = jsonutil.loads(response.content)
                 result[f"frequency_code_{fc}_{label}"] = data.get("data", [])
             return {
                 "indicators_by_frequency": result,
@@ -76,7 +141,7 @@ class MoSPI:
                          "Pick the frequency_code whose indicator set matches the query.",
                 "statusCode": True,
             }
-        except requests.RequestException as e:
+        except (requests.RequestException, ValueError) as e:
             return {"error": str(e), "statusCode": False}
 
     def get_plfs_filters(
@@ -103,8 +168,8 @@ class MoSPI:
                 timeout=30
             )
             response.raise_for_status()
-            return response.json()
-        except requests.RequestException as e:
+            return jsonutil.loads(response.content)
+        except (requests.RequestException, ValueError) as e:
             return {"error": str(e), "statusCode": False}
 
     # =========================================================================
@@ -134,8 +199,8 @@ class MoSPI:
                 timeout=30
             )
             response.raise_for_status()
-            return response.json()
-        except requests.RequestException as e:
+            return jsonutil.loads(response.content)
+        except (requests.RequestException, ValueError) as e:
             return {"error": str(e), "statusCode": False}
 
     # =========================================================================
@@ -165,8 +230,8 @@ class MoSPI:
                 timeout=30
             )
             response.raise_for_status()
-            return response.json()
-        except requests.RequestException as e:
+            return jsonutil.loads(response.content)
+        except (requests.RequestException, ValueError) as e:
             return {"error": str(e), "statusCode": False}
 
     # =========================================================================
@@ -181,8 +246,8 @@ class MoSPI:
                 timeout=30
             )
             response.raise_for_status()
-            return response.json()
-        except requests.RequestException as e:
+            return jsonutil.loads(response.content)
+        except (requests.RequestException, ValueError) as e:
             return {"error": str(e), "statusCode": False}
 
     def get_asi_filters(
@@ -205,8 +270,8 @@ class MoSPI:
                 timeout=30
             )
             response.raise_for_status()
-            return response.json()
-        except requests.RequestException as e:
+            return jsonutil.loads(response.content)
+        except (requests.RequestException, ValueError) as e:
             return {"error": str(e), "statusCode": False}
 
     def get_asi_indicators(self) -> Dict[str, Any]:
@@ -222,7 +287,7 @@ class MoSPI:
                 timeout=30
             )
             response.raise_for_status()
-            data = response.json()
+            data = jsonutil.loads(response.content)
             filter_data = data.get("data", data)
             # Extract indicator list if present
             indicators = None
@@ -245,7 +310,7 @@ class MoSPI:
             else:
                 result["filters"] = filter_data
             return result
-        except requests.RequestException as e:
+        except (requests.RequestException, ValueError) as e:
             return {"error": str(e), "statusCode": False}
 
     # =========================================================================
@@ -260,8 +325,8 @@ class MoSPI:
                 timeout=30
             )
             response.raise_for_status()
-            return response.json()
-        except requests.RequestException as e:
+            return jsonutil.loads(response.content)
+        except (requests.RequestException, ValueError) as e:
             return {"error": str(e), "statusCode": False}
 
     def get_nas_filters(
@@ -290,8 +355,8 @@ class MoSPI:
                 timeout=30
             )
             response.raise_for_status()
-            return response.json()
-        except requests.RequestException as e:
+            return jsonutil.loads(response.content)
+        except (requests.RequestException, ValueError) as e:
             return {"error": str(e), "statusCode": False}
 
     # =========================================================================
@@ -310,8 +375,8 @@ class MoSPI:
                 timeout=30
             )
             response.raise_for_status()
-            return response.json()
-        except requests.RequestException as e:
+            return jsonutil.loads(response.content)
+        except (requests.RequestException, ValueError) as e:
             return {"error": str(e), "statusCode": False}
 
     # =========================================================================
@@ -326,8 +391,8 @@ class MoSPI:
                 timeout=30
             )
             response.raise_for_status()
-            return response.json()
-        except requests.RequestException as e:
+            return jsonutil.loads(response.content)
+        except (requests.RequestException, ValueError) as e:
             return {"error": str(e), "statusCode": False}
 
     def get_energy_filters(
@@ -353,8 +418,8 @@ class MoSPI:
                 timeout=30
             )
             response.raise_for_status()
-            return response.json()
-        except requests.RequestException as e:
+            return jsonutil.loads(response.content)
+        except (requests.RequestException, ValueError) as e:
             return {"error": str(e), "statusCode": False}
 
 
@@ -0,0 +1,61 @@
+"""
+State fan-out for data requests
+Splits a long comma-separated code filter into shards that can be fetched
+concurrently, and merges the shard results into one de-duplicated, sorted list
+"""
+
+from typing import Any, Dict, List, Tuple
+
+from . import jsonutil
+from .timeseries import key_fields, row_period
+
+# Shards fetched at the same time
+MAX_CONCURRENT_SHARDS = 4
+
+
+def split_codes(codes: str, shard_size: int) -> List[str]:
+    """Split "1,2,3,4,5" into comma-separated shards of at most shard_size codes, in order."""
+    parts = [code.strip() for code in codes.split(",") if code.strip()]
+    shard_size = max(1, shard_size)
+    return [",".join(parts[i:i + shard_size]) for i in range(0, len(parts), shard_size)]
+
+
+def _sort_value(value: Any) -> Tuple[int, float, str]:
+    """Sort key for one column value: numbers (including "10") by value, then text."""
+    if not isinstance(value, bool):
+        try:
+            number = float(value)
+        except (TypeError, ValueError):
+            number = None
+        if number is not None and number == number:  # NaN sorts as text
+            return (0, number, "")
+    return (1, 0.0, "" if value is None else str(value))
+
+
+def merge_rows(shards: List[List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """
+    Concatenate shard rows, drop exact duplicates and sort by series then period.
+
+    Series order follows the descriptive columns (state, sector, ...), numeric
+    values (e.g. state codes) as numbers and before text; rows without a
+    recognisable period sort first within their series. The sort is stable,
+    so rows that compare equal keep their upstream order.
+    """
+    seen = set()
+    rows = []
+    for shard in shards:
+        for row in shard:
+            fingerprint = jsonutil.dumps(row, sort_keys=True)
+            if fingerprint not in seen:
+                seen.add(fingerprint)
+                rows.append(row)
+
+    dict_rows = [row for row in rows if isinstance(row, dict)]
+    keys = key_fields(dict_rows) if dict_rows else []
+
+    def sort_key(row: Any):
+        if not isinstance(row, dict):
+            return ((), (0, 0, 0))
+        return (tuple(_sort_value(row.get(field)) for field in keys), row_period(row) or (0, 0, 0))
+
+    return sorted(rows, key=sort_key)
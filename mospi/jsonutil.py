@@ -0,0 +1,48 @@
+"""
+JSON encode/decode helpers
+Uses orjson when installed and falls back to the standard library otherwise
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
+
+# Name of the active backend ("orjson" or "json"), useful for logs and benchmarks
+BACKEND = "orjson" if orjson is not None else "json"
+
+
+def loads(data: Union[bytes, bytearray, str]) -> Any:
+    """Parse a JSON document from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(value: Any, sort_keys: bool = False) -> str:
+    """
+    Serialize to compact JSON text.
+
+    Non-ASCII characters are kept as-is and unknown types fall back to str(),
+    matching json.dumps(..., ensure_ascii=False, default=str).
+    """
+    return dumps_bytes(value, sort_keys=sort_keys).decode("utf-8")
+
+
+def dumps_bytes(value: Any, sort_keys: bool = False) -> bytes:
+    """Serialize to compact UTF-8 encoded JSON bytes."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(value, default=str, option=option)
+        except TypeError:
+            # e.g. integers wider than 64 bits; let the stdlib handle the odd cases
+            pass
+    return json.dumps(
+        value, ensure_ascii=False, separators=(",", ":"), sort_keys=sort_keys, default=str
+    ).encode("utf-8")
@@ -0,0 +1,387 @@
+"""
+Metadata cache and selector resolution
+Keeps 3_get_metadata responses for a while, indexes the filter values they
+list, and maps human-readable selector values ("state=Kerala, sector=Urban")
+onto their codes
+"""
+
+import bisect
+import difflib
+import re
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from . import jsonutil
+
+# How long metadata responses stay cached (seconds); filter lists change rarely
+METADATA_CACHE_TTL = 3600
+
+# Maximum number of metadata responses kept (least recently used evicted first)
+METADATA_CACHE_MAX_ENTRIES = 64
+
+# Common alternative spellings and abbreviations -> normalized metadata name
+ALIASES = {
+    "india": "all india",
+    "all india": "all india",
+    "orissa": "odisha",
+    "pondicherry": "puducherry",
+    "uttaranchal": "uttarakhand",
+    "delhi": "nct of delhi",
+    "j and k": "jammu and kashmir",
+    "jk": "jammu and kashmir",
+    "ap": "andhra pradesh",
+    "hp": "himachal pradesh",
+    "mp": "madhya pradesh",
+    "tn": "tamil nadu",
+    "up": "uttar pradesh",
+    "wb": "west bengal",
+    "total": "combined",
+}
+
+# Lowest similarity ratio accepted for a fuzzy match ("karela" vs "kerala" is 0.67)
+FUZZY_CUTOFF = 0.6
+
+# A fuzzy match is ambiguous when a runner-up scores within this margin of the best
+FUZZY_MARGIN = 0.05
+
+# Closest names suggested when a value matches nothing
+FUZZY_SUGGESTIONS = 5
+
+# Fuzzy candidates (by shared trigrams) scored with difflib per lookup
+FUZZY_CANDIDATES = 8
+
+
+class MetadataCache:
+    """
+    Thread-safe, time-limited store of metadata responses keyed by
+    (dataset, metadata params). Error responses are never stored.
+
+    Each entry's FilterIndex is built on first use and replaced together
+    with the response when the entry is refreshed.
+    """
+
+    def __init__(self, ttl: float = METADATA_CACHE_TTL, max_entries: int = METADATA_CACHE_MAX_ENTRIES):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(dataset: str, params: Dict[str, Any]) -> Tuple:
+        # Values as text, so {"indicator_code": 1} and {"indicator_code": "1"} share an entry
+        return (dataset, jsonutil.dumps({k: str(v) for k, v in params.items() if v is not None}, sort_keys=True))
+
+    def _entry(self, dataset: str, params: Dict[str, Any], fetch: Optional[Callable[[], Dict[str, Any]]]):
+        """Cached entry {"stored", "result", "index"}, refetched when missing or expired (if fetch is given)."""
+        key = self._key(dataset, params)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and now - entry["stored"] <= self.ttl:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry, None
+            self.misses += 1
+        if fetch is None:
+            return None, None
+
+        result = fetch()
+        if not isinstance(result, dict) or "error" in result or result.get("statusCode") is False:
+            return None, result
+        entry = {"stored": time.monotonic(), "result": result, "index": None}
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry, result
+
+    def get(self, dataset: str, params: Dict[str, Any], fetch: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Return the cached response for (dataset, params), calling fetch() on a miss or expiry.
+
+        Cached responses are shared and must not be mutated.
+        """
+        entry, uncached = self._entry(dataset, params, fetch)
+        return entry["result"] if entry is not None else uncached
+
+    def index(
+        self,
+        dataset: str,
+        params: Dict[str, Any],
+        fetch: Optional[Callable[[], Dict[str, Any]]] = None
+    ) -> Optional["FilterIndex"]:
+        """
+        FilterIndex of the cached response, built on first use.
+
+        Without fetch, only an already cached, unexpired response is indexed
+        (no upstream call); returns None if there is none.
+        """
+        entry, _ = self._entry(dataset, params, fetch)
+        if entry is None:
+            return None
+        if entry["index"] is None:
+            # Built outside the lock; a concurrent duplicate build is harmless
+            entry["index"] = FilterIndex(entry["result"])
+        return entry["index"]
+
+
+def filter_lists(metadata: Dict[str, Any]) -> Dict[str, List[Any]]:
+    """Dimension name -> list of allowed entries, from a metadata response."""
+    data = metadata.get("data", metadata) if isinstance(metadata, dict) else None
+    if not isinstance(data, dict):
+        return {}
+    return {dimension: entries for dimension, entries in data.items() if isinstance(entries, list)}
+
+
+def _pick(entry: Dict[str, Any], preferred: str, suffixes: Tuple[str, ...]) -> Optional[str]:
+    if preferred in entry:
+        return preferred
+    return next((key for key in entry if key.endswith(suffixes)), None)
+
+
+def entry_options(dimension: str, entries: List[Any]) -> List[Tuple[str, str, str]]:
+    """
+    (filter param, code, name) for each metadata entry of a dimension.
+
+    Entries like {"state_code": 32, "state_name": "Kerala"} give
+    ("state_code", "32", "Kerala"); entries without a code column (e.g. a
+    plain year list) use the dimension as the param and the value as both
+    code and name.
+    """
+    options = []
+    for entry in entries:
+        if isinstance(entry, dict):
+            code_key = _pick(entry, f"{dimension}_code", ("_code", "code"))
+            name_key = _pick(entry, f"{dimension}_name", ("_name", "name", "description"))
+            if code_key is None:
+                value = entry.get(name_key) if name_key else next(iter(entry.values()), None)
+                if value is not None:
+                    options.append((dimension, str(value), str(value)))
+                continue
+            code = entry.get(code_key)
+            name = entry.get(name_key) if name_key else code
+            if code is not None:
+                options.append((code_key, str(code), str(name)))
+        elif entry is not None:
+            options.append((dimension, str(entry), str(entry)))
+    return options
+
+
+def parse_selectors(selectors: Any) -> Dict[str, List[str]]:
+    """
+    Normalise selectors to {key: [values]}.
+
+    Accepts a dict ({"state": "Kerala,Goa"}) or a string
+    ("state=Kerala, Goa, sector=Urban"): a comma-separated piece without "="
+    is another value for the preceding key.
+    """
+    parsed: Dict[str, List[str]] = {}
+    if isinstance(selectors, dict):
+        for key, value in selectors.items():
+            values = value if isinstance(value, list) else str(value).split(",")
+            parsed[str(key).strip()] = [str(v).strip() for v in values if str(v).strip()]
+        return parsed
+
+    key = None
+    for piece in str(selectors or "").split(","):
+        if "=" in piece:
+            key, value = (part.strip() for part in piece.split("=", 1))
+            parsed.setdefault(key, [])
+        else:
+            value = piece.strip()
+        if key is not None and value:
+            parsed[key].append(value)
+    return parsed
+
+
+def normalize_name(text: str) -> str:
+    """Lower-case, "&" -> "and", punctuation to spaces, whitespace collapsed."""
+    text = str(text).casefold().replace("&", " and ")
+    return " ".join(re.sub(r"[^0-9a-z]+", " ", text).split())
+
+
+def _trigrams(text: str) -> Set[str]:
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class FilterIndex:
+    """
+    Inverted index over the filter values of one metadata response.
+
+    Per dimension it keeps exact lookups by normalized name and by code,
+    a sorted name list for prefix search, a token index (every query word
+    appears in the name) and a trigram index that narrows fuzzy matching to
+    a few candidates. Lookups try, in order: exact name or code, alias,
+    prefix, tokens, fuzzy; a step that finds several different codes reports
+    them as ambiguous instead of picking one.
+    """
+
+    def __init__(self, metadata: Dict[str, Any]):
+        self.options: Dict[str, List[Tuple[str, str, str]]] = {}
+        self._exact: Dict[str, Dict[str, List[int]]] = {}
+        self._sorted: Dict[str, List[Tuple[str, int]]] = {}
+        self._tokens: Dict[str, Dict[str, Set[int]]] = {}
+        self._trigrams: Dict[str, Dict[str, Set[int]]] = {}
+        self._values: Dict[str, Set[str]] = defaultdict(set)
+
+        for dimension, entries in filter_lists(metadata).items():
+            options = entry_options(dimension, entries)
+            self.options[dimension] = options
+            exact: Dict[str, List[int]] = defaultdict(list)
+            tokens: Dict[str, Set[int]] = defaultdict(set)
+            trigrams: Dict[str, Set[int]] = defaultdict(set)
+            names = []
+            for i, (param, code, name) in enumerate(options):
+                normalized = normalize_name(name)
+                exact[normalized].append(i)
+                if normalize_name(code) != normalized:
+                    exact[normalize_name(code)].append(i)
+                names.append((normalized, i))
+                for token in normalized.split():
+                    tokens[token].add(i)
+                for gram in _trigrams(normalized):
+                    trigrams[gram].add(i)
+                self._values[param].update((code, name))
+            self._exact[dimension] = dict(exact)
+            self._sorted[dimension] = sorted(names)
+            self._tokens[dimension] = dict(tokens)
+            self._trigrams[dimension] = dict(trigrams)
+
+    def dimension(self, key: str) -> Optional[str]:
+        """Dimension a selector key refers to ("state", "state_code" and "State" all give "state")."""
+        wanted = normalize_name(key).replace(" ", "_")
+        for suffix in ("_code", "_name"):
+            if wanted.endswith(suffix) and wanted[:-len(suffix)] in self.options:
+                return wanted[:-len(suffix)]
+        return wanted if wanted in self.options else None
+
+    def known_values(self, param: str) -> Optional[Set[str]]:
+        """Codes and names the metadata lists for a filter param, or None if the param is not indexed."""
+        return self._values.get(param)
+
+    def _distinct(self, dimension: str, hits) -> List[int]:
+        """Hits with duplicate (param, code) pairs collapsed, in order."""
+        seen = {}
+        for i in hits:
+            seen.setdefault(self.options[dimension][i][:2], i)
+        return list(seen.values())
+
+    def _prefix(self, dimension: str, query: str) -> List[int]:
+        names = self._sorted[dimension]
+        start = bisect.bisect_left(names, (query, -1))
+        hits = []
+        for name, i in names[start:]:
+            if not name.startswith(query):
+                break
+            hits.append(i)
+        return hits
+
+    def _token_hits(self, dimension: str, query: str) -> List[int]:
+        index = self._tokens[dimension]
+        sets = [index.get(token, set()) for token in query.split()]
+        return sorted(set.intersection(*sets)) if sets else []
+
+    def _closest(self, dimension: str, query: str) -> List[Tuple[float, int]]:
+        """(similarity, option) for the names sharing most trigrams with the query, best first."""
+        counts: Dict[int, int] = defaultdict(int)
+        index = self._trigrams[dimension]
+        for gram in _trigrams(query):
+            for i in index.get(gram, ()):
+                counts[i] += 1
+        candidates = sorted(counts, key=counts.__getitem__, reverse=True)[:FUZZY_CANDIDATES]
+        return sorted(
+            ((difflib.SequenceMatcher(None, query, normalize_name(self.options[dimension][i][2])).ratio(), i)
+             for i in candidates),
+            reverse=True,
+        )
+
+    def _fuzzy(self, dimension: str, query: str) -> List[int]:
+        scored = self._closest(dimension, query)
+        if not scored or scored[0][0] < FUZZY_CUTOFF:
+            return []
+        # Close runners-up make the match ambiguous
+        return [i for score, i in scored if score >= scored[0][0] - FUZZY_MARGIN]
+
+    def resolve(self, dimension: str, value: str) -> Tuple[str, List[Tuple[str, str, str]]]:
+        """
+        Look up one value in a dimension.
+
+        Returns:
+            (how it matched: "exact", "alias", "prefix", "tokens", "fuzzy",
+             "ambiguous" or "none"; the matching (param, code, name) options,
+             or for "none" the closest ones, best first)
+        """
+        query = normalize_name(value)
+        options = self.options[dimension]
+        steps = (
+            ("exact", lambda: self._exact[dimension].get(query, [])),
+            ("alias", lambda: self._exact[dimension].get(ALIASES.get(query, ""), [])),
+            ("prefix", lambda: self._prefix(dimension, query) if query else []),
+            ("tokens", lambda: self._token_hits(dimension, query)),
+            ("fuzzy", lambda: self._fuzzy(dimension, query)),
+        )
+        for method, lookup in steps:
+            hits = self._distinct(dimension, lookup())
+            if len(hits) == 1:
+                return method, [options[hits[0]]]
+            if hits:
+                return "ambiguous", [options[i] for i in hits]
+        closest = self._distinct(dimension, [i for _, i in self._closest(dimension, query)])
+        return "none", [options[i] for i in closest[:FUZZY_SUGGESTIONS]]
+
+
+def resolve_selectors(
+    index: FilterIndex,
+    selectors: Dict[str, List[str]]
+) -> Tuple[Dict[str, str], Dict[str, List[Dict[str, str]]], List[Dict[str, Any]]]:
+    """
+    Map selector values to filter codes with a FilterIndex.
+
+    Returns:
+        (filters as {param: "code,code"}, resolved {selector key: [{"value", "code", "name", "match"}]},
+         unresolved [{"selector", "value", "options"}] listing the ambiguous candidates, the closest
+         names, or a few valid names when nothing is close)
+    """
+    filters: Dict[str, List[str]] = {}
+    resolved: Dict[str, List[Dict[str, str]]] = {}
+    unresolved: List[Dict[str, Any]] = []
+
+    for key, values in selectors.items():
+        dimension = index.dimension(key)
+        if dimension is None:
+            unresolved.append({"selector": key, "value": ",".join(values), "options": sorted(index.options)})
+            continue
+        for value in values:
+            method, matches = index.resolve(dimension, value)
+            if method in ("none", "ambiguous"):
+                candidates = matches or index.options[dimension][:20]
+                unresolved.append({"selector": key, "value": value, "options": [name for _, _, name in candidates]})
+                continue
+            param, code, name = matches[0]
+            if code not in filters.setdefault(param, []):
+                filters[param].append(code)
+            resolved.setdefault(key, []).append({"value": value, "code": code, "name": name, "match": method})
+
+    return {param: ",".join(codes) for param, codes in filters.items()}, resolved, unresolved
+
+
+def invalid_codes(index: FilterIndex, filters: Dict[str, str]) -> Dict[str, List[str]]:
+    """
+    Values of *_code filters that the indexed metadata lists neither as a code
+    nor as a name, per param. Params the metadata does not describe are not checked.
+    """
+    invalid = {}
+    for param, value in filters.items():
+        known = index.known_values(param) if param.endswith("_code") else None
+        if not known:
+            continue
+        bad = [code.strip() for code in str(value).split(",") if code.strip() and code.strip() not in known]
+        if bad:
+            invalid[param] = bad
+    return invalid
@@ -0,0 +1,142 @@
+"""
+Derived metrics for index series
+Year-on-year and period-on-period change and rolling means of index levels,
+plus the extra look-back periods a requested window needs to compute them
+"""
+
+import math
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+from .timeseries import YEAR_FIELDS, parse_month, parse_year, shift_period
+
+# Metrics accepted by derive_metrics
+METRICS = ("yoy", "mom", "rolling_mean")
+
+# Periods per year of the routed datasets whose index levels the metrics apply to
+PERIODS_PER_YEAR = {
+    "CPI_GROUP": 12,
+    "CPI_ITEM": 12,
+    "IIP_MONTHLY": 12,
+    "WPI": 12,
+    "IIP_ANNUAL": 1,
+}
+
+
+def metric_lags(metrics: Sequence[str], per_year: int, window: int) -> Set[int]:
+    """Periods back from each output period whose values the metrics read."""
+    lags: Set[int] = set()
+    if "yoy" in metrics:
+        lags.add(per_year)
+    if "mom" in metrics:
+        lags.add(1)
+    if "rolling_mean" in metrics:
+        lags.update(range(1, window))
+    return lags
+
+
+def shift_year_label(label: str, years: int) -> str:
+    """Shift a year filter value, keeping its format: "2019" -> "2018", "2019-20" -> "2018-19"."""
+    year = parse_year(label) + years
+    if "-" in label:
+        return f"{year}-{(year + 1) % 100:02d}"
+    return str(year)
+
+
+def lookback_filters(
+    filters: Dict[str, str],
+    per_year: int,
+    lags: Set[int]
+) -> Tuple[Dict[str, str], Optional[Set[Tuple[int, Optional[int]]]]]:
+    """
+    Widen year or financial_year (and month_code) filters so the fetch includes
+    every period the metrics look back to.
+
+    Returns:
+        (filters to fetch with, requested (year, month) pairs or None when the
+        caller did not restrict years); month is None when months were not restricted.
+    """
+    year_field = next((field for field in YEAR_FIELDS if filters.get(field)), None)
+    if year_field is None:
+        return filters, None
+    labels = [label for label in filters[year_field].split(",") if parse_year(label) is not None]
+    if not labels:
+        return filters, None
+    template, base = labels[0], parse_year(labels[0])
+    years = {parse_year(label) for label in labels}
+    months = None
+    if per_year == 12 and filters.get("month_code"):
+        months = {parse_month(code) for code in filters["month_code"].split(",")} - {None}
+
+    fetch = dict(filters)
+    if months:
+        requested = {(year, month) for year in years for month in months}
+        needed = {shift_period((year, month, 12), -lag) for year, month in requested for lag in lags | {0}}
+        needed_years = {year for year, _, _ in needed}
+        fetch["month_code"] = ",".join(str(month) for month in sorted({month for _, month, _ in needed}))
+    else:
+        requested = {(year, None) for year in years}
+        back = math.ceil(max(lags, default=0) / per_year)
+        needed_years = {year - k for year in years for k in range(back + 1)}
+    fetch[year_field] = ",".join(shift_year_label(template, year - base) for year in sorted(needed_years))
+    return fetch, requested
+
+
+def in_window(period: Tuple[int, int, int], requested: Optional[Set[Tuple[int, Optional[int]]]]) -> bool:
+    """Whether a period is one the caller asked for (requested as returned by lookback_filters)."""
+    return requested is None or (period[0], None) in requested or (period[0], period[1]) in requested
+
+
+def _percent_change(current: Optional[float], previous: Optional[float]) -> Optional[float]:
+    if current is None or not previous:
+        return None
+    return round((current / previous - 1) * 100, 2)
+
+
+def derive_metrics(
+    periods: List[Tuple[int, int, int]],
+    values: List[float],
+    metrics: Sequence[str],
+    window: int = 12
+) -> List[Dict[str, Any]]:
+    """
+    Metrics for one series in a single pass over its periods.
+
+    The series is laid out on a gap-aware grid of consecutive periods, so
+    look-backs are index offsets and missing periods give None instead of
+    comparing against the wrong month. The rolling mean uses running sums
+    and needs all `window` periods present.
+
+    Returns:
+        One dict per input period: value plus the requested metrics
+    """
+    if not periods:
+        return []
+    per_year = periods[0][2]
+    ordinals = [year * per_year + sub - 1 for year, sub, _ in periods]
+    first = ordinals[0]
+    grid: List[Optional[float]] = [None] * (ordinals[-1] - first + 1)
+    for ordinal, value in zip(ordinals, values):
+        grid[ordinal - first] = value
+
+    # Running sum and count of present values for the rolling mean
+    sums = [0.0] * (len(grid) + 1)
+    counts = [0] * (len(grid) + 1)
+    for i, value in enumerate(grid):
+        sums[i + 1] = sums[i] + (value or 0.0)
+        counts[i + 1] = counts[i] + (value is not None)
+
+    rolling_key = f"rolling_mean_{window}"
+    points = []
+    for ordinal, value in zip(ordinals, values):
+        i = ordinal - first
+        point: Dict[str, Any] = {"value": value}
+        if "yoy" in metrics:
+            point["yoy"] = _percent_change(value, grid[i - per_year] if i >= per_year else None)
+        if "mom" in metrics:
+            point["mom"] = _percent_change(value, grid[i - 1] if i >= 1 else None)
+        if "rolling_mean" in metrics:
+            start = i + 1 - window
+            complete = start >= 0 and counts[i + 1] - counts[start] == window
+            point[rolling_key] = round((sums[i + 1] - sums[start]) / window, 3) if complete else None
+        points.append(point)
+    return points
@@ -0,0 +1,124 @@
+"""
+Continuation cursors for paginated data
+Encodes where a 4_get_data response stopped so a follow-up call can resume,
+and buffers fetched pages briefly so resuming does not hit the upstream API again
+"""
+
+import base64
+import binascii
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from . import jsonutil
+
+# How long fetched pages stay available to cursor follow-ups (seconds)
+PAGE_BUFFER_TTL = 300
+
+# Maximum number of pages kept in the buffer (least recently used evicted first)
+PAGE_BUFFER_MAX_PAGES = 128
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a cursor string cannot be decoded."""
+
+
+def normalize_filters(filters: Dict[str, str]) -> Dict[str, str]:
+    """
+    Canonicalise filters so equivalent requests map to the same cursor/buffer key.
+
+    Drops the page param (tracked separately) and strips whitespace around
+    comma-separated codes.
+    """
+    return {
+        key: ",".join(part.strip() for part in str(value).split(","))
+        for key, value in sorted(filters.items())
+        if key != "page"
+    }
+
+
+def encode_cursor(
+    dataset: str,
+    filters: Dict[str, str],
+    page: int,
+    offset: int = 0,
+    snapshot: Optional[int] = None
+) -> str:
+    """
+    Encode a continuation point as an opaque, URL-safe string.
+
+    Args:
+        dataset: Routed dataset key (e.g. "CPI_GROUP", "NAS")
+        filters: Normalized filters used for the request (without page)
+        page: Upstream page to resume from (1-based)
+        offset: Number of rows of that page already returned
+        snapshot: Epoch seconds when the first page of this chain was fetched
+    """
+    state = {"d": dataset, "f": filters, "p": page, "o": offset, "s": snapshot}
+    return base64.urlsafe_b64encode(jsonutil.dumps_bytes(state, sort_keys=True)).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Dict[str, Any]:
+    """Decode a cursor produced by encode_cursor into dataset/filters/page/offset/snapshot."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        state = jsonutil.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return {
+            "dataset": str(state["d"]),
+            "filters": {str(k): str(v) for k, v in state["f"].items()},
+            "page": int(state["p"]),
+            "offset": int(state["o"]),
+            "snapshot": int(state["s"]) if state.get("s") is not None else None,
+        }
+    except (binascii.Error, ValueError, KeyError, TypeError, AttributeError, UnicodeEncodeError) as e:
+        raise InvalidCursorError(f"Invalid cursor: {e}") from e
+
+
+class PageBuffer:
+    """
+    Short-lived, thread-safe store of upstream pages keyed by
+    (snapshot, dataset, normalized filters, page).
+    """
+
+    def __init__(self, ttl: float = PAGE_BUFFER_TTL, max_pages: int = PAGE_BUFFER_MAX_PAGES):
+        self.ttl = ttl
+        self.max_pages = max_pages
+        self._pages: "OrderedDict[Tuple, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(snapshot: int, dataset: str, filters: Dict[str, str], page: int) -> Tuple:
+        return (snapshot, dataset, jsonutil.dumps(filters, sort_keys=True), page)
+
+    def get(self, snapshot: int, dataset: str, filters: Dict[str, str], page: int) -> Optional[Dict[str, Any]]:
+        """Return a buffered page, or None if it was never stored or has expired."""
+        key = self._key(snapshot, dataset, filters, page)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._pages.get(key)
+            if entry is None or now - entry[0] > self.ttl:
+                self._pages.pop(key, None)
+                self.misses += 1
+                return None
+            self._pages.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, snapshot: int, dataset: str, filters: Dict[str, str], page: int, result: Dict[str, Any]) -> None:
+        """Store a page; buffered results are shared and must not be mutated."""
+        key = self._key(snapshot, dataset, filters, page)
+        now = time.monotonic()
+        with self._lock:
+            self._pages[key] = (now, result)
+            self._pages.move_to_end(key)
+            while len(self._pages) > self.max_pages:
+                self._pages.popitem(last=False)
+            # Drop expired pages from the cold end
+            while self._pages:
+                oldest_key, (stored_at, _) = next(iter(self._pages.items()))
+                if now - stored_at <= self.ttl:
+                    break
+                del self._pages[oldest_key]
@@ -0,0 +1,145 @@
+"""
+Response budgeting for LLM context
+Trims large data responses to a byte/token budget and summarises the rows
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from . import jsonutil
+
+# Rough bytes-per-token ratio for JSON payloads, used to turn a token budget into bytes
+BYTES_PER_TOKEN = 4
+
+# Bytes kept free for the continuation fields (_next_cursor, _next_step) added by the server
+CURSOR_RESERVE_BYTES = 512
+
+# Stop counting distinct values for a column past this many (reported as ">= N")
+MAX_TRACKED_CARDINALITY = 1000
+
+
+def budget_to_bytes(max_bytes: Optional[int], max_tokens: Optional[int]) -> Optional[int]:
+    """Combine byte and token budgets into a single byte budget (the tighter wins)."""
+    budgets = [b for b in (max_bytes, max_tokens and max_tokens * BYTES_PER_TOKEN) if b]
+    return min(budgets) if budgets else None
+
+
+def _as_number(value: Any) -> Optional[float]:
+    """Return value as a float if it is numeric (including numeric strings)."""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return float(value.replace(",", ""))
+        except ValueError:
+            return None
+    return None
+
+
+def summarize_rows(rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Summarise a list of data records in a single pass.
+
+    Returns the row count and, per column, the number of distinct values and
+    min/max/mean for columns whose non-empty values are all numeric.
+    """
+    columns: Dict[str, Dict[str, Any]] = {}
+
+    for row in rows:
+        if not isinstance(row, dict):
+            continue
+        for key, value in row.items():
+            col = columns.get(key)
+            if col is None:
+                col = columns[key] = {
+                    "distinct": set(), "numeric": True,
+                    "min": None, "max": None, "sum": 0.0, "count": 0, "nulls": 0,
+                }
+            if value is None or value == "":
+                col["nulls"] += 1
+                continue
+            if len(col["distinct"]) < MAX_TRACKED_CARDINALITY:
+                col["distinct"].add(value if isinstance(value, (str, int, float)) else str(value))
+            if col["numeric"]:
+                number = _as_number(value)
+                if number is None:
+                    col["numeric"] = False
+                    continue
+                col["min"] = number if col["min"] is None else min(col["min"], number)
+                col["max"] = number if col["max"] is None else max(col["max"], number)
+                col["sum"] += number
+                col["count"] += 1
+
+    summary_columns = {}
+    for key, col in columns.items():
+        distinct = len(col["distinct"])
+        entry: Dict[str, Any] = {
+            "distinct": distinct if distinct < MAX_TRACKED_CARDINALITY else f">={MAX_TRACKED_CARDINALITY}",
+        }
+        if col["nulls"]:
+            entry["nulls"] = col["nulls"]
+        if col["numeric"] and col["count"]:
+            entry["min"] = col["min"]
+            entry["max"] = col["max"]
+            entry["mean"] = round(col["sum"] / col["count"], 4)
+        elif distinct <= 20:
+            entry["values"] = sorted(str(v) for v in col["distinct"])
+        summary_columns[key] = entry
+
+    return {"row_count": len(rows), "columns": summary_columns}
+
+
+def fit_rows(rows: List[Any], budget: int) -> Tuple[int, int]:
+    """
+    Find how many leading rows fit in `budget` bytes of JSON.
+
+    Returns (row_count, bytes_used). Each row is encoded once and sizes are
+    accumulated, including the separating commas.
+    """
+    used = 0
+    for i, row in enumerate(rows):
+        size = len(jsonutil.dumps_bytes(row)) + (1 if i else 0)
+        if used + size > budget:
+            return i, used
+        used += size
+    return len(rows), used
+
+
+def apply_budget(result: Dict[str, Any], budget: int) -> Tuple[Dict[str, Any], Optional[int]]:
+    """
+    Trim result["data"] so the encoded result stays within `budget` bytes.
+
+    Returns (result, rows_returned). rows_returned is None when the result
+    already fits (with CURSOR_RESERVE_BYTES to spare) and is returned unchanged.
+    Otherwise the result carries the first rows that fit plus `_summary`
+    (over all fetched rows) and `_truncated`. At least one row is always kept,
+    even past the budget, so a continuation cursor always moves forward;
+    `_truncated.over_budget` is set when that happens.
+    """
+    rows = result.get("data")
+    if not isinstance(rows, list):
+        return result, None
+
+    if len(jsonutil.dumps_bytes(result)) + CURSOR_RESERVE_BYTES <= budget:
+        return result, None
+
+    trimmed = {k: v for k, v in result.items() if k != "data"}
+    trimmed["_summary"] = summarize_rows(rows)
+    trimmed["_truncated"] = {
+        "returned_rows": 0,
+        "fetched_rows": len(rows),
+        "budget_bytes": budget,
+    }
+    trimmed["data"] = []
+
+    # Space left for rows once the envelope, summary and cursor fields are accounted for
+    overhead = len(jsonutil.dumps_bytes(trimmed)) + CURSOR_RESERVE_BYTES
+    count, _ = fit_rows(rows, max(budget - overhead, 0))
+    if count == 0 and rows:
+        count = 1
+        trimmed["_truncated"]["over_budget"] = True
+
+    trimmed["data"] = rows[:count]
+    trimmed["_truncated"]["returned_rows"] = count
+    return trimmed, count
@@ -0,0 +1,233 @@
+"""
+Time series from data records
+Groups flat 4_get_data rows into per-series value sequences ordered by period,
+so analysis tools can work on whole series server-side
+"""
+
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from . import jsonutil
+from .summary import _as_number
+
+# Value columns tried in order when the caller does not name one
+DEFAULT_VALUE_FIELDS = ("inflation", "index_value", "index", "value")
+
+# Value columns holding index levels, for metrics derived from the level itself
+INDEX_VALUE_FIELDS = ("index_value", "index", "value")
+
+# Columns holding a row's year, tried in order ("2019" or a financial year such as "2019-20")
+YEAR_FIELDS = ("year", "financial_year")
+
+# Columns that describe when a row was observed rather than which series it belongs to
+PERIOD_FIELDS = YEAR_FIELDS + ("month_code", "month", "quarter_code", "quarter")
+
+# Columns that can change over time within one series (e.g. Provisional -> Final)
+NON_KEY_FIELDS = ("status",)
+
+# How long grouped series stay cached for repeated analysis queries (seconds)
+SERIES_CACHE_TTL = 900
+
+# Maximum number of queries whose series are cached (least recently used evicted first)
+SERIES_CACHE_MAX_ENTRIES = 64
+
+MONTH_NUMBERS = {
+    name: number
+    for number, names in enumerate(
+        (("jan", "january"), ("feb", "february"), ("mar", "march"), ("apr", "april"),
+         ("may",), ("jun", "june"), ("jul", "july"), ("aug", "august"),
+         ("sep", "sept", "september"), ("oct", "october"), ("nov", "november"), ("dec", "december")),
+        start=1,
+    )
+    for name in names
+}
+
+_YEAR = re.compile(r"(\d{4})")
+_QUARTER = re.compile(r"q?\s*([1-4])", re.IGNORECASE)
+
+
+def parse_year(value: Any) -> Optional[int]:
+    """First four-digit year in a value ("2019" and "2019-20" both give 2019)."""
+    match = _YEAR.search(str(value)) if value is not None else None
+    return int(match.group(1)) if match else None
+
+
+def parse_month(value: Any) -> Optional[int]:
+    """Month number from a code (1-12) or an English month name/abbreviation."""
+    if value is None:
+        return None
+    text = str(value).strip().lower()
+    if text.isdigit():
+        month = int(text)
+        return month if 1 <= month <= 12 else None
+    return MONTH_NUMBERS.get(text) or MONTH_NUMBERS.get(text[:3])
+
+
+def parse_quarter(value: Any) -> Optional[int]:
+    """Quarter number from "Q1", "1" or "Q1 (Apr-Jun)" style values."""
+    match = _QUARTER.match(str(value).strip()) if value is not None else None
+    return int(match.group(1)) if match else None
+
+
+def row_period(row: Dict[str, Any]) -> Optional[Tuple[int, int, int]]:
+    """
+    Position of a row in time as (year, sub-period, periods per year).
+
+    Monthly rows give (year, month, 12), quarterly rows (year, quarter, 4) and
+    annual rows (year, 1, 1); a financial year counts as the year it starts in.
+    Returns None when the row has no usable year.
+    """
+    year = next((parse_year(row[field]) for field in YEAR_FIELDS if row.get(field) not in (None, "")), None)
+    if year is None:
+        return None
+    for field in ("month_code", "month"):
+        if row.get(field) not in (None, ""):
+            month = parse_month(row[field])
+            return (year, month, 12) if month else None
+    for field in ("quarter_code", "quarter"):
+        if row.get(field) not in (None, ""):
+            quarter = parse_quarter(row[field])
+            return (year, quarter, 4) if quarter else None
+    return (year, 1, 1)
+
+
+def format_period(period: Tuple[int, int, int]) -> str:
+    """Readable label for a (year, sub-period, periods per year) tuple: 2019-03, 2019-Q2 or 2019."""
+    year, sub, per_year = period
+    if per_year == 12:
+        return f"{year}-{sub:02d}"
+    if per_year == 4:
+        return f"{year}-Q{sub}"
+    return str(year)
+
+
+def shift_period(period: Tuple[int, int, int], steps: int) -> Tuple[int, int, int]:
+    """Move a period forward (or backward, for negative steps) by a number of sub-periods."""
+    year, sub, per_year = period
+    ordinal = year * per_year + (sub - 1) + steps
+    return (ordinal // per_year, ordinal % per_year + 1, per_year)
+
+
+def pick_value_field(
+    rows: Iterable[Dict[str, Any]],
+    value_field: Optional[str] = None,
+    candidates: Sequence[str] = DEFAULT_VALUE_FIELDS
+) -> Optional[str]:
+    """The requested value column, or the first candidate column holding numbers."""
+    if value_field:
+        return value_field
+    for row in rows:
+        for field in candidates:
+            if _as_number(row.get(field)) is not None:
+                return field
+    return None
+
+
+def key_fields(rows: List[Dict[str, Any]], value_field: Optional[str] = None) -> List[str]:
+    """Columns that identify a series: every non-period, non-status column that is not a measure."""
+    fields: Dict[str, bool] = {}
+    for row in rows:
+        for field, value in row.items():
+            if field in fields or field == value_field or field in PERIOD_FIELDS or field in NON_KEY_FIELDS:
+                continue
+            if field.endswith(("code", "year")) or (isinstance(value, str) and _as_number(value) is None):
+                fields[field] = True
+            elif field in DEFAULT_VALUE_FIELDS or isinstance(value, (int, float)) or _as_number(value) is not None:
+                # Numeric measure (index, inflation, weight, ...); decided on first sight
+                fields[field] = False
+    return [field for field, is_key in fields.items() if is_key]
+
+
+def rows_to_series(
+    rows: List[Dict[str, Any]],
+    value_field: Optional[str] = None,
+    series_fields: Optional[List[str]] = None,
+    candidates: Sequence[str] = DEFAULT_VALUE_FIELDS
+) -> Tuple[Optional[str], List[Dict[str, Any]]]:
+    """
+    Group data rows into time series.
+
+    Rows are keyed by their descriptive columns (state, sector, group, ...,
+    or `series_fields` when given), ordered by period, and de-duplicated so
+    each period appears once per series (the last row wins). Rows without a
+    period or a numeric value are skipped. Without `value_field`, the first
+    of `candidates` that holds numbers is used.
+
+    Returns:
+        (value field used, list of {"key", "periods", "values"}) in first-seen
+        series order; periods are (year, sub-period, periods per year) tuples.
+    """
+    value_field = pick_value_field(rows, value_field, candidates)
+    if value_field is None:
+        return None, []
+    keys = list(series_fields) if series_fields else key_fields(rows, value_field)
+
+    grouped: Dict[Tuple, Dict[Tuple[int, int, int], float]] = {}
+    for row in rows:
+        if not isinstance(row, dict):
+            continue
+        value = _as_number(row.get(value_field))
+        period = row_period(row)
+        if value is None or period is None:
+            continue
+        key = tuple(row.get(field) for field in keys)
+        grouped.setdefault(key, {})[period] = value
+
+    series = []
+    for key, points in grouped.items():
+        periods = sorted(points)
+        series.append({
+            "key": dict(zip(keys, key)),
+            "periods": periods,
+            "values": [points[period] for period in periods],
+        })
+    return value_field, series
+
+
+class SeriesCache:
+    """
+    Thread-safe, time-limited store of grouped series keyed by
+    (dataset, normalized filters, value field, series fields), so repeated
+    analysis of the same query does not re-fetch and re-group the rows.
+    """
+
+    def __init__(self, ttl: float = SERIES_CACHE_TTL, max_entries: int = SERIES_CACHE_MAX_ENTRIES):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(dataset: str, filters: Dict[str, str], value_field: Optional[str],
+             series_fields: Optional[List[str]]) -> Tuple:
+        return (dataset, jsonutil.dumps(filters, sort_keys=True), value_field, tuple(series_fields or ()))
+
+    def get(self, dataset: str, filters: Dict[str, str], value_field: Optional[str] = None,
+            series_fields: Optional[List[str]] = None) -> Optional[Dict[str, Any]]:
+        """Return a cached entry, or None if it was never stored or has expired."""
+        key = self._key(dataset, filters, value_field, series_fields)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or now - entry[0] > self.ttl:
+                self._entries.pop(key, None)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, dataset: str, filters: Dict[str, str], value_field: Optional[str],
+            series_fields: Optional[List[str]], entry: Dict[str, Any]) -> None:
+        """Store an entry; cached entries are shared and must not be mutated."""
+        key = self._key(dataset, filters, value_field, series_fields)
+        with self._lock:
+            self._entries[key] = (time.monotonic(), entry)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
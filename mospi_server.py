@@ -1,9 +1,31 @@
 import sys
 import os
+import time
+import hashlib
 import yaml
-from typing import Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Dict, Any, List, Optional, Tuple
 from fastmcp import FastMCP
+from fastmcp.tools import ToolResult
+from mcp.types import TextContent
+from mospi import jsonutil
+from mospi.asi import ASI_CLASSIFICATION_RANGES, metadata_years, plan_classification_years
+from mospi.chainlink import BASE_YEAR_FIELDS, BASE_YEARS, chain_link
+from mospi.changepoint import BREAK_MIN_SEGMENT, describe_breaks, pelt_changepoints
 from mospi.client import mospi
+from mospi.fanout import MAX_CONCURRENT_SHARDS, merge_rows, split_codes
+from mospi.metadata import FilterIndex, MetadataCache, invalid_codes, parse_selectors, resolve_selectors
+from mospi.metrics import (
+    METRICS, PERIODS_PER_YEAR, derive_metrics, in_window, lookback_filters, metric_lags,
+)
+from mospi.pagination import (
+    InvalidCursorError, PageBuffer, decode_cursor, encode_cursor, normalize_filters,
+)
+from mospi.summary import apply_budget, budget_to_bytes
+from mospi.timeseries import (
+    DEFAULT_VALUE_FIELDS, INDEX_VALUE_FIELDS, SeriesCache, format_period, rows_to_series,
+)
 from observability.telemetry import TelemetryMiddleware
 
 SWAGGER_DIR = os.path.join(os.path.dirname(__file__), "swagger")
@@ -65,11 +87,32 @@ def get_swagger_params(dataset: str) -> list:
     return [p["name"] for p in get_swagger_param_definitions(dataset)]
 
 
+# Filters the server itself turns into page numbers and row counts
+PAGING_PARAMS = ("limit", "page")
+
+
+def is_positive_int(value: Any) -> bool:
+    """Whether a filter value is a whole number >= 1 (e.g. "50")."""
+    try:
+        return int(str(value).strip()) >= 1
+    except ValueError:
+        return False
+
+
 def validate_filters(dataset: str, filters: Dict[str, str]) -> Dict[str, Any]:
     """
     Validate filters against swagger spec for a dataset.
-    Checks for unknown params and missing required params.
+    Checks limit/page are whole numbers, then unknown params and missing required params.
     """
+    # Check paging params are whole numbers before they are used for page arithmetic
+    not_numeric = {k: filters[k] for k in PAGING_PARAMS if k in filters and not is_positive_int(filters[k])}
+    if not_numeric:
+        return {
+            "valid": False,
+            "invalid_values": not_numeric,
+            "hint": f"{', '.join(not_numeric)} must be a positive whole number (e.g. \"100\").",
+        }
+
     param_defs = get_swagger_param_definitions(dataset)
     if not param_defs:
         return {"valid": True}  # Can't validate, pass through
@@ -98,6 +141,17 @@ def validate_filters(dataset: str, filters: Dict[str, str]) -> Dict[str, Any]:
             "hint": f"Missing required params: {missing}. Call 3_get_metadata() to get valid values."
         }
 
+    # Reject codes that cached metadata for this request does not list, before any upstream call.
+    # Requests whose metadata has not been loaded (3_get_metadata not called) pass through unchecked.
+    index = cached_filter_index(dataset, filters)
+    invalid_values = invalid_codes(index, filters) if index is not None else {}
+    if invalid_values:
+        return {
+            "valid": False,
+            "invalid_codes": invalid_values,
+            "hint": f"Codes not listed by 3_get_metadata(): {invalid_values}. Use codes from its response.",
+        }
+
     return {"valid": True}
 
 
@@ -108,7 +162,82 @@ def transform_filters(filters: Dict[str, str]) -> Dict[str, str]:
     return {k: str(v) for k, v in filters.items() if v is not None}
 
 
-@mcp.tool(name="2_get_indicators")
+# Output schema for tools that return pre-built ToolResults (same as Dict[str, Any])
+OBJECT_OUTPUT_SCHEMA = {"type": "object", "additionalProperties": True}
+
+
+def dump_json(value: Any) -> str:
+    """Serialize to compact JSON, matching FastMCP's default text content."""
+    return jsonutil.dumps(value)
+
+
+def json_tool_result(payload: Dict[str, Any]) -> ToolResult:
+    """Encode a dict tool result with the fast JSON backend instead of FastMCP's default."""
+    return ToolResult(
+        content=[TextContent(type="text", text=dump_json(payload))],
+        structured_content=payload,
+    )
+
+
+def static_tool_result(payload: Dict[str, Any]) -> ToolResult:
+    """
+    Build a tool result once at startup for a payload that never changes.
+
+    The payload is serialized a single time and stamped with `_version`, a short
+    hash of its content, so clients can cache the response and only re-read it
+    when the hash changes. The returned ToolResult is shared across calls and
+    must not be mutated.
+    """
+    version = hashlib.sha256(jsonutil.dumps_bytes(payload, sort_keys=True)).hexdigest()[:16]
+    payload = {**payload, "_version": version}
+    return ToolResult(
+        content=[TextContent(type="text", text=dump_json(payload))],
+        structured_content=payload,
+        meta={"version": version},
+    )
+
+
+def with_extra_fields(static: ToolResult, **fields: Any) -> ToolResult:
+    """
+    Append per-call fields to a static result without re-serializing it.
+
+    The extra keys are spliced onto the end of the pre-serialized JSON text.
+    """
+    text = static.content[0].text
+    extra = dump_json(fields)[1:-1]
+    return ToolResult(
+        content=[TextContent(type="text", text=f"{text[:-1]},{extra}}}")],
+        structured_content={**static.structured_content, **fields},
+        meta=static.meta,
+    )
+
+
+INDICATORS_NEXT_STEP = "Call 3_get_metadata() with the matching indicator and required dataset params. MUST NOT skip to 4_get_data."
+INDICATORS_RETRY_HINT = (
+    "If none of the indicators above match the user's query, you may have picked the WRONG dataset. "
+    "Similar datasets overlap: IIP (production index/growth rates) vs ASI (factory financials like capital, wages, GVA). "
+    "CPI (consumer inflation) vs WPI (wholesale inflation). "
+    "Go back to 1_know_about_mospi_api() and try a different dataset."
+)
+
+# Special datasets - return guidance instead of indicators.
+# Built once at startup; only _user_query is added per call.
+STATIC_INDICATOR_RESULTS = {
+    dataset: static_tool_result({
+        "message": message,
+        "dataset": dataset,
+        "_next_step": INDICATORS_NEXT_STEP,
+        "_retry_hint": INDICATORS_RETRY_HINT,
+    })
+    for dataset, message in [
+        ("CPI", "CPI uses levels (Group/Item) instead of indicators. Call 3_get_metadata with base_year and level params."),
+        ("IIP", "IIP uses categories instead of indicators. Call 3_get_metadata with base_year and frequency params."),
+        ("WPI", "WPI uses hierarchical commodity codes. Call 3_get_metadata to see available groups/items."),
+    ]
+}
+
+
+@mcp.tool(name="2_get_indicators", output_schema=OBJECT_OUTPUT_SCHEMA)
 def get_indicators(
     dataset: str,
     user_query: Optional[str] = None,
@@ -119,7 +248,7 @@ def get_indicators(
     level: Optional[str] = None,
     series: Optional[str] = None,
     Format: Optional[str] = None
-) -> Dict[str, Any]:
+) -> Dict[str, Any] | ToolResult:
     """
     ============================================================
     RULES (MUST follow exactly):
@@ -153,14 +282,13 @@ def get_indicators(
     """
     dataset = dataset.upper()
 
+    if dataset in STATIC_INDICATOR_RESULTS:
+        return with_extra_fields(STATIC_INDICATOR_RESULTS[dataset], _user_query=user_query)
+
     indicator_methods = {
         "PLFS": mospi.get_plfs_indicators,
         "NAS": mospi.get_nas_indicators,
         "ENERGY": mospi.get_energy_indicators,
-        # Special datasets - return guidance instead of indicators
-        "CPI": lambda: {"message": "CPI uses levels (Group/Item) instead of indicators. Call 3_get_metadata with base_year and level params.", "dataset": "CPI"},
-        "IIP": lambda: {"message": "IIP uses categories instead of indicators. Call 3_get_metadata with base_year and frequency params.", "dataset": "IIP"},
-        "WPI": lambda: {"message": "WPI uses hierarchical commodity codes. Call 3_get_metadata to see available groups/items.", "dataset": "WPI"},
         "ASI": mospi.get_asi_indicators,
     }
 
@@ -169,13 +297,8 @@ def get_indicators(
 
     result = indicator_methods[dataset]()
     result["_user_query"] = user_query
-    result["_next_step"] = "Call 3_get_metadata() with the matching indicator and required dataset params. MUST NOT skip to 4_get_data."
-    result["_retry_hint"] = (
-        "If none of the indicators above match the user's query, you may have picked the WRONG dataset. "
-        "Similar datasets overlap: IIP (production index/growth rates) vs ASI (factory financials like capital, wages, GVA). "
-        "CPI (consumer inflation) vs WPI (wholesale inflation). "
-        "Go back to 1_know_about_mospi_api() and try a different dataset."
-    )
+    result["_next_step"] = INDICATORS_NEXT_STEP
+    result["_retry_hint"] = INDICATORS_RETRY_HINT
     return result
 
 
@@ -233,42 +356,24 @@ def get_metadata(
     try:
         _next = "Call 4_get_data(dataset, filters) using ONLY the filter values returned above. MUST NOT guess any codes."
 
-        if dataset == "CPI":
-            swagger_key = "CPI_ITEM" if (level or "Group") == "Item" else "CPI_GROUP"
-            result = mospi.get_cpi_filters(base_year=base_year or "2012", level=level or "Group")
-            result["api_params"] = get_swagger_param_definitions(swagger_key)
-            result["_next_step"] = _next
-            return result
-
-        elif dataset == "IIP":
-            swagger_key = "IIP_MONTHLY" if (frequency or "Annually") == "Monthly" else "IIP_ANNUAL"
-            result = mospi.get_iip_filters(base_year=base_year or "2011-12", frequency=frequency or "Annually")
-            result["api_params"] = get_swagger_param_definitions(swagger_key)
-            result["_next_step"] = _next
-            return result
-
-        elif dataset == "ASI":
-            result = mospi.get_asi_filters(classification_year=classification_year or "2008")
-            result["api_params"] = get_swagger_param_definitions("ASI")
-            result["_next_step"] = _next
-            return result
-
-        elif dataset == "WPI":
-            result = mospi.get_wpi_filters()
-            result["api_params"] = get_swagger_param_definitions("WPI")
-            result["_next_step"] = _next
-            return result
-
-        elif dataset == "PLFS":
-            if indicator_code is None:
-                return {"error": "indicator_code is required for PLFS"}
-
-            filters = mospi.get_plfs_filters(indicator_code=indicator_code, frequency_code=frequency_code or 1)
+        if dataset in ("PLFS", "NAS") and indicator_code is None:
+            return {"error": f"indicator_code is required for {dataset}"}
+        if dataset not in METADATA_SWAGGER_KEYS:
+            return {"error": f"Unknown dataset: {dataset}", "valid_datasets": VALID_DATASETS}
+
+        params = metadata_params(
+            dataset, indicator_code=indicator_code, base_year=base_year, level=level, frequency=frequency,
+            classification_year=classification_year, frequency_code=frequency_code, series=series,
+            use_of_energy_balance_code=use_of_energy_balance_code,
+        )
+        filters = load_metadata(dataset, params)
+        api_params = get_swagger_param_definitions(metadata_swagger_key(dataset, params))
 
+        if dataset == "PLFS":
             return {
                 "dataset": "PLFS",
                 "filter_values": filters,
-                "api_params": get_swagger_param_definitions("PLFS"),
+                "api_params": api_params,
                 "_note": "frequency_code selects the indicator SET, NOT time granularity. "
                          "frequency_code=1 (Annual): Indicators 1-8 (LFPR, WPR, UR, wages, worker distribution, employment conditions). "
                          "Already has quarterly breakdowns — use quarter_code to filter by quarter. "
@@ -278,31 +383,383 @@ def get_metadata(
                 "_next_step": _next,
             }
 
-        elif dataset == "NAS":
-            if indicator_code is None:
-                return {"error": "indicator_code is required for NAS"}
-            result = mospi.get_nas_filters(series=series or "Current", frequency_code=frequency_code or 1, indicator_code=indicator_code)
-            result["api_params"] = get_swagger_param_definitions("NAS")
-            result["_next_step"] = _next
-            return result
-
-        elif dataset == "ENERGY":
-            ind_code = indicator_code or 1
-            energy_code = use_of_energy_balance_code or 1
-            result = mospi.get_energy_filters(indicator_code=ind_code, use_of_energy_balance_code=energy_code)
-            result["api_params"] = get_swagger_param_definitions("ENERGY")
-            result["_next_step"] = _next
-            return result
-
-        else:
-            return {"error": f"Unknown dataset: {dataset}", "valid_datasets": VALID_DATASETS}
+        # Cached responses are shared; add the per-call fields to a copy
+        return {**filters, "api_params": api_params, "_next_step": _next}
 
     except Exception as e:
         return {"error": str(e)}
 
 
-@mcp.tool(name="4_get_data")
-def get_data(dataset: str, filters: Dict[str, str]) -> Dict[str, Any]:
+# Swagger spec (routed dataset key) describing the data params for each metadata dataset
+METADATA_SWAGGER_KEYS = {
+    "CPI": "CPI_GROUP",
+    "IIP": "IIP_ANNUAL",
+    "ASI": "ASI",
+    "WPI": "WPI",
+    "PLFS": "PLFS",
+    "NAS": "NAS",
+    "ENERGY": "ENERGY",
+}
+
+# Metadata responses, shared by 3_get_metadata and the selector fast path
+metadata_cache = MetadataCache()
+
+
+def metadata_params(dataset: str, **params: Any) -> Dict[str, Any]:
+    """The metadata params that apply to a dataset, with the defaults 3_get_metadata uses."""
+    if dataset == "CPI":
+        return {"base_year": params.get("base_year") or "2012", "level": params.get("level") or "Group"}
+    if dataset == "IIP":
+        return {"base_year": params.get("base_year") or "2011-12", "frequency": params.get("frequency") or "Annually"}
+    if dataset == "ASI":
+        return {"classification_year": params.get("classification_year") or "2008"}
+    if dataset == "PLFS":
+        return {"indicator_code": params.get("indicator_code"), "frequency_code": params.get("frequency_code") or 1}
+    if dataset == "NAS":
+        return {
+            "series": params.get("series") or "Current",
+            "frequency_code": params.get("frequency_code") or 1,
+            "indicator_code": params.get("indicator_code"),
+        }
+    if dataset == "ENERGY":
+        return {
+            "indicator_code": params.get("indicator_code") or 1,
+            "use_of_energy_balance_code": params.get("use_of_energy_balance_code") or 1,
+        }
+    return {}
+
+
+def metadata_swagger_key(dataset: str, params: Dict[str, Any]) -> str:
+    """Routed dataset whose data endpoint the metadata (dataset, params) describes."""
+    if dataset == "CPI" and params.get("level") == "Item":
+        return "CPI_ITEM"
+    if dataset == "IIP" and params.get("frequency") == "Monthly":
+        return "IIP_MONTHLY"
+    return METADATA_SWAGGER_KEYS[dataset]
+
+
+def load_metadata(dataset: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    """Filter metadata for (dataset, params from metadata_params), through metadata_cache."""
+    fetchers = {
+        "CPI": mospi.get_cpi_filters,
+        "IIP": mospi.get_iip_filters,
+        "ASI": mospi.get_asi_filters,
+        "WPI": mospi.get_wpi_filters,
+        "PLFS": mospi.get_plfs_filters,
+        "NAS": mospi.get_nas_filters,
+        "ENERGY": mospi.get_energy_filters,
+    }
+    return metadata_cache.get(dataset, params, lambda: fetchers[dataset](**params))
+
+
+def cached_filter_index(routed: str, filters: Dict[str, str]) -> Optional[FilterIndex]:
+    """
+    FilterIndex of the already cached metadata that describes a data request, if any.
+
+    Never calls upstream: requests whose metadata has not been loaded are not checked.
+    """
+    dataset = {"CPI_GROUP": "CPI", "CPI_ITEM": "CPI", "IIP_ANNUAL": "IIP", "IIP_MONTHLY": "IIP"}.get(routed, routed)
+    if dataset not in METADATA_SWAGGER_KEYS:
+        return None
+    endpoint = {"CPI_ITEM": {"level": "Item"}, "IIP_MONTHLY": {"frequency": "Monthly"}}.get(routed, {})
+    return metadata_cache.index(dataset, metadata_params(dataset, **{**filters, **endpoint}))
+
+
+# Map routed dataset keys to MoSPI client dataset keys
+API_DATASET_MAP = {
+    "CPI_GROUP": "CPI_Group",
+    "CPI_ITEM": "CPI_Item",
+    "IIP_ANNUAL": "IIP_Annual",
+    "IIP_MONTHLY": "IIP_Monthly",
+    "PLFS": "PLFS",
+    "ASI": "ASI",
+    "NAS": "NAS",
+    "WPI": "WPI",
+    "ENERGY": "Energy",
+}
+
+# Default page size of the MoSPI data endpoints when no limit is passed
+DEFAULT_PAGE_LIMIT = 10
+
+# Upper bound on max_pages for a single 4_get_data call
+MAX_PAGES_PER_CALL = 20
+
+# Page size used by the analysis tools when the caller does not pass a limit
+ANALYSIS_PAGE_LIMIT = 500
+
+# Upstream pages requested at the same time when an analysis tool reads a whole series
+MAX_CONCURRENT_PAGES = 4
+
+# Shown when an analysis tool computed on rows with upstream pages missing
+FAILED_PAGES_WARNING = (
+    "Some upstream pages could not be read (see _failed_pages), so these results have gaps. "
+    "Retry the call before relying on them."
+)
+
+# Pages fetched by 4_get_data, kept briefly so cursor follow-ups skip the upstream call
+page_buffer = PageBuffer()
+
+# Cursor filter fields that mark a merged shard result (settings needed to fetch it again)
+SHARD_CURSOR_FIELDS = ("_shard_size", "_shard_pages")
+
+# Classification years fetched at the same time by 7_get_asi_across_classifications
+MAX_CONCURRENT_CLASSIFICATIONS = 4
+
+# Series grouped by the analysis tools, kept so repeated queries skip the fetch and grouping
+series_cache = SeriesCache()
+
+# Spliced 8_get_chain_linked_series results, keyed by query and base-year chain
+chain_cache = SeriesCache()
+
+
+def route_dataset(dataset: str, filters: Dict[str, Any]) -> str:
+    """Auto-route CPI and IIP to their Group/Item and Annual/Monthly endpoints based on filters."""
+    dataset = dataset.upper()
+    if dataset == "CPI":
+        return "CPI_ITEM" if "item_code" in filters else "CPI_GROUP"
+    if dataset == "IIP":
+        return "IIP_MONTHLY" if "month_code" in filters else "IIP_ANNUAL"
+    return dataset
+
+
+def has_next_page(result: Dict[str, Any], page: int, limit: int) -> bool:
+    """Check the upstream meta_data block for pages after `page`."""
+    meta = result.get("meta_data")
+    if not isinstance(meta, dict):
+        return False
+    try:
+        if meta.get("totalPages") is not None:
+            return page < int(meta["totalPages"])
+        if meta.get("totalRecords") is not None:
+            return page * limit < int(meta["totalRecords"])
+    except (TypeError, ValueError):
+        pass
+    return False
+
+
+def fetch_data_page(
+    dataset: str,
+    filters: Dict[str, str],
+    page: int,
+    snapshot: int,
+    use_buffer: bool = False
+) -> Dict[str, Any]:
+    """
+    Fetch one upstream page, serving it from the page buffer when resuming a cursor.
+
+    Successful pages are buffered under the chain's snapshot so later cursor
+    calls can read them without another upstream request.
+    """
+    if use_buffer:
+        buffered = page_buffer.get(snapshot, dataset, filters, page)
+        if buffered is not None:
+            return buffered
+
+    request_filters = dict(filters)
+    if page > 1:
+        request_filters["page"] = str(page)
+    result = mospi.get_data(API_DATASET_MAP[dataset], request_filters)
+
+    if isinstance(result, dict) and isinstance(result.get("data"), list):
+        page_buffer.put(snapshot, dataset, filters, page, result)
+    return result
+
+
+def fetch_all_rows(
+    dataset: str,
+    filters: Dict[str, str],
+    max_pages: int = MAX_PAGES_PER_CALL
+) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]], bool, List[int]]:
+    """
+    Fetch every page of a query (up to max_pages) for server-side analysis.
+
+    Page 1 is read first to learn the page count; the remaining pages are
+    requested concurrently, at most MAX_CONCURRENT_PAGES at a time. Filters
+    must have passed validate_filters, which checks limit is a whole number.
+
+    Returns:
+        (rows in page order, error/empty upstream result or None, whether pages were
+         left unread, page numbers whose request failed and whose rows are missing)
+    """
+    snapshot = int(time.time())
+    limit = int(filters.get("limit") or DEFAULT_PAGE_LIMIT)
+    first = fetch_data_page(dataset, filters, 1, snapshot)
+    if not isinstance(first, dict) or not isinstance(first.get("data"), list):
+        return [], first, False, []
+
+    total_pages = 1
+    meta = first.get("meta_data")
+    if isinstance(meta, dict):
+        try:
+            if meta.get("totalPages") is not None:
+                total_pages = int(meta["totalPages"])
+            elif meta.get("totalRecords") is not None:
+                total_pages = -(-int(meta["totalRecords"]) // limit)
+        except (TypeError, ValueError):
+            pass
+    last_page = min(total_pages, max_pages)
+
+    rows = list(first["data"])
+    failed_pages = []
+    if last_page > 1:
+        page_numbers = range(2, last_page + 1)
+        with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_PAGES, last_page - 1)) as pool:
+            pages = pool.map(lambda page: fetch_data_page(dataset, filters, page, snapshot), page_numbers)
+            for page, page_result in zip(page_numbers, pages):
+                if isinstance(page_result, dict) and isinstance(page_result.get("data"), list):
+                    rows.extend(page_result["data"])
+                else:
+                    failed_pages.append(page)
+    return rows, None if rows else first, total_pages > last_page, failed_pages
+
+
+def load_series(
+    dataset: str,
+    filters: Dict[str, str],
+    value_field: Optional[str],
+    series_fields: Optional[List[str]],
+    max_pages: Optional[int],
+    candidates: Tuple[str, ...] = DEFAULT_VALUE_FIELDS
+) -> Dict[str, Any]:
+    """
+    Fetch and group a query into series for the analysis tools, using series_cache.
+
+    Returns {"value_field", "series", "rows_fetched", "truncated", "failed_pages"},
+    or {"failed": upstream result} when nothing could be fetched. Series with
+    failed pages are not cached.
+    """
+    page_count = max(1, min(max_pages or MAX_PAGES_PER_CALL, MAX_PAGES_PER_CALL))
+    cache_filters = {**filters, "_pages": str(page_count), "_candidates": ",".join(candidates)}
+    cached = series_cache.get(dataset, cache_filters, value_field, series_fields)
+    if cached is not None:
+        return cached
+
+    rows, failed, truncated, failed_pages = fetch_all_rows(dataset, filters, page_count)
+    if failed is not None:
+        return {"failed": failed}
+    used_field, series = rows_to_series(rows, value_field, series_fields, candidates)
+    entry = {
+        "value_field": used_field,
+        "series": series,
+        "rows_fetched": len(rows),
+        "truncated": truncated,
+        "failed_pages": failed_pages,
+        "columns": sorted(rows[0]) if rows else [],
+    }
+    if used_field is not None and not failed_pages:
+        series_cache.put(dataset, cache_filters, value_field, series_fields, entry)
+    return entry
+
+
+def fetch_state_shards(
+    dataset: str,
+    filters: Dict[str, str],
+    shard_size: int,
+    max_pages: int
+) -> Dict[str, Any]:
+    """
+    Fetch a long state_code list as shards of shard_size codes, concurrently.
+
+    At most MAX_CONCURRENT_SHARDS shards are in flight at once and each reads
+    up to max_pages pages. Rows of all successful shards are merged, de-duplicated
+    and sorted; failed shards, shards with unread pages and pages that could not
+    be read are listed alongside.
+    """
+    shards = split_codes(filters["state_code"], shard_size)
+
+    def fetch(codes: str):
+        return fetch_all_rows(dataset, {**filters, "state_code": codes}, max_pages)
+
+    with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_SHARDS, len(shards))) as pool:
+        outcomes = list(pool.map(fetch, shards))
+
+    shard_rows = []
+    failed = []
+    truncated = []
+    failed_pages = []
+    for codes, (rows, upstream, more, missing) in zip(shards, outcomes):
+        no_data = isinstance(upstream, dict) and upstream.get("msg") == "No Data Found"
+        if upstream is not None and not no_data:
+            reason = (upstream.get("error") or upstream.get("msg")) if isinstance(upstream, dict) else upstream
+            failed.append({"state_code": codes, "error": str(reason or "No data returned")})
+            continue
+        shard_rows.append(rows)
+        if more:
+            truncated.append(codes)
+        if missing:
+            failed_pages.append({"state_code": codes, "pages": missing})
+
+    if len(failed) == len(shards):
+        return {"error": "All state shards failed", "_failed_shards": failed}
+
+    merged = merge_rows(shard_rows)
+    result = {"data": merged} if merged else {"msg": "No Data Found", "data": []}
+    result["_shards"] = len(shards)
+    if failed:
+        result["_failed_shards"] = failed
+    if truncated:
+        result["_truncated_shards"] = truncated
+    if failed_pages:
+        result["_failed_pages"] = failed_pages
+        result["_warning"] = FAILED_PAGES_WARNING
+    return result
+
+
+def add_continuation(result: Dict[str, Any], next_cursor: str, snapshot: int, summarized: bool) -> None:
+    """Add _next_cursor, the chain's snapshot time and how to continue to a trimmed or partial result."""
+    result["_next_cursor"] = next_cursor
+    result["_snapshot"] = datetime.fromtimestamp(snapshot, tz=timezone.utc).isoformat()
+    result["_next_step"] = (
+        "More rows are available"
+        + ("; _summary covers all rows fetched for this call" if summarized else "")
+        + ". If you need them, call 4_get_data(dataset, cursor=_next_cursor)."
+    )
+
+
+def get_sharded_data(
+    dataset: str,
+    filters: Dict[str, str],
+    sharding: Dict[str, str],
+    offset: int,
+    snapshot: int,
+    budget: Optional[int]
+) -> Dict[str, Any]:
+    """
+    Merged shard result from `offset` on, trimmed to the budget, with a cursor for the rest.
+
+    The merged result is buffered as page 1 of the filters plus the shard
+    settings, so cursor follow-ups slice it instead of fetching every shard again.
+    """
+    buffer_filters = {**filters, **sharding}
+    merged = page_buffer.get(snapshot, dataset, buffer_filters, 1) if offset else None
+    if merged is None:
+        merged = fetch_state_shards(dataset, filters, int(sharding["_shard_size"]), int(sharding["_shard_pages"]))
+        if isinstance(merged.get("data"), list) and merged["data"]:
+            page_buffer.put(snapshot, dataset, buffer_filters, 1, merged)
+    if not isinstance(merged.get("data"), list):
+        return merged
+
+    rows = merged["data"][offset:]
+    result = {**merged, "data": rows}
+    returned = None
+    if budget:
+        result, returned = apply_budget(result, budget)
+    if returned is not None and returned < len(rows):
+        next_cursor = encode_cursor(dataset, buffer_filters, 1, offset + returned, snapshot)
+        add_continuation(result, next_cursor, snapshot, summarized=True)
+    return result
+
+
+@mcp.tool(name="4_get_data", output_schema=OBJECT_OUTPUT_SCHEMA)
+def get_data(
+    dataset: str,
+    filters: Optional[Dict[str, str]] = None,
+    max_bytes: Optional[int] = None,
+    max_tokens: Optional[int] = None,
+    cursor: Optional[str] = None,
+    max_pages: Optional[int] = None,
+    shard_size: Optional[int] = None
+) -> Dict[str, Any] | ToolResult:
     """
     ============================================================
     RULES (MUST follow exactly):
@@ -327,51 +784,106 @@ def get_data(dataset: str, filters: Dict[str, str]) -> Dict[str, Any]:
         filters: Key-value pairs using 'id' values from 3_get_metadata().
                  PLFS MUST include frequency_code (1=Annual, 2=Quarterly, 3=Monthly).
                  Pass limit (e.g., "50", "100") if you expect more than 10 records.
+                 Once 3_get_metadata() has been called with the same metadata params, *_code
+                 values it does not list are rejected with invalid_codes, without calling the
+                 API (this check applies to every data tool).
+        max_bytes: Optional size budget for the response in bytes. If the data is larger,
+                   only the first rows that fit are returned, together with _summary
+                   (row count, distinct values per column, numeric min/max/mean) and _next_cursor.
+                   At least one row is always returned, even if it alone exceeds the budget.
+        max_tokens: Same as max_bytes, expressed in approximate LLM tokens.
+        cursor: _next_cursor from a previous 4_get_data response. Resumes exactly where that
+                response stopped; filters are taken from the cursor and MUST NOT be passed again.
+                Whenever more rows exist, the response includes _next_cursor.
+        max_pages: Fetch up to this many upstream pages (of `limit` rows each) in one call
+                   and merge them (default 1, max 20).
+        shard_size: For many states at once (PLFS, CPI, ASI): split filters.state_code into
+                    shards of this many codes, fetch them concurrently (each up to max_pages
+                    pages, default 20) and merge the rows, de-duplicated and sorted by series
+                    and period. Use instead of one call per state. Failed shards are listed
+                    in _failed_shards, shards with unread pages in _truncated_shards and
+                    pages that could not be read in _failed_pages.
+                    When max_bytes trims the merged rows, _next_cursor resumes from the
+                    server's copy of the merged result.
     """
-    dataset = dataset.upper()
-
-    # Auto-route CPI and IIP based on filters provided
-    if dataset == "CPI":
-        if "item_code" in filters:
-            dataset = "CPI_ITEM"
-        else:
-            dataset = "CPI_GROUP"
-
-    if dataset == "IIP":
-        if "month_code" in filters:
-            dataset = "IIP_MONTHLY"
-        else:
-            dataset = "IIP_ANNUAL"
-
-    # Map friendly names to API dataset keys
-    dataset_map = {
-        "CPI_GROUP": "CPI_Group",
-        "CPI_ITEM": "CPI_Item",
-        "IIP_ANNUAL": "IIP_Annual",
-        "IIP_MONTHLY": "IIP_Monthly",
-        "PLFS": "PLFS",
-        "ASI": "ASI",
-        "NAS": "NAS",
-        "WPI": "WPI",
-        "ENERGY": "Energy",
-    }
-
-    api_dataset = dataset_map.get(dataset)
-    if not api_dataset:
+    if cursor:
+        try:
+            state = decode_cursor(cursor)
+        except InvalidCursorError as e:
+            return {"error": str(e), "_hint": "Pass _next_cursor exactly as returned by 4_get_data."}
+        if not state["dataset"].startswith(dataset.upper()):
+            return {"error": f"Cursor belongs to dataset {state['dataset']}, not {dataset.upper()}."}
+        dataset = state["dataset"]
+        normalized_filters = state["filters"]
+        sharding = {key: normalized_filters.pop(key) for key in SHARD_CURSOR_FIELDS if key in normalized_filters}
+        page = state["page"]
+        offset = state["offset"]
+        snapshot = state["snapshot"] or int(time.time())
+    else:
+        filters = filters or {}
+        dataset = route_dataset(dataset, filters)
+        # Transform filters: skip None values and convert to strings
+        transformed_filters = transform_filters(filters)
+        page = transformed_filters.get("page") or "1"
+        normalized_filters = normalize_filters(transformed_filters)
+        sharding = {}
+        offset = 0
+        snapshot = int(time.time())
+
+    if dataset not in API_DATASET_MAP:
         return {"error": f"Unknown dataset: {dataset}", "valid_datasets": VALID_DATASETS}
 
-    # Transform filters: skip None values and convert to strings
-    transformed_filters = transform_filters(filters)
-
     # Validate params against swagger spec
-    validation = validate_filters(dataset, transformed_filters)
+    validation = validate_filters(dataset, {**normalized_filters, "page": str(page)})
     if not validation["valid"]:
         return {"error": "Invalid parameters", **validation}
 
-    result = mospi.get_data(api_dataset, transformed_filters)
+    page = int(str(page).strip())
+    limit = int(normalized_filters.get("limit") or DEFAULT_PAGE_LIMIT)
+    page_count = max(1, min(max_pages or 1, MAX_PAGES_PER_CALL))
+
+    # Fan a long state list out over concurrent shards instead of one packed request
+    state_codes = normalized_filters.get("state_code", "")
+    if shard_size and not cursor and len(split_codes(state_codes, 1)) > shard_size:
+        shard_pages = max(1, min(max_pages or MAX_PAGES_PER_CALL, MAX_PAGES_PER_CALL))
+        sharding = {"_shard_size": str(shard_size), "_shard_pages": str(shard_pages)}
+    if sharding:
+        result = get_sharded_data(dataset, normalized_filters, sharding, offset, snapshot,
+                                  budget_to_bytes(max_bytes, max_tokens))
+        return json_tool_result(result)
+
+    # Auto-paginate: fetch consecutive pages, tracking where each page's rows start
+    result = None
+    rows = []
+    spans = []  # (page, first_row_offset_in_page, row_count)
+    more = False
+    for i in range(page_count):
+        current = page + i
+        page_result = fetch_data_page(dataset, normalized_filters, current, snapshot, use_buffer=bool(cursor))
+        if not isinstance(page_result, dict) or not isinstance(page_result.get("data"), list):
+            if result is None:
+                result = page_result
+            break
+        skip = offset if i == 0 else 0
+        page_rows = page_result["data"][skip:]
+        spans.append((current, skip, len(page_rows)))
+        rows.extend(page_rows)
+        result = page_result
+        more = has_next_page(page_result, current, limit)
+        if not more:
+            break
+
+    if not isinstance(result, dict):
+        return result
+
+    if spans:
+        # Buffered page dicts are shared; build a new envelope around the merged rows
+        result = {**result, "data": rows}
+        if len(spans) > 1:
+            result["_pages_fetched"] = [span[0] for span in spans]
 
     # If no data found, hint to retry with different filters
-    if isinstance(result, dict) and result.get("msg") == "No Data Found":
+    if result.get("msg") == "No Data Found":
         result["_hint"] = (
             "No data for this filter combination. Try these fixes: "
             "1) Some filters represent the same concept under different params "
@@ -381,13 +893,608 @@ def get_data(dataset: str, filters: Dict[str, str]) -> Dict[str, Any]:
             "may already appear in the response without that filter."
         )
 
-    return result
+    if not spans:
+        return json_tool_result(result)
+
+    returned = None
+    budget = budget_to_bytes(max_bytes, max_tokens)
+    if budget:
+        result, returned = apply_budget(result, budget)
+
+    # Work out where the next call should resume
+    next_cursor = None
+    if returned is not None and returned < len(rows):
+        position = returned
+        for span_page, span_offset, span_rows in spans:
+            if position < span_rows:
+                next_cursor = encode_cursor(dataset, normalized_filters, span_page, span_offset + position, snapshot)
+                break
+            position -= span_rows
+    elif more:
+        next_cursor = encode_cursor(dataset, normalized_filters, spans[-1][0] + 1, 0, snapshot)
+
+    if next_cursor:
+        add_continuation(result, next_cursor, snapshot, summarized=returned is not None)
+
+    return json_tool_result(result)
+
+
+@mcp.tool(name="5_detect_structural_breaks", output_schema=OBJECT_OUTPUT_SCHEMA)
+def detect_structural_breaks(
+    dataset: str,
+    filters: Optional[Dict[str, str]] = None,
+    value_field: Optional[str] = None,
+    series_fields: Optional[List[str]] = None,
+    penalty: Optional[float] = None,
+    min_size: int = BREAK_MIN_SEGMENT,
+    max_pages: Optional[int] = None
+) -> Dict[str, Any] | ToolResult:
+    """
+    ============================================================
+    RULES (MUST follow exactly):
+    - You MUST have called 3_get_metadata() before this. No exceptions.
+    - You MUST use ONLY the filter values returned by 3_get_metadata().
+    - You MUST NOT guess, infer, or assume any filter codes.
+    - You MUST include all required params (marked required in api_params).
+    ============================================================
+
+    Find when a series shifted regime (structural breaks in its mean and variance),
+    e.g. "when did food inflation change regime?". The whole series is fetched and
+    analysed on the server; only the break dates and the segment mean/std either
+    side of each break are returned, not the data itself.
+
+    Args:
+        dataset: Dataset name (CPI, IIP, WPI, PLFS, NAS, ASI, ENERGY)
+        filters: Same filters as 4_get_data, using 'id' values from 3_get_metadata().
+                 Select the whole time range of interest (e.g. several years and all months).
+                 limit defaults to 500 rows per page.
+        value_field: Column to analyse (default: first of inflation, index_value, index, value)
+        series_fields: Columns that identify a series (default: all descriptive columns,
+                       e.g. state, sector, group)
+        penalty: Cost per break; higher finds fewer breaks (default 3 * log(points))
+        min_size: Minimum number of periods between breaks (default 6)
+        max_pages: Upstream pages to read (default and max 20)
+    """
+    filters = transform_filters(filters or {})
+    dataset = route_dataset(dataset, filters)
+    if dataset not in API_DATASET_MAP:
+        return {"error": f"Unknown dataset: {dataset}", "valid_datasets": VALID_DATASETS}
+
+    filters.setdefault("limit", str(ANALYSIS_PAGE_LIMIT))
+    filters = normalize_filters(filters)
+    validation = validate_filters(dataset, filters)
+    if not validation["valid"]:
+        return {"error": "Invalid parameters", **validation}
+    if min_size < 2:
+        return {"error": "min_size must be at least 2"}
+
+    loaded = load_series(dataset, filters, value_field, series_fields, max_pages)
+    if "failed" in loaded:
+        return json_tool_result(loaded["failed"])
+    if loaded["value_field"] is None:
+        return {"error": "No numeric value column found", "columns": loaded["columns"]}
+
+    results = []
+    for item in loaded["series"]:
+        changepoints = pelt_changepoints(item["values"], penalty, min_size)
+        breaks = [
+            {"period": format_period(item["periods"][entry.pop("position")]), **entry}
+            for entry in describe_breaks(item["values"], changepoints)
+        ]
+        results.append({
+            **item["key"],
+            "start": format_period(item["periods"][0]),
+            "end": format_period(item["periods"][-1]),
+            "points": len(item["values"]),
+            "breaks": breaks,
+        })
+
+    result = {
+        "dataset": dataset,
+        "value_field": loaded["value_field"],
+        "rows_fetched": loaded["rows_fetched"],
+        "series_count": len(results),
+        "series": results,
+    }
+    if loaded["truncated"]:
+        result["_truncated"] = True
+        result["_next_step"] = "Not all pages were read; narrow the filters or raise limit to cover the full series."
+    if loaded["failed_pages"]:
+        result["_failed_pages"] = loaded["failed_pages"]
+        result["_warning"] = FAILED_PAGES_WARNING
+    return json_tool_result(result)
+
+
+@mcp.tool(name="6_get_derived_metrics", output_schema=OBJECT_OUTPUT_SCHEMA)
+def get_derived_metrics(
+    dataset: str,
+    filters: Optional[Dict[str, str]] = None,
+    metrics: Optional[List[str]] = None,
+    window: int = 12,
+    value_field: Optional[str] = None,
+    series_fields: Optional[List[str]] = None,
+    max_pages: Optional[int] = None
+) -> Dict[str, Any] | ToolResult:
+    """
+    ============================================================
+    RULES (MUST follow exactly):
+    - You MUST have called 3_get_metadata() before this. No exceptions.
+    - You MUST use ONLY the filter values returned by 3_get_metadata().
+    - You MUST NOT guess, infer, or assume any filter codes.
+    - You MUST include all required params (marked required in api_params).
+    ============================================================
+
+    Compute inflation/growth rates from index levels on the server instead of doing
+    arithmetic on 4_get_data rows. Works for CPI, WPI and IIP index series.
+
+    The look-back the metrics need (the prior 12 months for YoY, the previous month
+    for MoM, window - 1 periods for rolling means) is fetched automatically; only the
+    requested year (or financial_year)/month_code periods are returned.
+
+    Args:
+        dataset: CPI, WPI or IIP
+        filters: Same filters as 4_get_data, using 'id' values from 3_get_metadata().
+                 limit defaults to 500 rows per page.
+        metrics: Any of "yoy" (% change on the same period a year earlier),
+                 "mom" (% change on the previous period) and "rolling_mean"
+                 (mean index over the last `window` periods). Default ["yoy"].
+        window: Periods in the rolling mean (default 12)
+        value_field: Index column to use (default: first of index_value, index, value)
+        series_fields: Columns that identify a series (default: all descriptive columns)
+        max_pages: Upstream pages to read (default and max 20)
+    """
+    metrics = metrics or ["yoy"]
+    unknown = [metric for metric in metrics if metric not in METRICS]
+    if unknown:
+        return {"error": f"Unknown metrics: {unknown}", "valid_metrics": list(METRICS)}
+    if window < 1:
+        return {"error": "window must be at least 1"}
+
+    filters = transform_filters(filters or {})
+    dataset = route_dataset(dataset, filters)
+    if dataset not in PERIODS_PER_YEAR:
+        return {"error": f"Derived metrics need an index dataset, not {dataset}", "valid_datasets": ["CPI", "WPI", "IIP"]}
+
+    filters.setdefault("limit", str(ANALYSIS_PAGE_LIMIT))
+    filters = normalize_filters(filters)
+    validation = validate_filters(dataset, filters)
+    if not validation["valid"]:
+        return {"error": "Invalid parameters", **validation}
+
+    per_year = PERIODS_PER_YEAR[dataset]
+    fetch_filters, requested = lookback_filters(filters, per_year, metric_lags(metrics, per_year, window))
+    loaded = load_series(dataset, fetch_filters, value_field, series_fields, max_pages, INDEX_VALUE_FIELDS)
+    if "failed" in loaded:
+        return json_tool_result(loaded["failed"])
+    if loaded["value_field"] is None:
+        return {"error": "No numeric index column found", "columns": loaded["columns"]}
+
+    results = []
+    for item in loaded["series"]:
+        points = [
+            {"period": format_period(period), **point}
+            for period, point in zip(item["periods"], derive_metrics(item["periods"], item["values"], metrics, window))
+            if in_window(period, requested)
+        ]
+        if points:
+            results.append({**item["key"], "points": points})
+
+    result = {
+        "dataset": dataset,
+        "value_field": loaded["value_field"],
+        "metrics": metrics,
+        "fetched_filters": fetch_filters,
+        "series_count": len(results),
+        "series": results,
+    }
+    if loaded["truncated"]:
+        result["_truncated"] = True
+        result["_next_step"] = "Not all pages were read; narrow the filters or raise limit to cover the full window."
+    if loaded["failed_pages"]:
+        result["_failed_pages"] = loaded["failed_pages"]
+        result["_warning"] = FAILED_PAGES_WARNING
+    return json_tool_result(result)
+
+
+def fetch_asi_block(
+    classification_year: str,
+    years: List[str],
+    filters: Dict[str, str],
+    max_pages: int
+) -> Dict[str, Any]:
+    """
+    Metadata then data for one NIC classification year, rows tagged with it.
+
+    The metadata year list narrows the requested years to those actually
+    published under the classification (the static range is used if the
+    metadata has no year list). Codes are checked against this classification's
+    metadata, since NIC codes differ between classification years; a block with
+    codes its metadata does not list is not fetched and reports invalid_codes.
+    """
+    block: Dict[str, Any] = {"classification_year": classification_year}
+    available = metadata_years(load_metadata("ASI", {"classification_year": classification_year}))
+    if available is not None:
+        years = [year for year in years if year in available]
+    block["years"] = years
+    if not years:
+        block["rows"] = []
+        return block
+
+    index = cached_filter_index("ASI", {"classification_year": classification_year})
+    unknown = invalid_codes(index, filters) if index is not None else {}
+    if unknown:
+        block["error"] = f"Codes not listed for classification year {classification_year}"
+        block["invalid_codes"] = unknown
+        block["rows"] = []
+        return block
+
+    request = normalize_filters({**filters, "classification_year": classification_year, "year": ",".join(years)})
+    rows, failed, more, failed_pages = fetch_all_rows("ASI", request, max_pages)
+    if failed is not None and not (isinstance(failed, dict) and failed.get("msg") == "No Data Found"):
+        block["error"] = str((failed.get("error") or failed.get("msg")) if isinstance(failed, dict) else failed)
+    if more:
+        block["truncated"] = True
+    if failed_pages:
+        block["failed_pages"] = failed_pages
+    block["rows"] = [{**row, "classification_year": classification_year} for row in rows if isinstance(row, dict)]
+    return block
+
+
+@mcp.tool(name="7_get_asi_across_classifications", output_schema=OBJECT_OUTPUT_SCHEMA)
+def get_asi_across_classifications(
+    start_year: str,
+    end_year: str,
+    filters: Optional[Dict[str, str]] = None,
+    max_pages: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+    max_tokens: Optional[int] = None
+) -> Dict[str, Any] | ToolResult:
+    """
+    ============================================================
+    RULES (MUST follow exactly):
+    - You MUST have called 3_get_metadata(dataset="ASI", ...) before this. No exceptions.
+    - You MUST use ONLY the filter values returned by 3_get_metadata().
+    - You MUST NOT guess, infer, or assume any filter codes.
+    ============================================================
+
+    ASI data for a long year range in one call. ASI years are published under four NIC
+    classification years ('1987' → 1992-93 to 1997-98, '1998' → 1998-99 to 2003-04,
+    '2004' → 2004-05 to 2007-08, '2008' → 2008-09 to 2023-24); this tool works out which
+    ones the range needs, fetches each concurrently and returns the rows concatenated
+    oldest first, each tagged with classification_year.
+
+    Args:
+        start_year: First financial year (e.g. "1995-96")
+        end_year: Last financial year (e.g. "2020-21")
+        filters: 4_get_data filters for ASI WITHOUT classification_year and year
+                 (e.g. sector_code, nic_type, indicator_code, state_code).
+                 nic_code values differ between classification years; prefer nic_type.
+                 Codes are checked against each classification year's metadata: blocks
+                 whose metadata does not list a code are skipped and listed in
+                 _invalid_codes, and the call fails only if every block is skipped.
+                 limit defaults to 500 rows per page.
+        max_pages: Upstream pages to read per classification year (default and max 20)
+        max_bytes: Optional size budget for the response in bytes (see 4_get_data)
+        max_tokens: Same as max_bytes, expressed in approximate LLM tokens
+    """
+    plan = plan_classification_years(start_year, end_year)
+    if not plan:
+        covered = f"{ASI_CLASSIFICATION_RANGES['1987'][0]} to {ASI_CLASSIFICATION_RANGES['2008'][1]}"
+        return {"error": f"No ASI data between {start_year} and {end_year}; ASI covers {covered}."}
+
+    filters = transform_filters(filters or {})
+    filters = {key: value for key, value in filters.items() if key not in ("classification_year", "year", "page")}
+    filters.setdefault("limit", str(ANALYSIS_PAGE_LIMIT))
+    # Param checks are the same for every classification year; codes are checked per block
+    validation = validate_filters("ASI", {**filters, "classification_year": plan[0][0]})
+    if not validation["valid"] and "invalid_codes" not in validation:
+        return {"error": "Invalid parameters", **validation}
+
+    page_count = max(1, min(max_pages or MAX_PAGES_PER_CALL, MAX_PAGES_PER_CALL))
+    with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_CLASSIFICATIONS, len(plan))) as pool:
+        blocks = list(pool.map(lambda item: fetch_asi_block(item[0], item[1], filters, page_count), plan))
+
+    invalid = {block["classification_year"]: block["invalid_codes"] for block in blocks if "invalid_codes" in block}
+    if invalid and all("invalid_codes" in block for block in blocks if block["years"]):
+        return {
+            "error": "Invalid parameters",
+            "invalid_codes": invalid,
+            "hint": "Codes not listed by 3_get_metadata(dataset=\"ASI\", classification_year=...) for any "
+                    "requested classification year. Use codes from its response, or nic_type.",
+        }
+
+    rows = []
+    for block in blocks:
+        block_rows = block.pop("rows")
+        block["row_count"] = len(block_rows)
+        rows.extend(block_rows)
+
+    result = {"dataset": "ASI", "classification_years": blocks, "data": rows}
+    if not rows:
+        result["msg"] = "No Data Found"
+    warnings = []
+    if invalid:
+        result["_invalid_codes"] = invalid
+        warnings.append(
+            f"Classification years {', '.join(invalid)} were skipped because their metadata does not list "
+            "some codes (see _invalid_codes); NIC codes differ between classification years."
+        )
+    failed_pages = {block["classification_year"]: block["failed_pages"] for block in blocks if "failed_pages" in block}
+    if failed_pages:
+        result["_failed_pages"] = failed_pages
+        warnings.append(FAILED_PAGES_WARNING)
+    if warnings:
+        result["_warning"] = " ".join(warnings)
+
+    budget = budget_to_bytes(max_bytes, max_tokens)
+    if budget:
+        result, _ = apply_budget(result, budget)
+    return json_tool_result(result)
+
+
+@mcp.tool(name="8_get_chain_linked_series", output_schema=OBJECT_OUTPUT_SCHEMA)
+def get_chain_linked_series(
+    dataset: str,
+    filters: Optional[Dict[str, str]] = None,
+    base_years: Optional[List[str]] = None,
+    value_field: Optional[str] = None,
+    series_fields: Optional[List[str]] = None,
+    max_pages: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+    max_tokens: Optional[int] = None
+) -> Dict[str, Any] | ToolResult:
+    """
+    ============================================================
+    RULES (MUST follow exactly):
+    - You MUST have called 3_get_metadata() before this. No exceptions.
+    - You MUST use ONLY the filter values returned by 3_get_metadata().
+    - You MUST NOT guess, infer, or assume any filter codes.
+    ============================================================
+
+    One long-run index series across base years (IIP: 2011-12, 2004-05, 1993-94;
+    CPI: 2012, 2010). Each base year is fetched concurrently; older series are
+    rescaled onto the newest base by the ratio of the two series' means over the
+    periods they share, and spliced in before the newer series starts.
+
+    Args:
+        dataset: CPI or IIP
+        filters: Same filters as 4_get_data, WITHOUT base_year. Codes must exist in every
+                 base year requested. limit defaults to 500 rows per page.
+        base_years: Base years to link, newest first (default: all for the dataset)
+        value_field: Index column to use (default: first of index_value, index, value)
+        series_fields: Columns that identify a series across base years (default: all
+                       descriptive columns except the base year)
+        max_pages: Upstream pages to read per base year (default and max 20)
+        max_bytes: Optional size budget for the response in bytes (see 4_get_data)
+        max_tokens: Same as max_bytes, expressed in approximate LLM tokens
+
+    Returns data rows (series columns, period, value on the newest base, source_base_year)
+    and, per series, the link factors and overlap used.
+    """
+    filters = transform_filters(filters or {})
+    dataset = route_dataset(dataset, filters)
+    if dataset not in BASE_YEARS:
+        return {"error": f"Chain-linking needs CPI or IIP, not {dataset}", "valid_datasets": ["CPI", "IIP"]}
+    base_years = list(base_years or BASE_YEARS[dataset])
+    unknown = [base for base in base_years if base not in BASE_YEARS[dataset]]
+    if unknown or len(base_years) < 2:
+        return {"error": f"Pass at least two of {list(BASE_YEARS[dataset])}", "invalid_base_years": unknown}
+    base_years.sort(key=BASE_YEARS[dataset].index)
+
+    filters.pop("base_year", None)
+    filters.setdefault("limit", str(ANALYSIS_PAGE_LIMIT))
+    filters = normalize_filters(filters)
+    validation = validate_filters(dataset, {**filters, "base_year": base_years[0]})
+    if not validation["valid"]:
+        return {"error": "Invalid parameters", **validation}
+
+    chain_filters = {**filters, "_base_years": ">".join(base_years), "_pages": str(max_pages or "")}
+    result = chain_cache.get(dataset, chain_filters, value_field, series_fields)
+    if result is None:
+        def load(base_year: str) -> Dict[str, Any]:
+            return load_series(dataset, {**filters, "base_year": base_year}, value_field, series_fields,
+                               max_pages, INDEX_VALUE_FIELDS)
+
+        with ThreadPoolExecutor(max_workers=len(base_years)) as pool:
+            loaded = dict(zip(base_years, pool.map(load, base_years)))
+
+        # Segments per series key (base-year columns dropped), newest base first
+        segments: Dict[Tuple, List[Tuple[str, List, List[float]]]] = {}
+        keys: Dict[Tuple, Dict[str, Any]] = {}
+        failed = {}
+        failed_pages = {}
+        for base_year in base_years:
+            if "failed" in loaded[base_year] or loaded[base_year]["value_field"] is None:
+                failed[base_year] = loaded[base_year].get("failed") or "No numeric index column found"
+                continue
+            if loaded[base_year]["failed_pages"]:
+                failed_pages[base_year] = loaded[base_year]["failed_pages"]
+            for item in loaded[base_year]["series"]:
+                key = {field: value for field, value in item["key"].items() if field not in BASE_YEAR_FIELDS}
+                identity = tuple(sorted((field, str(value)) for field, value in key.items()))
+                keys.setdefault(identity, key)
+                segments.setdefault(identity, []).append((base_year, item["periods"], item["values"]))
+
+        rows = []
+        links = []
+        for identity, parts in segments.items():
+            points, series_links = chain_link(parts)
+            rows.extend({**keys[identity], **point} for point in points)
+            links.append({**keys[identity], "base_years": [part[0] for part in parts], "links": series_links})
+
+        result = {"dataset": dataset, "base_years": base_years, "links": links, "data": rows}
+        if failed:
+            result["_failed_base_years"] = {base: str(reason) for base, reason in failed.items()}
+        if not rows:
+            result["msg"] = "No Data Found"
+        if failed_pages:
+            result["_failed_pages"] = failed_pages
+            result["_warning"] = FAILED_PAGES_WARNING
+        if not failed and not failed_pages:
+            chain_cache.put(dataset, chain_filters, value_field, series_fields, result)
+
+    budget = budget_to_bytes(max_bytes, max_tokens)
+    if budget:
+        result, _ = apply_budget(result, budget)
+    return json_tool_result(result)
+
+
+@mcp.tool(name="9_get_data_by_names", output_schema=OBJECT_OUTPUT_SCHEMA)
+def get_data_by_names(
+    dataset: str,
+    selectors: Optional[Dict[str, str] | str] = None,
+    filters: Optional[Dict[str, str]] = None,
+    indicator_code: Optional[int] = None,
+    base_year: Optional[str] = None,
+    level: Optional[str] = None,
+    frequency: Optional[str] = None,
+    classification_year: Optional[str] = None,
+    frequency_code: Optional[int] = None,
+    series: Optional[str] = None,
+    use_of_energy_balance_code: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+    max_tokens: Optional[int] = None,
+    max_pages: Optional[int] = None
+) -> Dict[str, Any] | ToolResult:
+    """
+    ============================================================
+    RULES (MUST follow exactly):
+    - Optional shortcut for steps 3 + 4 when the user names the breakdown in words.
+      The strict workflow (3_get_metadata then 4_get_data) remains valid and MUST be used
+      when this tool reports unresolved selectors you cannot fix from its "options".
+    - Selector values MUST come from the user's question or from "options" returned here.
+      MUST NOT invent codes.
+    - Pass the same metadata params you would pass to 3_get_metadata
+      (e.g. base_year/level for CPI, indicator_code/frequency_code for PLFS).
+    ============================================================
+
+    Resolve readable selector values to filter codes against the server's cached
+    3_get_metadata output, validate them, and return the data in one call.
+
+    Args:
+        dataset: Dataset name (PLFS, CPI, IIP, ASI, NAS, WPI, ENERGY)
+        selectors: Metadata dimensions and values by name or code, as a string
+                   ("state=Kerala, sector=Urban, group=Food and Beverages") or a dict
+                   ({"state": "Kerala,Tamil Nadu", "sector": "Urban"}). Values may be codes,
+                   names, common aliases (Orissa, J&K, TN), unambiguous prefixes or close
+                   misspellings; ambiguous values come back as unresolved with the candidates.
+        filters: Extra 4_get_data filters passed through unchanged (e.g. year, month_code, limit).
+        indicator_code, base_year, level, frequency, classification_year, frequency_code,
+        series, use_of_energy_balance_code: As in 3_get_metadata. Those that are also data
+                   params (e.g. base_year for CPI) are added to the data filters.
+        max_bytes, max_tokens, max_pages: As in 4_get_data.
+
+    The response is the 4_get_data response plus _resolved (selector value -> code/name)
+    and _filters (the filters used).
+    """
+    dataset = dataset.upper()
+    if dataset not in METADATA_SWAGGER_KEYS:
+        return {"error": f"Unknown dataset: {dataset}", "valid_datasets": VALID_DATASETS}
+    if dataset in ("PLFS", "NAS") and indicator_code is None:
+        return {"error": f"indicator_code is required for {dataset}"}
+
+    params = metadata_params(
+        dataset, indicator_code=indicator_code, base_year=base_year, level=level, frequency=frequency,
+        classification_year=classification_year, frequency_code=frequency_code, series=series,
+        use_of_energy_balance_code=use_of_energy_balance_code,
+    )
+    metadata = load_metadata(dataset, params)
+    index = metadata_cache.index(dataset, params)
+    if index is None:
+        return {"error": "Could not load metadata", "metadata": metadata}
+
+    codes, resolved, unresolved = resolve_selectors(index, parse_selectors(selectors))
+    if unresolved:
+        return {
+            "error": "Some selectors could not be resolved",
+            "unresolved": unresolved,
+            "resolved": resolved,
+            "_hint": "Pick values from options, or call 3_get_metadata() and 4_get_data() instead.",
+        }
 
+    routed = metadata_swagger_key(dataset, params)
+    data_params = get_swagger_params(routed)
+    data_filters = {
+        **{key: str(value) for key, value in params.items() if key in data_params and value is not None},
+        **transform_filters(filters or {}),
+        **codes,
+    }
+
+    result = get_data(routed, filters=data_filters, max_bytes=max_bytes, max_tokens=max_tokens, max_pages=max_pages)
+    if isinstance(result, ToolResult):
+        return with_extra_fields(result, _resolved=resolved, _filters=data_filters)
+    return {**result, "_resolved": resolved, "_filters": data_filters}
+
+
+# Static dataset overview served by 1_know_about_mospi_api (built once at startup)
+MOSPI_API_OVERVIEW = {
+    "total_datasets": 7,
+    "datasets": {
+        "PLFS": {
+            "name": "Periodic Labour Force Survey",
+            "description": "8 indicators covering labor market dynamics: Labour Force Participation Rate (LFPR), Worker Population Ratio (WPR), Unemployment Rate (UR), worker distribution by sector/industry, employment conditions for regular wage employees, and earnings data across three employment types—regular wages, casual labor, and self-employment.",
+            "use_for": "Jobs, unemployment, wages, workforce participation, employment conditions"
+        },
+        "CPI": {
+            "name": "Consumer Price Index",
+            "description": "Hierarchical commodity structure (Groups and Items) with base years 2010/2012. Tracks consumer inflation across 600+ items organized into food, fuel, housing, clothing, and miscellaneous categories. Supports state-level analysis at group level and All-India analysis at item level.",
+            "use_for": "Retail inflation, price indices, cost of living, commodity price trends"
+        },
+        "IIP": {
+            "name": "Index of Industrial Production",
+            "description": "Category-based structure with base years (1993-94, 2004-05, 2011-12) and frequency options (monthly/annual). Measures industrial output across manufacturing, mining, and electricity sectors using use-based classification (basic goods, capital goods, intermediate goods, consumer durables/non-durables).",
+            "use_for": "IIP index, industrial production index, manufacturing index, mining/electricity index, growth rates, textiles, metals, vehicles, consumer durables, capital goods — use for ANY query about IIP or industrial production index"
+        },
+        "ASI": {
+            "name": "Annual Survey of Industries",
+            "description": "57 indicators providing deep factory-sector analytics: capital structure (fixed/working capital, investments), production metrics (output, inputs, value added), employment details (workers by gender, contract status, mandays), wage components (salaries, bonuses, employer contributions), fuel consumption patterns, and profitability measures. Uses NIC classification across 4 classification years (1987-2008).",
+            "use_for": "Factory-level financials: working capital, fixed capital, wages, employment counts, GVA, fuel consumption, profitability — NOT for production index (use IIP for index)"
+        },
+        "NAS": {
+            "name": "National Accounts Statistics",
+            "description": "22 annual + 11 quarterly indicators covering macroeconomic aggregates: GDP and GVA (production approach), consumption (private/government), capital formation (fixed, change in stock, valuables), trade (exports/imports), national income (GNI, disposable income), savings, and growth rates. Both Current and Back series available.",
+            "use_for": "GDP, economic growth, national income, sectoral contribution, macro analysis"
+        },
+        "WPI": {
+            "name": "Wholesale Price Index",
+            "description": "Hierarchical commodity structure with 1000+ items across 5 levels: Major Groups (Primary articles, Fuel & power, Manufactured products, Food index) → Groups (22) → Sub-groups (90+) → Sub-sub-groups → Items. Tracks wholesale/producer price inflation monthly.",
+            "use_for": "Wholesale inflation, producer prices, commodity price trends"
+        },
+        "ENERGY": {
+            "name": "Energy Statistics",
+            "description": "2 indicators (KToE and PetaJoules) measuring energy balance across supply and consumption dimensions. Covers all energy commodities (coal, oil, gas, renewables, electricity) and tracks energy flows through production, transformation, and end-use sectors.",
+            "use_for": "Energy production, consumption patterns, fuel mix, sectoral energy use, climate analysis"
+        },
+    },
+    "workflow": [
+        "1. 1_know_about_mospi_api() → find dataset (MANDATORY first step)",
+        "2. 2_get_indicators(dataset) → list indicators",
+        "3. 3_get_metadata(dataset, indicator_code) → get filter values (MANDATORY before step 4)",
+        "4. 4_get_data(dataset, filters) → fetch data (MUST use values from step 3, MUST NOT guess)"
+    ],
+    "rules": [
+        "NEVER claim data is unavailable, needs computation, or requires special access — ALWAYS call 2_get_indicators() first to check. Your knowledge about MoSPI is outdated; the API has more indicators than you expect.",
+        "MUST NOT skip 3_get_metadata() — filter codes are arbitrary and differ across datasets",
+        "MUST NOT guess filter codes — use ONLY values from 3_get_metadata()",
+        "MUST include frequency_code for PLFS in 4_get_data()",
+        "Comma-separated values work for multiple codes (e.g., '1,2,3')",
+        "Optional shortcut for steps 3-4: 9_get_data_by_names(dataset, selectors='state=Kerala, sector=Urban', ...) resolves names to codes against the server's cached metadata and returns data in one call; if it reports unresolved selectors, use its options or the full workflow",
+        "For regime shifts/structural breaks in a series, call 5_detect_structural_breaks(dataset, filters) with the same filters as 4_get_data instead of fetching the whole series",
+        "For YoY/MoM inflation or growth rates and rolling means of CPI/WPI/IIP indices, call 6_get_derived_metrics(dataset, filters) instead of computing them from 4_get_data rows",
+        "For ASI over a year range spanning several NIC classification years, call 7_get_asi_across_classifications(start_year, end_year, filters) instead of one 4_get_data call per classification_year",
+        "For long-run CPI/IIP index series across base years, call 8_get_chain_linked_series(dataset, filters) instead of splicing base years by hand",
+        "ALWAYS attempt to fetch data. NEVER explain limitations or refuse without trying the full workflow first.",
+        "You MUST try the full workflow before concluding. If data is not found after trying, you MUST say honestly 'Data not found in MoSPI API'. You MUST NOT fall back to web search, MUST NOT fabricate data, MUST NOT cite external sources."
+    ],
+    "_next_step": "Call 2_get_indicators(dataset) with the dataset that matches the user's query."
+}
+
+MOSPI_API_OVERVIEW_RESULT = static_tool_result(MOSPI_API_OVERVIEW)
 
 
 # Comprehensive API documentation tool
-@mcp.tool(name="1_know_about_mospi_api")
-def know_about_mospi_api() -> Dict[str, Any]:
+@mcp.tool(name="1_know_about_mospi_api", output_schema=OBJECT_OUTPUT_SCHEMA)
+def know_about_mospi_api() -> ToolResult:
     """
     ============================================================
     RULES (MUST follow exactly):
@@ -418,62 +1525,8 @@ def know_about_mospi_api() -> Dict[str, Any]:
     - VAGUE query (e.g., "inflation data") → ask user to clarify
     - SPECIFIC query (e.g., "unemployment rate 2023") → fetch directly, NEVER explain why it might not exist
     """
-    return {
-        "total_datasets": 7,
-        "datasets": {
-            "PLFS": {
-                "name": "Periodic Labour Force Survey",
-                "description": "8 indicators covering labor market dynamics: Labour Force Participation Rate (LFPR), Worker Population Ratio (WPR), Unemployment Rate (UR), worker distribution by sector/industry, employment conditions for regular wage employees, and earnings data across three employment types—regular wages, casual labor, and self-employment.",
-                "use_for": "Jobs, unemployment, wages, workforce participation, employment conditions"
-            },
-            "CPI": {
-                "name": "Consumer Price Index",
-                "description": "Hierarchical commodity structure (Groups and Items) with base years 2010/2012. Tracks consumer inflation across 600+ items organized into food, fuel, housing, clothing, and miscellaneous categories. Supports state-level analysis at group level and All-India analysis at item level.",
-                "use_for": "Retail inflation, price indices, cost of living, commodity price trends"
-            },
-            "IIP": {
-                "name": "Index of Industrial Production",
-                "description": "Category-based structure with base years (1993-94, 2004-05, 2011-12) and frequency options (monthly/annual). Measures industrial output across manufacturing, mining, and electricity sectors using use-based classification (basic goods, capital goods, intermediate goods, consumer durables/non-durables).",
-                "use_for": "IIP index, industrial production index, manufacturing index, mining/electricity index, growth rates, textiles, metals, vehicles, consumer durables, capital goods — use for ANY query about IIP or industrial production index"
-            },
-            "ASI": {
-                "name": "Annual Survey of Industries",
-                "description": "57 indicators providing deep factory-sector analytics: capital structure (fixed/working capital, investments), production metrics (output, inputs, value added), employment details (workers by gender, contract status, mandays), wage components (salaries, bonuses, employer contributions), fuel consumption patterns, and profitability measures. Uses NIC classification across 4 classification years (1987-2008).",
-                "use_for": "Factory-level financials: working capital, fixed capital, wages, employment counts, GVA, fuel consumption, profitability — NOT for production index (use IIP for index)"
-            },
-            "NAS": {
-                "name": "National Accounts Statistics",
-                "description": "22 annual + 11 quarterly indicators covering macroeconomic aggregates: GDP and GVA (production approach), consumption (private/government), capital formation (fixed, change in stock, valuables), trade (exports/imports), national income (GNI, disposable income), savings, and growth rates. Both Current and Back series available.",
-                "use_for": "GDP, economic growth, national income, sectoral contribution, macro analysis"
-            },
-            "WPI": {
-                "name": "Wholesale Price Index",
-                "description": "Hierarchical commodity structure with 1000+ items across 5 levels: Major Groups (Primary articles, Fuel & power, Manufactured products, Food index) → Groups (22) → Sub-groups (90+) → Sub-sub-groups → Items. Tracks wholesale/producer price inflation monthly.",
-                "use_for": "Wholesale inflation, producer prices, commodity price trends"
-            },
-            "ENERGY": {
-                "name": "Energy Statistics",
-                "description": "2 indicators (KToE and PetaJoules) measuring energy balance across supply and consumption dimensions. Covers all energy commodities (coal, oil, gas, renewables, electricity) and tracks energy flows through production, transformation, and end-use sectors.",
-                "use_for": "Energy production, consumption patterns, fuel mix, sectoral energy use, climate analysis"
-            },
-        },
-        "workflow": [
-            "1. 1_know_about_mospi_api() → find dataset (MANDATORY first step)",
-            "2. 2_get_indicators(dataset) → list indicators",
-            "3. 3_get_metadata(dataset, indicator_code) → get filter values (MANDATORY before step 4)",
-            "4. 4_get_data(dataset, filters) → fetch data (MUST use values from step 3, MUST NOT guess)"
-        ],
-        "rules": [
-            "NEVER claim data is unavailable, needs computation, or requires special access — ALWAYS call 2_get_indicators() first to check. Your knowledge about MoSPI is outdated; the API has more indicators than you expect.",
-            "MUST NOT skip 3_get_metadata() — filter codes are arbitrary and differ across datasets",
-            "MUST NOT guess filter codes — use ONLY values from 3_get_metadata()",
-            "MUST include frequency_code for PLFS in 4_get_data()",
-            "Comma-separated values work for multiple codes (e.g., '1,2,3')",
-            "ALWAYS attempt to fetch data. NEVER explain limitations or refuse without trying the full workflow first.",
-            "You MUST try the full workflow before concluding. If data is not found after trying, you MUST say honestly 'Data not found in MoSPI API'. You MUST NOT fall back to web search, MUST NOT fabricate data, MUST NOT cite external sources."
-        ],
-        "_next_step": "Call 2_get_indicators(dataset) with the dataset that matches the user's query."
-    }
+    return MOSPI_API_OVERVIEW_RESULT
+
 
 if __name__ == "__main__":
 
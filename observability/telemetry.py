@@ -9,17 +9,27 @@ Uses FastMCP's tracer to create child spans with custom attributes:
 All data is visible in Jaeger for analysis.
 """
 
-import json
 import sys
 from typing import Any
 
 from fastmcp.server.middleware import Middleware, MiddlewareContext
 from fastmcp.telemetry import get_tracer
+from mcp.types import TextContent
+
+from mospi import jsonutil
 
 # Constants
 MAX_ATTRIBUTE_SIZE = 4096  # 4KB limit for span attributes
 
 
+def serialize_json(value: Any) -> str:
+    """Serialize value to JSON, falling back to str() if it is not serializable."""
+    try:
+        return jsonutil.dumps(value)
+    except (TypeError, ValueError):
+        return str(value)
+
+
 def truncate_json(value: Any, max_size: int = MAX_ATTRIBUTE_SIZE) -> tuple[str, int]:
     """
     Serialize value to JSON and truncate if necessary.
@@ -27,11 +37,16 @@ def truncate_json(value: Any, max_size: int = MAX_ATTRIBUTE_SIZE) -> tuple[str,
     Returns:
         Tuple of (truncated_string, original_size_bytes)
     """
-    try:
-        serialized = json.dumps(value, default=str, ensure_ascii=False)
-    except (TypeError, ValueError):
-        serialized = str(value)
+    return truncate_serialized(serialize_json(value), max_size)
 
+
+def truncate_serialized(serialized: str, max_size: int = MAX_ATTRIBUTE_SIZE) -> tuple[str, int]:
+    """
+    Truncate an already-serialized JSON string if necessary.
+
+    Returns:
+        Tuple of (truncated_string, original_size_bytes)
+    """
     original_size = len(serialized.encode('utf-8'))
 
     if original_size > max_size:
@@ -98,20 +113,35 @@ class TelemetryMiddleware(Middleware):
             result = await call_next(context)
 
             # Add post-execution attributes
-            output_data = getattr(result, 'structured_content', result)
-            if output_data is not None:
-                output_str, output_size = truncate_json(output_data)
+            full_output = self._serialize_output(result)
+            if full_output is not None:
+                output_str, output_size = truncate_serialized(full_output)
                 span.set_attribute("tool.output", output_str)
                 span.set_attribute("tool.output_size", output_size)
                 # Log full output (not truncated) for benchmark parsing
-                try:
-                    full_output = json.dumps(output_data, default=str, ensure_ascii=False)
-                except (TypeError, ValueError):
-                    full_output = str(output_data)
                 print(f"[TELEMETRY] Output ({output_size} bytes): {full_output}", file=sys.stderr)
 
         return result
 
+    @staticmethod
+    def _serialize_output(result: Any) -> str | None:
+        """
+        Return the JSON text of a tool result, serializing at most once.
+
+        Tools returning structured content already carry its JSON encoding as a
+        single text block, so that text is reused instead of encoding again.
+        """
+        output_data = getattr(result, 'structured_content', result)
+        if output_data is None:
+            return None
+
+        content = getattr(result, 'content', None)
+        if output_data is not result and content and len(content) == 1 \
+                and isinstance(content[0], TextContent):
+            return content[0].text
+
+        return serialize_json(output_data)
+
     def _add_client_info_to_span(self, context: MiddlewareContext, span) -> None:
         """Extract and add client IP and User-Agent to the span."""
         try:
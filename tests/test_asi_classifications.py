@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+ASI Classification Stitching Tests
+Offline tests for mapping financial years onto NIC classification years and
+7_get_asi_across_classifications; the upstream API is replaced by in-memory fakes
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import mospi_server  # noqa: E402
+from mospi.asi import financial_year, metadata_years, parse_financial_year, plan_classification_years  # noqa: E402
+from mospi.metadata import MetadataCache  # noqa: E402
+from mospi.pagination import PageBuffer  # noqa: E402
+
+ASI_FILTERS = {"sector_code": "Combined", "nic_type": "All", "indicator_code": "7"}
+
+
+@pytest.fixture
+def upstream(monkeypatch):
+    """
+    Fake ASI metadata and data endpoints. Classification 2004 lists only
+    2004-05 to 2006-07 in its metadata; classification 2008 data fails on request.
+    """
+    calls = {"metadata": [], "data": []}
+    published = {"1998": ["2003-04"], "2004": ["2004-05", "2005-06", "2006-07"], "2008": ["2008-09", "2009-10"]}
+
+    # NIC 2-digit codes listed per classification year; 15 (food products) became 10 in NIC 2008
+    nic_codes = {"1998": ["15", "17"], "2004": ["15", "17"], "2008": ["10", "13"]}
+
+    def fake_filters(classification_year="2008"):
+        calls["metadata"].append(classification_year)
+        return {"data": {
+            "year": [{"year": year} for year in published[classification_year]],
+            "nic": [{"nic_code": code, "nic_name": f"NIC {code}"} for code in nic_codes[classification_year]],
+        }}
+
+    def fake_get_data(dataset, params):
+        calls["data"].append(dict(params))
+        if params["classification_year"] == "2008" and fail_2008:
+            return {"error": "Upstream timeout"}
+        rows = [{"year": year, "indicator": "Wages", "value": 1000 + int(year[:4])} for year in params["year"].split(",")]
+        return {"data": rows, "meta_data": {"totalRecords": len(rows)}}
+
+    fail_2008 = False
+    monkeypatch.setattr(mospi_server.mospi, "get_asi_filters", fake_filters)
+    monkeypatch.setattr(mospi_server.mospi, "get_data", fake_get_data)
+    monkeypatch.setattr(mospi_server, "metadata_cache", MetadataCache())
+    monkeypatch.setattr(mospi_server, "page_buffer", PageBuffer())
+
+    def set_failing(value):
+        nonlocal fail_2008
+        fail_2008 = value
+
+    calls["fail_2008"] = set_failing
+    return calls
+
+
+# ============================================================================
+# YEAR PLANNING TESTS
+# ============================================================================
+
+def test_financial_year_labels():
+    """Test financial years format and parse both ways"""
+    assert financial_year(1999) == "1999-00"
+    assert parse_financial_year("2008-09") == 2008
+    assert parse_financial_year("FY 2010") == 2010
+    assert parse_financial_year(None) is None
+
+
+def test_plan_spans_classifications():
+    """Test a range is split into per-classification year blocks, oldest first"""
+    assert plan_classification_years("2003-04", "2009-10") == [
+        ("1998", ["2003-04"]),
+        ("2004", ["2004-05", "2005-06", "2006-07", "2007-08"]),
+        ("2008", ["2008-09", "2009-10"]),
+    ]
+    assert plan_classification_years("2009-10", "2008-09") == [("2008", ["2008-09", "2009-10"])]
+    assert plan_classification_years("1980-81", "1985-86") == []
+
+
+def test_metadata_years():
+    """Test financial years are read from a filters response, or None without a year list"""
+    assert metadata_years({"data": {"year": [{"year": "2005-06"}, "2004-05"]}}) == ["2004-05", "2005-06"]
+    assert metadata_years({"error": "timeout"}) is None
+
+
+# ============================================================================
+# 7_get_asi_across_classifications TESTS
+# ============================================================================
+
+def test_stitches_classifications(upstream):
+    """Test each classification is fetched for its published years and rows come back oldest first"""
+    result = mospi_server.get_asi_across_classifications("2003-04", "2009-10", filters=ASI_FILTERS).structured_content
+    assert sorted(upstream["metadata"]) == ["1998", "2004", "2008"]
+    blocks = {block["classification_year"]: block for block in result["classification_years"]}
+    # 2007-08 is in the static range but not in the 2004 metadata, so it is not requested
+    assert blocks["2004"]["years"] == ["2004-05", "2005-06", "2006-07"]
+    assert [row["year"] for row in result["data"]] == [
+        "2003-04", "2004-05", "2005-06", "2006-07", "2008-09", "2009-10",
+    ]
+    assert [row["classification_year"] for row in result["data"]] == ["1998"] + ["2004"] * 3 + ["2008"] * 2
+    assert all(call["limit"] == "500" for call in upstream["data"])
+
+
+def test_failed_classification_reported(upstream):
+    """Test a classification whose data request fails is reported alongside the others' rows"""
+    upstream["fail_2008"](True)
+    result = mospi_server.get_asi_across_classifications("2003-04", "2009-10", filters=ASI_FILTERS).structured_content
+    blocks = {block["classification_year"]: block for block in result["classification_years"]}
+    assert blocks["2008"]["error"] == "Upstream timeout"
+    assert blocks["2008"]["row_count"] == 0
+    assert len(result["data"]) == 4
+
+
+def test_range_outside_asi(upstream):
+    """Test a range with no ASI data is refused without upstream calls"""
+    result = mospi_server.get_asi_across_classifications("1980-81", "1985-86")
+    assert "No ASI data" in result["error"]
+    assert upstream["data"] == []
+
+
+def test_codes_checked_per_classification(upstream):
+    """Test a NIC code missing from one classification's metadata skips only that block, with a warning"""
+    filters = {**ASI_FILTERS, "nic_code": "15"}
+    result = mospi_server.get_asi_across_classifications("2003-04", "2009-10", filters=filters).structured_content
+    blocks = {block["classification_year"]: block for block in result["classification_years"]}
+    assert blocks["2008"]["invalid_codes"] == {"nic_code": ["15"]}
+    assert blocks["2008"]["row_count"] == 0
+    assert result["_invalid_codes"] == {"2008": {"nic_code": ["15"]}}
+    assert "2008" in result["_warning"]
+    assert {call["classification_year"] for call in upstream["data"]} == {"1998", "2004"}
+    assert len(result["data"]) == 4
+
+
+def test_codes_invalid_everywhere(upstream):
+    """Test a code no requested classification lists is refused without data requests"""
+    filters = {**ASI_FILTERS, "nic_code": "99"}
+    result = mospi_server.get_asi_across_classifications("2003-04", "2009-10", filters=filters)
+    assert result["error"] == "Invalid parameters"
+    assert set(result["invalid_codes"]) == {"1998", "2004", "2008"}
+    assert upstream["data"] == []
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Response Budget Tests
+Offline tests for max_bytes/max_tokens trimming and the cursors it hands out;
+the upstream API is replaced by an in-memory fake
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import mospi_server  # noqa: E402
+from mospi.pagination import PageBuffer  # noqa: E402
+from mospi.summary import apply_budget, budget_to_bytes  # noqa: E402
+
+
+def make_rows(count):
+    """WPI-like rows with enough text to make each one ~100 bytes."""
+    return [
+        {"year": 2020 + i // 12, "month": f"M{i % 12 + 1}", "item": f"Item number {i:04d}", "index_value": 100 + i}
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def upstream(monkeypatch):
+    """Serve make_rows(25) through a paginating fake of mospi.get_data and count the calls."""
+    rows = make_rows(25)
+    calls = []
+
+    def fake_get_data(dataset, params):
+        calls.append(dict(params))
+        limit = int(params.get("limit") or mospi_server.DEFAULT_PAGE_LIMIT)
+        page = int(params.get("page") or 1)
+        return {
+            "data": rows[(page - 1) * limit:page * limit],
+            "meta_data": {"totalRecords": len(rows), "page": page},
+            "statusCode": True,
+        }
+
+    monkeypatch.setattr(mospi_server.mospi, "get_data", fake_get_data)
+    monkeypatch.setattr(mospi_server, "page_buffer", PageBuffer())
+    return rows, calls
+
+
+def follow_cursors(max_bytes, max_calls=100):
+    """Call 4_get_data and follow _next_cursor to the end, returning every row received."""
+    received = []
+    response = mospi_server.get_data("WPI", filters={"limit": "10"}, max_bytes=max_bytes).structured_content
+    for _ in range(max_calls):
+        received.extend(response["data"])
+        if "_next_cursor" not in response:
+            return received
+        response = mospi_server.get_data("WPI", cursor=response["_next_cursor"], max_bytes=max_bytes).structured_content
+    pytest.fail(f"Cursor chain did not finish within {max_calls} calls")
+
+
+# ============================================================================
+# apply_budget TESTS
+# ============================================================================
+
+def test_budget_to_bytes_tighter_wins():
+    """Test byte and token budgets combine to the smaller one"""
+    assert budget_to_bytes(None, None) is None
+    assert budget_to_bytes(1000, None) == 1000
+    assert budget_to_bytes(None, 100) == 400
+    assert budget_to_bytes(1000, 100) == 400
+
+
+def test_apply_budget_fits_unchanged():
+    """Test a result well inside the budget is returned as is"""
+    result = {"data": make_rows(3)}
+    trimmed, returned = apply_budget(result, 100_000)
+    assert returned is None
+    assert trimmed is result
+
+
+def test_apply_budget_trims_with_summary():
+    """Test trimming keeps leading rows and summarises all of them"""
+    rows = make_rows(50)
+    trimmed, returned = apply_budget({"data": rows}, 3000)
+    assert 0 < returned < len(rows)
+    assert trimmed["data"] == rows[:returned]
+    assert trimmed["_summary"]["row_count"] == 50
+    assert trimmed["_summary"]["columns"]["index_value"]["max"] == 149
+    assert trimmed["_truncated"] == {"returned_rows": returned, "fetched_rows": 50, "budget_bytes": 3000}
+
+
+def test_apply_budget_tiny_budget_keeps_one_row():
+    """Test a budget smaller than the envelope still returns one row, flagged over budget"""
+    rows = make_rows(10)
+    trimmed, returned = apply_budget({"data": rows}, 100)
+    assert returned == 1
+    assert trimmed["data"] == rows[:1]
+    assert trimmed["_truncated"]["over_budget"] is True
+
+
+# ============================================================================
+# 4_get_data CURSOR TESTS
+# ============================================================================
+
+def test_tiny_budget_cursor_always_advances(upstream):
+    """Test following cursors with max_bytes=100 returns every row once and terminates"""
+    rows, _ = upstream
+    assert follow_cursors(max_bytes=100) == rows
+
+
+def test_budget_cursor_round_trip(upstream):
+    """Test a trimmed response resumes mid-page from the buffer without refetching"""
+    rows, calls = upstream
+    assert follow_cursors(max_bytes=1500) == rows
+    # Each upstream page is fetched once; cursor follow-ups inside a page read the buffer
+    assert sorted(call.get("page", "1") for call in calls) == ["1", "2", "3"]
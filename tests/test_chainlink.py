@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Chain-Linking Tests
+Offline tests for base-year link factors, splicing and
+8_get_chain_linked_series; the upstream API is replaced by an in-memory fake
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import mospi_server  # noqa: E402
+from mospi.chainlink import chain_link, link_factor  # noqa: E402
+from mospi.metadata import MetadataCache  # noqa: E402
+from mospi.pagination import PageBuffer  # noqa: E402
+from mospi.timeseries import SeriesCache  # noqa: E402
+
+
+def monthly(year, months, values):
+    return [(year, month, 12) for month in months], values
+
+
+@pytest.fixture
+def upstream(monkeypatch):
+    """
+    Fake CPI group endpoint: base 2012 covers 2013-2014, base 2010 covers
+    2011-2013 at exactly half the 2012-base level (so the link factor is 2).
+    """
+    calls = []
+
+    def level(year, month):
+        return 100.0 + (year - 2011) * 12 + month
+
+    def fake_get_data(dataset, params):
+        calls.append(dict(params))
+        base = params["base_year"]
+        years = range(2013, 2015) if base == "2012" else range(2011, 2014)
+        scale = 1.0 if base == "2012" else 0.5
+        rows = [
+            {"base_year": base, "sector": "Combined", "group": "Food", "year": year, "month": month,
+             "index": round(level(year, month) * scale, 3)}
+            for year in years for month in range(1, 13)
+        ]
+        return {"data": rows, "meta_data": {"totalRecords": len(rows)}}
+
+    monkeypatch.setattr(mospi_server.mospi, "get_data", fake_get_data)
+    monkeypatch.setattr(mospi_server, "page_buffer", PageBuffer())
+    monkeypatch.setattr(mospi_server, "series_cache", SeriesCache())
+    monkeypatch.setattr(mospi_server, "chain_cache", SeriesCache())
+    monkeypatch.setattr(mospi_server, "metadata_cache", MetadataCache())
+    return calls
+
+
+# ============================================================================
+# LINK FACTOR TESTS
+# ============================================================================
+
+def test_link_factor_ratio_of_overlap_means():
+    """Test the factor is mean(newer) / mean(older) over the shared periods only"""
+    newer = {(2012, 1, 12): 110.0, (2012, 2, 12): 130.0, (2012, 3, 12): 999.0}
+    older = {(2011, 12, 12): 1.0, (2012, 1, 12): 55.0, (2012, 2, 12): 65.0}
+    factor, overlap = link_factor(newer, older)
+    assert factor == pytest.approx(2.0)
+    assert overlap == [(2012, 1, 12), (2012, 2, 12)]
+
+
+def test_link_factor_no_overlap():
+    """Test disjoint or all-zero overlaps cannot be linked"""
+    assert link_factor({(2012, 1, 12): 1.0}, {(2011, 1, 12): 1.0}) is None
+    assert link_factor({(2012, 1, 12): 1.0}, {(2012, 1, 12): 0.0}) is None
+
+
+# ============================================================================
+# SPLICING TESTS
+# ============================================================================
+
+def test_chain_link_three_bases():
+    """Test older bases are rescaled in turn and only fill periods before the newer part"""
+    newest = monthly(2013, [1, 2, 3], [120.0, 121.0, 122.0])
+    middle = monthly(2013, [1, 2], [60.0, 60.5])
+    middle = ([(2012, 12, 12)] + middle[0], [59.0] + middle[1])
+    oldest = ([(2012, 11, 12), (2012, 12, 12)], [29.0, 29.5])
+    points, links = chain_link([("2012", *newest), ("2010", *middle), ("2004", *oldest)])
+
+    # The oldest base is linked to the already rescaled 2010 part: 118 / 29.5
+    assert [link["factor"] for link in links] == [2.0, 4.0]
+    assert [link["overlap_points"] for link in links] == [2, 1]
+    assert [(p["period"], p["value"], p["source_base_year"]) for p in points] == [
+        ("2012-11", 116.0, "2004"),
+        ("2012-12", 118.0, "2010"),
+        ("2013-01", 120.0, "2012"),
+        ("2013-02", 121.0, "2012"),
+        ("2013-03", 122.0, "2012"),
+    ]
+
+
+def test_chain_link_stops_at_gap():
+    """Test a base year that does not overlap is reported and not spliced"""
+    points, links = chain_link([
+        ("2012", *monthly(2013, [1, 2], [120.0, 121.0])),
+        ("2010", *monthly(2011, [1, 2], [50.0, 51.0])),
+    ])
+    assert [p["source_base_year"] for p in points] == ["2012", "2012"]
+    assert links == [{"base_year": "2010", "linked_to": "2012", "error": "No overlapping periods"}]
+
+
+# ============================================================================
+# 8_get_chain_linked_series TESTS
+# ============================================================================
+
+def test_chain_linked_tool(upstream):
+    """Test both bases are fetched, the series is spliced onto 2012 and the factor reported"""
+    result = mospi_server.get_chain_linked_series("CPI", filters={"series": "Current"}).structured_content
+    assert sorted(call["base_year"] for call in upstream) == ["2010", "2012"]
+    assert result["base_years"] == ["2012", "2010"]
+    assert len(result["links"]) == 1
+    link = result["links"][0]
+    assert (link["sector"], link["group"]) == ("Combined", "Food")
+    assert link["links"][0]["factor"] == pytest.approx(2.0)
+    assert link["links"][0]["overlap_points"] == 12
+
+    rows = result["data"]
+    assert len(rows) == 48
+    assert (rows[0]["period"], rows[0]["source_base_year"], rows[0]["value"]) == ("2011-01", "2010", 101.0)
+    assert (rows[-1]["period"], rows[-1]["source_base_year"]) == ("2014-12", "2012")
+
+
+def test_chain_linked_tool_cached(upstream):
+    """Test a repeated query is served from the chain cache"""
+    first = mospi_server.get_chain_linked_series("CPI", filters={"series": "Current"}).structured_content
+    calls = len(upstream)
+    second = mospi_server.get_chain_linked_series("CPI", filters={"series": "Current"}).structured_content
+    assert second == first
+    assert len(upstream) == calls
+
+
+def test_chain_linked_tool_rejects_unknown_base(upstream):
+    """Test base years outside the dataset's list are refused"""
+    result = mospi_server.get_chain_linked_series("CPI", filters={"series": "Current"}, base_years=["2012", "2001"])
+    assert result["invalid_base_years"] == ["2001"]
+    assert upstream == []
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Structural Break Tests
+Offline tests for PELT changepoints, whole-series fetching and
+5_detect_structural_breaks; the upstream API is replaced by an in-memory fake
+"""
+
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import mospi_server  # noqa: E402
+from mospi.changepoint import describe_breaks, pelt_changepoints  # noqa: E402
+from mospi.metadata import MetadataCache  # noqa: E402
+from mospi.pagination import PageBuffer  # noqa: E402
+from mospi.timeseries import SeriesCache  # noqa: E402
+
+
+def shifted_series(length=72, shift_at=36, seed=7):
+    """Noisy series whose mean jumps from 100 to 110 at shift_at."""
+    rng = random.Random(seed)
+    return [(100.0 if i < shift_at else 110.0) + rng.gauss(0, 1) for i in range(length)]
+
+
+@pytest.fixture
+def upstream(monkeypatch):
+    """Fake WPI endpoint: 6 years of monthly rows with a level shift, pages listed in `failing` return an error."""
+    values = shifted_series()
+    rows = [
+        {"year": 2018 + i // 12, "month": str(i % 12 + 1), "item": "Rice", "index_value": round(value, 3)}
+        for i, value in enumerate(values)
+    ]
+    failing = set()
+    calls = []
+
+    def fake_get_data(dataset, params):
+        page = int(params.get("page") or 1)
+        calls.append(page)
+        if page in failing:
+            return {"error": "Upstream timeout"}
+        limit = int(params.get("limit") or mospi_server.DEFAULT_PAGE_LIMIT)
+        return {"data": rows[(page - 1) * limit:page * limit], "meta_data": {"totalRecords": len(rows)}}
+
+    monkeypatch.setattr(mospi_server.mospi, "get_data", fake_get_data)
+    monkeypatch.setattr(mospi_server, "page_buffer", PageBuffer())
+    monkeypatch.setattr(mospi_server, "series_cache", SeriesCache())
+    monkeypatch.setattr(mospi_server, "metadata_cache", MetadataCache())
+    return rows, failing, calls
+
+
+# ============================================================================
+# PELT TESTS
+# ============================================================================
+
+def test_pelt_finds_mean_shift():
+    """Test a single clear mean shift is found at (or next to) its position"""
+    changepoints = pelt_changepoints(shifted_series())
+    assert len(changepoints) == 1
+    assert abs(changepoints[0] - 36) <= 1
+
+
+def test_pelt_flat_and_short_series():
+    """Test constant and too-short series have no changepoints"""
+    assert pelt_changepoints([5.0] * 40) == []
+    assert pelt_changepoints(shifted_series(length=10, shift_at=5), min_size=6) == []
+
+
+def test_pelt_respects_min_size():
+    """Test segments are never shorter than min_size"""
+    values = shifted_series(length=60, shift_at=30) + [130.0] * 3
+    changepoints = pelt_changepoints(values, min_size=6)
+    bounds = [0] + changepoints + [len(values)]
+    assert all(b - a >= 6 for a, b in zip(bounds, bounds[1:]))
+
+
+def test_describe_breaks():
+    """Test segment moments either side of a break"""
+    values = [1.0, 1.0, 1.0, 3.0, 3.0, 3.0]
+    assert describe_breaks(values, [3]) == [
+        {"position": 3, "mean_before": 1.0, "mean_after": 3.0, "std_before": 0.0, "std_after": 0.0},
+    ]
+
+
+def test_phase3_uses_shared_pelt():
+    """Test the Phase 3 analysis imports this implementation rather than its own"""
+    np = pytest.importorskip("numpy")
+    pytest.importorskip("pandas")
+    pytest.importorskip("scipy")
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "mcp-test-run-cc"))
+    import phase3_cpi_analysis
+
+    assert phase3_cpi_analysis.pelt_changepoints is pelt_changepoints
+    values = shifted_series()
+    chunk = phase3_cpi_analysis._detect_breaks_chunk(([(0, np.array(values))], None, 6))
+    assert chunk == [(0, pelt_changepoints(values))]
+
+
+# ============================================================================
+# WHOLE-SERIES FETCH TESTS
+# ============================================================================
+
+def test_fetch_all_rows_reads_every_page(upstream):
+    """Test every page is read, in order"""
+    rows, _, calls = upstream
+    fetched, failed, truncated, failed_pages = mospi_server.fetch_all_rows("WPI", {"limit": "10"})
+    assert fetched == rows
+    assert (failed, truncated, failed_pages) == (None, False, [])
+    assert sorted(calls) == list(range(1, 9))
+
+
+def test_fetch_all_rows_reports_failed_pages(upstream):
+    """Test a failed page is reported instead of silently dropped"""
+    rows, failing, _ = upstream
+    failing.add(3)
+    fetched, failed, _, failed_pages = mospi_server.fetch_all_rows("WPI", {"limit": "10"})
+    assert failed_pages == [3]
+    assert fetched == rows[:20] + rows[30:]
+
+
+def test_fetch_all_rows_max_pages(upstream):
+    """Test pages past max_pages are left unread and flagged"""
+    rows, _, _ = upstream
+    fetched, _, truncated, _ = mospi_server.fetch_all_rows("WPI", {"limit": "10"}, max_pages=2)
+    assert fetched == rows[:20]
+    assert truncated is True
+
+
+# ============================================================================
+# 5_detect_structural_breaks TESTS
+# ============================================================================
+
+def test_detect_breaks_tool(upstream):
+    """Test the tool returns the break period and segment means, not the data"""
+    result = mospi_server.detect_structural_breaks("WPI", filters={"limit": "10"}).structured_content
+    assert result["series_count"] == 1
+    series = result["series"][0]
+    assert (series["item"], series["start"], series["end"], series["points"]) == ("Rice", "2018-01", "2023-12", 72)
+    assert [entry["period"] for entry in series["breaks"]] in (["2020-12"], ["2021-01"], ["2021-02"])
+    assert "_failed_pages" not in result
+
+
+def test_detect_breaks_tool_flags_failed_pages(upstream):
+    """Test a failed page surfaces as _failed_pages and a warning, and is not cached"""
+    _, failing, calls = upstream
+    failing.add(5)
+    result = mospi_server.detect_structural_breaks("WPI", filters={"limit": "10"}).structured_content
+    assert result["_failed_pages"] == [5]
+    assert "gaps" in result["_warning"]
+
+    failing.clear()
+    calls.clear()
+    result = mospi_server.detect_structural_breaks("WPI", filters={"limit": "10"}).structured_content
+    assert calls, "series with failed pages must not be served from the cache"
+    assert "_failed_pages" not in result
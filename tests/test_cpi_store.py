@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+CPI Store Tests
+Offline tests for the Phase 3 SQLite store and the months the incremental
+CPIDataCollector still has to fetch
+"""
+
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("numpy")
+pytest.importorskip("pandas")
+pytest.importorskip("scipy")
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "mcp-test-run-cc"))
+
+from phase3_cpi_analysis import CPIDataCollector, CPIRecordColumnsBuilder, CPIRecordStore  # noqa: E402
+
+
+def stored_records(months, sector="Combined", group_code="1"):
+    """CPIRecordColumns with one All India row per (year, month)."""
+    builder = CPIRecordColumnsBuilder()
+    for year, month in months:
+        builder.append(
+            year=year, month=month, index_value=150.0 + month, sector=sector, group="Food",
+            group_code=group_code, subgroup=None, subgroup_code=None,
+            series="Current", base_year="2012", state="All India",
+        )
+    return builder.build()
+
+
+@pytest.fixture
+def collector():
+    """Collector whose window ends in June 2020."""
+    return CPIDataCollector(end_year=2020, end_month=6)
+
+
+# ============================================================================
+# CPIRecordStore TESTS
+# ============================================================================
+
+def test_store_round_trip(tmp_path):
+    """Test upserted records come back per series, and re-inserting a month replaces it"""
+    store = CPIRecordStore(str(tmp_path / "cpi.sqlite"))
+    store.upsert(stored_records([(2020, 1), (2020, 2)]))
+    store.upsert(stored_records([(2020, 2)]))
+    store.upsert(stored_records([(2020, 1)], sector="Rural"))
+
+    assert store.stored_months("2012", "Current", "All India") == {
+        ("Combined", "1"): {(2020, 1), (2020, 2)},
+        ("Rural", "1"): {(2020, 1)},
+    }
+    loaded = store.load("2012", "Current", "All India", (2020, 1), (2020, 12))
+    assert len(loaded) == 3
+    store.close()
+
+
+# ============================================================================
+# PENDING MONTHS TESTS
+# ============================================================================
+
+def test_pending_without_store(collector):
+    """Test an empty store fetches the whole window"""
+    assert collector._pending_months(None) == [(2020, [1, 2, 3, 4, 5, 6])]
+
+
+def test_pending_refetches_revision_months(collector):
+    """Test only months after the latest stored one, plus the last REVISION_MONTHS, are fetched"""
+    stored = {(2020, month) for month in range(1, 5)}
+    assert collector._pending_months(stored) == [(2020, [3, 4, 5, 6])]
+
+
+def test_pending_backfills_missing_months(collector):
+    """Test a month whose fetch failed on an earlier run is fetched again once later months are stored"""
+    stored = {(2020, 1), (2020, 3), (2020, 4), (2020, 5), (2020, 6)}
+    assert collector._pending_months(stored) == [(2020, [2, 5, 6])]
+
+
+def test_pending_spans_years():
+    """Test the revision window and gaps carry across a year boundary"""
+    collector = CPIDataCollector(end_year=2021, end_month=2)
+    stored = {(2020, month) for month in range(1, 13) if month != 4} | {(2021, 1)}
+    assert collector._pending_months(stored) == [(2020, [4, 12]), (2021, [1, 2])]
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Selector Fast Path Tests
+Offline tests for 9_get_data_by_names and the cached-metadata code check
+shared by the data tools; the upstream API is replaced by in-memory fakes
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import mospi_server  # noqa: E402
+from mospi.metadata import MetadataCache  # noqa: E402
+from mospi.pagination import PageBuffer  # noqa: E402
+
+CPI_METADATA = {
+    "data": {
+        "state": [{"state_code": 32, "state_name": "Kerala"}, {"state_code": 33, "state_name": "Tamil Nadu"},
+                  {"state_code": 99, "state_name": "ALL India"}],
+        "sector": [{"sector_code": 1, "sector_name": "Rural"}, {"sector_code": 2, "sector_name": "Urban"},
+                   {"sector_code": 3, "sector_name": "Combined"}],
+        "group": [{"group_code": 1, "group_name": "Food and Beverages"}],
+    },
+    "statusCode": True,
+}
+
+
+@pytest.fixture
+def upstream(monkeypatch):
+    """Fake CPI metadata and data endpoints, recording every call."""
+    calls = {"metadata": [], "data": []}
+
+    def fake_filters(**params):
+        calls["metadata"].append(params)
+        return CPI_METADATA
+
+    def fake_get_data(dataset, params):
+        calls["data"].append((dataset, dict(params)))
+        return {"data": [{"state_code": code, "index": 190.5} for code in params.get("state_code", "99").split(",")]}
+
+    monkeypatch.setattr(mospi_server.mospi, "get_cpi_filters", fake_filters)
+    monkeypatch.setattr(mospi_server.mospi, "get_data", fake_get_data)
+    monkeypatch.setattr(mospi_server, "metadata_cache", MetadataCache())
+    monkeypatch.setattr(mospi_server, "page_buffer", PageBuffer())
+    return calls
+
+
+def content(result):
+    return result.structured_content if hasattr(result, "structured_content") else result
+
+
+# ============================================================================
+# 9_get_data_by_names TESTS
+# ============================================================================
+
+def test_names_resolve_to_codes(upstream):
+    """Test selector names become codes and data comes back in one call"""
+    result = content(mospi_server.get_data_by_names(
+        "CPI", selectors="state=Kerela, TN, sector=Urban", filters={"series": "Current", "year": "2024"},
+    ))
+    assert result["_filters"] == {
+        "base_year": "2012", "series": "Current", "year": "2024", "state_code": "32,33", "sector_code": "2",
+    }
+    assert [entry["match"] for entry in result["_resolved"]["state"]] == ["fuzzy", "alias"]
+    assert [row["state_code"] for row in result["data"]] == ["32", "33"]
+    assert upstream["data"][0][0] == "CPI_Group"
+
+
+def test_unresolved_selector_returns_options(upstream):
+    """Test an unknown value returns suggestions and never calls the data endpoint"""
+    result = content(mospi_server.get_data_by_names("CPI", selectors={"state": "Keral, Goa"}))
+    assert result["error"] == "Some selectors could not be resolved"
+    assert result["resolved"]["state"][0]["name"] == "Kerala"
+    assert result["unresolved"][0]["value"] == "Goa"
+    assert upstream["data"] == []
+
+
+def test_metadata_is_fetched_once(upstream):
+    """Test repeated fast-path calls reuse the cached metadata"""
+    for _ in range(3):
+        mospi_server.get_data_by_names("CPI", selectors="state=Kerala", filters={"series": "Current"})
+    assert len(upstream["metadata"]) == 1
+    assert len(upstream["data"]) == 3
+
+
+# ============================================================================
+# CACHED-METADATA CODE CHECK TESTS
+# ============================================================================
+
+CPI_FILTERS = {"base_year": "2012", "series": "Current", "state_code": "32,40"}
+
+
+def test_unknown_code_passes_through_without_cached_metadata(upstream):
+    """Test codes are sent upstream unchecked when 3_get_metadata has not been called"""
+    result = content(mospi_server.get_data("CPI", filters=CPI_FILTERS))
+    assert "error" not in result
+    assert upstream["data"][0][1]["state_code"] == "32,40"
+
+
+def test_unknown_code_rejected_once_metadata_is_cached(upstream):
+    """Test a code the cached metadata does not list is rejected before any upstream call"""
+    mospi_server.load_metadata("CPI", mospi_server.metadata_params("CPI"))
+    result = content(mospi_server.get_data("CPI", filters=CPI_FILTERS))
+    assert result["error"] == "Invalid parameters"
+    assert result["invalid_codes"] == {"state_code": ["40"]}
+    assert upstream["data"] == []
+
+    # The same check guards the analysis tools
+    result = content(mospi_server.detect_structural_breaks("CPI", filters=CPI_FILTERS))
+    assert result["invalid_codes"] == {"state_code": ["40"]}
+    assert upstream["data"] == []
+
+    # Listed codes still go through
+    result = content(mospi_server.get_data("CPI", filters={**CPI_FILTERS, "state_code": "32,99"}))
+    assert "error" not in result
+
+
+def test_code_check_uses_matching_metadata_only(upstream):
+    """Test metadata cached for one base year does not judge requests for another"""
+    mospi_server.load_metadata("CPI", mospi_server.metadata_params("CPI"))
+    result = content(mospi_server.get_data("CPI", filters={**CPI_FILTERS, "base_year": "2010"}))
+    assert "error" not in result
+    assert len(upstream["data"]) == 1
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+State Fan-out Tests
+Offline tests for state_code sharding, shard merging and the cursors of a
+sharded 4_get_data call; the upstream API is replaced by an in-memory fake
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import mospi_server  # noqa: E402
+from mospi.fanout import merge_rows, split_codes  # noqa: E402
+from mospi.metadata import MetadataCache  # noqa: E402
+from mospi.pagination import PageBuffer  # noqa: E402
+
+STATE_CODES = ",".join(str(code) for code in range(1, 13))
+CPI_FILTERS = {"base_year": "2012", "series": "Current", "year": "2024", "state_code": STATE_CODES, "limit": "100"}
+
+
+@pytest.fixture
+def upstream(monkeypatch):
+    """Fake CPI endpoint returning one row per requested state and month, counting the calls."""
+    calls = []
+
+    def fake_get_data(dataset, params):
+        calls.append(dict(params))
+        if "11" in params["state_code"].split(","):
+            return {"error": "Upstream timeout"}
+        rows = [
+            {"state_code": code, "year": 2024, "month": month, "index": 180.0 + int(code) + i}
+            for code in params["state_code"].split(",")
+            for i, month in enumerate(["January", "February", "March"])
+        ]
+        return {"data": rows, "meta_data": {"totalRecords": len(rows)}}
+
+    monkeypatch.setattr(mospi_server.mospi, "get_data", fake_get_data)
+    monkeypatch.setattr(mospi_server, "page_buffer", PageBuffer())
+    monkeypatch.setattr(mospi_server, "metadata_cache", MetadataCache())
+    return calls
+
+
+# ============================================================================
+# SHARDING AND MERGING TESTS
+# ============================================================================
+
+def test_split_codes():
+    """Test codes are split in order into shards of at most shard_size"""
+    assert split_codes(" 1, 2,3,,4,5 ", 2) == ["1,2", "3,4", "5"]
+    assert split_codes("1,2", 0) == ["1", "2"]
+    assert split_codes("", 3) == []
+
+
+def test_merge_rows_dedupes_and_sorts_numerically():
+    """Test merged rows drop duplicates and sort state codes as numbers, then by period"""
+    shards = [
+        [{"state_code": "10", "year": 2024, "month": "February", "index": 1},
+         {"state_code": "2", "year": 2024, "month": "January", "index": 2}],
+        [{"state_code": "2", "year": 2024, "month": "January", "index": 2},
+         {"state_code": "10", "year": 2024, "month": "January", "index": 3},
+         {"state_code": "1", "year": 2024, "month": "March", "index": 4},
+         {"state_code": "All India", "year": 2024, "month": "January", "index": 5}],
+    ]
+    merged = merge_rows(shards)
+    assert [(row["state_code"], row["month"]) for row in merged] == [
+        ("1", "March"), ("2", "January"), ("10", "January"), ("10", "February"), ("All India", "January"),
+    ]
+
+
+# ============================================================================
+# SHARDED 4_get_data TESTS
+# ============================================================================
+
+def test_sharded_call_merges_and_reports_failures(upstream):
+    """Test a sharded call merges shard rows in numeric state order and lists the failed shard"""
+    result = mospi_server.get_data("CPI", filters=CPI_FILTERS, shard_size=4).structured_content
+    assert result["_shards"] == 3
+    assert result["_failed_shards"] == [{"state_code": "9,10,11,12", "error": "Upstream timeout"}]
+    states = [row["state_code"] for row in result["data"]]
+    assert states == sorted(states, key=int)
+    assert states[::3] == [str(code) for code in range(1, 9)]
+    assert "_next_cursor" not in result
+
+
+def test_sharded_budget_cursor_resumes_from_buffer(upstream):
+    """Test a budget-trimmed sharded call hands out cursors that walk the merged rows without refetching"""
+    result = mospi_server.get_data("CPI", filters=CPI_FILTERS, shard_size=4, max_bytes=1200).structured_content
+    expected_rows = 8 * 3
+    received = []
+    for _ in range(expected_rows):
+        received.extend(result["data"])
+        if "_next_cursor" not in result:
+            break
+        result = mospi_server.get_data("CPI", cursor=result["_next_cursor"], max_bytes=1200).structured_content
+    assert len(received) == expected_rows
+    assert len({(row["state_code"], row["month"]) for row in received}) == expected_rows
+    assert len(upstream) == 3
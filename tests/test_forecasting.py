@@ -0,0 +1,466 @@
+#!/usr/bin/env python3
+"""
+Forecasting Core Tests
+Offline tests for the Phase 4 numerical core (SARIMA estimation, order search,
+Holt-Winters, linear trends, ensembles and scenarios, simulation, forecast
+cache, rolling-origin backtest), on simulated series with known parameters
+"""
+
+import logging
+import os
+import sys
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pd = pytest.importorskip("pandas")
+pytest.importorskip("scipy")
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "mcp-test-run-cc"))
+
+import phase4_forecasting as forecasting  # noqa: E402
+
+logging.getLogger(forecasting.__name__).setLevel(logging.WARNING)
+
+
+def arma_series(n, ar=0.0, ma=0.0, seed=0, burn=200):
+    """Simulated zero-mean ARMA(1,1) series with unit innovations."""
+    rng = np.random.default_rng(seed)
+    e = rng.normal(size=n + burn)
+    x = np.zeros(n + burn)
+    for t in range(1, n + burn):
+        x[t] = ar * x[t - 1] + e[t] + ma * e[t - 1]
+    return x[burn:]
+
+
+def seasonal_series(n=60, seed=8):
+    """Trending monthly series with multiplicative seasonality."""
+    rng = np.random.default_rng(seed)
+    t = np.arange(n)
+    values = (120 + 0.5 * t) * (1 + 0.02 * np.sin(2 * np.pi * t / 12)) + rng.normal(0, 0.3, n)
+    return pd.Series(values, index=pd.date_range("2019-01-01", periods=n, freq="MS"))
+
+
+# ============================================================================
+# SARIMA ESTIMATION TESTS
+# ============================================================================
+
+def test_kalman_filter_ar1_innovations():
+    """Test AR(1) innovations: the first is scaled by the stationary variance, the rest are x_t - phi x_{t-1}"""
+    x = arma_series(50, ar=0.5, seed=1)
+    v, F, _ = forecasting._kalman_filter(x, np.array([0.5]), np.zeros(0))
+    assert F[0] == pytest.approx(1 / (1 - 0.25))
+    assert v[0] == pytest.approx(x[0])
+    np.testing.assert_allclose(v[1:], x[1:] - 0.5 * x[:-1], atol=1e-9)
+    np.testing.assert_allclose(F[1:], 1.0, atol=1e-9)
+
+
+def test_kalman_filter_batched_matches_single():
+    """Test filtering several models at once gives each model's own innovations"""
+    x = arma_series(80, ar=0.3, ma=0.4, seed=2)
+    ar = np.array([[0.3], [0.7]])
+    ma = np.array([[0.4], [-0.2]])
+    v, F, state = forecasting._kalman_filter(x, ar, ma)
+    for i in range(2):
+        v_i, F_i, state_i = forecasting._kalman_filter(x, ar[i], ma[i])
+        np.testing.assert_allclose(v[i], v_i)
+        np.testing.assert_allclose(F[i], F_i)
+        np.testing.assert_allclose(state[i], state_i)
+
+
+@pytest.mark.parametrize("order, ar, ma, field, expected", [
+    ((1, 0, 0, 0, 0, 0), 0.6, 0.0, "ar", 0.6),
+    ((0, 0, 1, 0, 0, 0), 0.0, 0.5, "ma", 0.5),
+])
+def test_fit_sarima_recovers_parameters(order, ar, ma, field, expected):
+    """Test the maximum-likelihood fit recovers AR(1) and MA(1) coefficients and unit variance"""
+    values = 100 + arma_series(600, ar=ar, ma=ma, seed=3)
+    estimate = forecasting.fit_sarima(values, order)
+    assert getattr(estimate, field)[0] == pytest.approx(expected, abs=0.08)
+    assert estimate.sigma2 == pytest.approx(1.0, abs=0.15)
+    assert estimate.mean == pytest.approx(100.0, abs=0.5)
+    assert estimate.nobs == 600
+
+
+def test_fit_sarima_warm_start_matches_cold_start():
+    """Test a warm start from the nested smaller order reaches the same optimum"""
+    values = arma_series(300, ar=0.5, ma=0.3, seed=4)
+    small = forecasting.fit_sarima(values, (1, 0, 0, 0, 0, 0))
+    start = forecasting.warm_start_params((1, 0, 1, 0, 0, 0), {(1, 0, 0, 0, 0, 0): small.params})
+    warm = forecasting.fit_sarima(values, (1, 0, 1, 0, 0, 0), start_params=start)
+    cold = forecasting.fit_sarima(values, (1, 0, 1, 0, 0, 0))
+    assert warm.loglike == pytest.approx(cold.loglike, abs=1e-3)
+
+
+def test_sarima_restore_reproduces_fit():
+    """Test rebuilding an estimate from stored parameters gives the same likelihood and state"""
+    values = 50 + np.cumsum(arma_series(120, ar=0.4, seed=5))
+    estimate = forecasting.fit_sarima(values, (1, 1, 0, 0, 0, 0))
+    restored = forecasting.sarima_restore(values, estimate.order, estimate.params, estimate.mean)
+    assert restored.loglike == pytest.approx(estimate.loglike)
+    np.testing.assert_allclose(restored.state, estimate.state)
+
+
+# ============================================================================
+# DIFFERENCING AND ORDER SEARCH TESTS
+# ============================================================================
+
+def test_select_differencing():
+    """Test stationary, random-walk and seasonal series get the expected (d, D)"""
+    rng = np.random.default_rng(6)
+    t = np.arange(72)
+    assert forecasting.select_differencing(100 + arma_series(72, ar=0.3, seed=6)) == (0, 0)
+    assert forecasting.select_differencing(100 + np.cumsum(rng.normal(size=72))) == (1, 0)
+    seasonal = 100 + 0.4 * t + 3 * np.sin(2 * np.pi * t / 12) + rng.normal(0, 0.5, 72)
+    assert forecasting.select_differencing(seasonal)[1] == 1
+
+
+def test_order_search_compares_only_one_differencing():
+    """Test a stationary series without seasonality is not pushed to D=1 by incomparable AICs"""
+    for seed in range(4):
+        series = pd.Series(100 + arma_series(60, ar=0.3, seed=10 + seed))
+        search = forecasting.SARIMAOrderSearch({"s": series}, max_workers=1)
+        order, aic = search.run()["s"]
+        assert np.isfinite(aic)
+        assert order[4] == 0
+        assert all((o[1], o[4]) == search.differencing["s"] for o in search.fitted["s"])
+
+
+def test_order_search_pool_matches_in_process():
+    """Test the process-pool search picks the same orders and AICs as the in-process one"""
+    series = {
+        "Rural": pd.Series(100 + arma_series(60, ar=0.5, seed=20)),
+        "Urban": seasonal_series(60, seed=21),
+    }
+    in_process = forecasting.SARIMAOrderSearch(series, max_workers=1).run()
+    pooled = forecasting.SARIMAOrderSearch(series, max_workers=2).run()
+    assert set(pooled) == {"Rural", "Urban"}
+    for key, (order, aic) in in_process.items():
+        assert pooled[key][0] == order
+        assert pooled[key][1] == pytest.approx(aic)
+
+
+def test_order_search_stops_early():
+    """Test patience stops a series before every candidate of its (d, D) is fitted"""
+    series = pd.Series(100 + arma_series(60, ar=0.3, seed=22))
+    search = forecasting.SARIMAOrderSearch({"s": series}, max_workers=1, patience=1)
+    search.run()
+    candidates = [
+        order for level in search.candidate_levels() for order in level
+        if (order[1], order[4]) == search.differencing["s"]
+    ]
+    assert 0 < search.tested["s"] < len(candidates)
+
+
+# ============================================================================
+# HOLT-WINTERS TESTS
+# ============================================================================
+
+def holt_winters_reference(y, alpha, beta, gamma, s=12):
+    """Scalar multiplicative Holt-Winters recursion, one observation at a time."""
+    level = np.mean(y[:s])
+    trend = (np.mean(y[s:2 * s]) - level) / s
+    seasonals = list(y[:s] / level)
+    fitted = []
+    for t, value in enumerate(y):
+        season = seasonals[t % s]
+        fitted.append((level + trend) * season)
+        new_level = alpha * value / season + (1 - alpha) * (level + trend)
+        seasonals[t % s] = gamma * value / new_level + (1 - gamma) * season
+        trend = beta * (new_level - level) + (1 - beta) * trend
+        level = new_level
+    return np.array(fitted), level, trend
+
+
+def test_holt_winters_filter_matches_reference():
+    """Test the vectorized filter reproduces the textbook recursion for each parameter set"""
+    y = seasonal_series().to_numpy()
+    params = np.array([[0.3, 0.1, 0.2], [0.8, 0.05, 0.5]])
+    fitted, level, trend, _ = forecasting.holt_winters_filter(
+        np.vstack([y, y]), *params.T, 12, "multiplicative"
+    )
+    for row, (alpha, beta, gamma) in enumerate(params):
+        expected, expected_level, expected_trend = holt_winters_reference(y, alpha, beta, gamma)
+        np.testing.assert_allclose(fitted[row], expected)
+        assert level[row] == pytest.approx(expected_level)
+        assert trend[row] == pytest.approx(expected_trend)
+
+
+def test_holt_winters_batch_matches_single_fits():
+    """Test fitting a (series, time) array gives each series its own single-series fit"""
+    Y = np.vstack([seasonal_series(seed=seed).to_numpy() for seed in (30, 31, 32)])
+    batch = forecasting.fit_holt_winters(Y, 12, "multiplicative")
+    for row in range(len(Y)):
+        single = forecasting.fit_holt_winters(Y[row], 12, "multiplicative")
+        assert batch.sse[row] == pytest.approx(single.sse[0], rel=1e-3)
+        np.testing.assert_allclose(batch.forecast(6)[row], single.forecast(6)[0], rtol=1e-3)
+
+
+def test_exponential_smoothing_fit_many():
+    """Test fit_many batches equal-length series and skips ones shorter than two seasons"""
+    series = {"a": seasonal_series(seed=33), "b": seasonal_series(seed=34), "short": seasonal_series(20)}
+    fitted = forecasting.ExponentialSmoothingForecaster.fit_many(series)
+    assert set(fitted) == {"a", "b"}
+    single = forecasting.ExponentialSmoothingForecaster(series["a"])
+    assert single.fit()
+    np.testing.assert_allclose(fitted["a"].fitted_model, single.fitted_model, rtol=1e-3)
+
+
+# ============================================================================
+# LINEAR TREND TESTS
+# ============================================================================
+
+def test_linear_trends_match_polyfit():
+    """Test the batched least-squares fit equals np.polyfit on each column"""
+    rng = np.random.default_rng(40)
+    Y = 100 + np.arange(48)[:, None] * rng.uniform(-0.5, 0.5, 5) + rng.normal(0, 1, (48, 5))
+    trend_fit = forecasting.fit_linear_trends(Y)
+    for column in range(5):
+        slope, intercept = np.polyfit(np.arange(48), Y[:, column], 1)
+        assert trend_fit.slope[column] == pytest.approx(slope)
+        assert trend_fit.intercept[column] == pytest.approx(intercept)
+        residuals = Y[:, column] - (intercept + slope * np.arange(48))
+        assert trend_fit.sigma2[column] == pytest.approx(residuals @ residuals / 46)
+
+
+def test_linear_trend_prediction_errors():
+    """Test predict gives the OLS prediction standard error, widening with the horizon"""
+    Y = seasonal_series(36).to_numpy()
+    trend_fit = forecasting.fit_linear_trends(Y)
+    forecast, std_errors = trend_fit.predict(3)
+    t = np.arange(36)
+    for step, x0 in enumerate(range(36, 39)):
+        leverage = 1 + 1 / 36 + (x0 - t.mean()) ** 2 / np.sum((t - t.mean()) ** 2)
+        assert std_errors[step, 0] == pytest.approx(np.sqrt(trend_fit.sigma2[0] * leverage))
+        assert forecast[step, 0] == pytest.approx(trend_fit.intercept[0] + trend_fit.slope[0] * x0)
+    assert np.all(np.diff(std_errors[:, 0]) > 0)
+
+
+def test_linear_trend_fit_many_and_missing_values():
+    """Test fit_many fits every column of an aligned frame, and gaps are rejected"""
+    frame = pd.DataFrame({"a": seasonal_series(seed=41), "b": seasonal_series(seed=42)})
+    forecasters = forecasting.LinearTrendForecaster.fit_many(frame)
+    single = forecasting.LinearTrendForecaster(frame["b"])
+    single.fit()
+    assert forecasters["b"].slope == pytest.approx(single.slope)
+    assert forecasters["b"].intercept == pytest.approx(single.intercept)
+    frame.iloc[5, 0] = np.nan
+    with pytest.raises(ValueError):
+        forecasting.fit_linear_trends(frame.to_numpy())
+
+
+# ============================================================================
+# ENSEMBLE AND SCENARIO TESTS
+# ============================================================================
+
+def test_ensemble_array_weights_and_missing_models():
+    """Test weights are applied per field and renormalised over the models forecasting each horizon"""
+    stacked = np.full((2, 3, len(forecasting.FORECAST_FIELDS)), np.nan)
+    stacked[:, 0] = 100.0
+    stacked[:, 1] = 110.0
+    stacked[0, 2] = 130.0
+    ensemble = forecasting.ensemble_array(stacked, [2.0, 1.0, 1.0])
+    np.testing.assert_allclose(ensemble[0], (200 + 110 + 130) / 4)
+    np.testing.assert_allclose(ensemble[1], (200 + 110) / 3)
+    np.testing.assert_allclose(forecasting.ensemble_array(stacked)[1], 105.0)
+    assert np.isnan(forecasting.ensemble_array(np.full((1, 2, 6), np.nan))).all()
+
+
+def test_scenario_arrays():
+    """Test optimistic/pessimistic paths follow the 80% bounds and YoY is re-based on the prior-year index"""
+    base = np.array([[105.0, 101.0, 109.0, 102.0, 108.0, 5.0]])
+    scenarios = forecasting.ScenarioGenerator.scenario_arrays(base)
+    base_case, optimistic, pessimistic = scenarios
+    np.testing.assert_array_equal(base_case, base)
+    assert optimistic[0, forecasting.INDEX] == 102.0 and pessimistic[0, forecasting.INDEX] == 108.0
+    assert optimistic[0, forecasting.UPPER_95] == optimistic[0, forecasting.UPPER_80] == 105.0
+    assert pessimistic[0, forecasting.LOWER_95] == pessimistic[0, forecasting.LOWER_80] == 105.0
+    assert optimistic[0, forecasting.YOY] == pytest.approx((102 / 100 - 1) * 100)
+    assert pessimistic[0, forecasting.YOY] == pytest.approx((108 / 100 - 1) * 100)
+
+
+def test_points_from_array_round_trip():
+    """Test ForecastPoints built from an array convert back to it, skipping rows with no forecast"""
+    array = np.array([[105.0, 101.0, 109.0, 102.0, 108.0, 5.0], [np.nan] * 6])
+    dates = forecasting.forecast_dates(pd.Timestamp("2024-12-01"), 2)
+    points = forecasting.points_from_array(array, dates, "Base", "Ensemble")
+    assert len(points) == 1
+    assert (points[0].month, points[0].year, points[0].date) == ("JAN", 2025, pd.Timestamp("2025-01-01"))
+    np.testing.assert_array_equal(forecasting.forecast_array(points, 2), array)
+
+
+# ============================================================================
+# MONTE CARLO TESTS
+# ============================================================================
+
+def monthly_forecaster(n=60, last="2024-12-01", seed=7):
+    """SARIMA(1,1,0) forecaster fitted to a trending monthly series ending at `last`."""
+    values = 150 + np.cumsum(0.4 + arma_series(n, ar=0.3, seed=seed) * 0.3)
+    series = pd.Series(values, index=pd.date_range(end=last, periods=n, freq="MS"))
+    forecaster = forecasting.SARIMAForecaster(series, name="Combined")
+    assert forecaster.fit(1, 1, 0, 0, 0, 0)
+    return forecaster
+
+
+def test_simulation_dates_are_calendar_months():
+    """Test horizon 1 is the month after the last observation, not 30 days later"""
+    fan, exceedance = forecasting.MonteCarloSimulator(
+        {"Combined": monthly_forecaster()}, periods=3, n_paths=200,
+    ).run()
+    dates = exceedance["date"].tolist()
+    assert dates == [pd.Timestamp("2025-01-01"), pd.Timestamp("2025-02-01"), pd.Timestamp("2025-03-01")]
+    assert set(fan["date"]) == set(dates)
+
+
+def test_point_forecast_dates_are_calendar_months():
+    """Test every forecaster labels horizon 1 with the month after the last observation"""
+    sarima = monthly_forecaster()
+    exp_smooth = forecasting.ExponentialSmoothingForecaster(sarima.series)
+    linear = forecasting.LinearTrendForecaster(sarima.series)
+    assert exp_smooth.fit() and linear.fit()
+    for forecaster in (sarima, exp_smooth, linear):
+        points = forecaster.forecast_periods(periods=14)
+        assert [p.date for p in points] == list(pd.date_range("2025-01-01", periods=14, freq="MS"))
+        assert (points[0].month, points[0].year) == ("JAN", 2025)
+
+
+def test_simulation_fan_brackets_point_forecast():
+    """Test fan quantiles are ordered around the point forecast and probabilities are shares"""
+    forecaster = monthly_forecaster()
+    fan, exceedance = forecasting.MonteCarloSimulator({"Combined": forecaster}, periods=6, n_paths=2000).run()
+    index = fan[fan["variable"] == "index"]
+    point = forecasting.sarima_forecast(forecaster.series.to_numpy(), forecaster.estimate, 6)[0]
+    assert (index["q05"].to_numpy() < point).all() and (point < index["q95"].to_numpy()).all()
+    assert (index["q05"] <= index["q50"]).all() and (index["q50"] <= index["q95"]).all()
+    probabilities = exceedance.filter(like="p_above_").to_numpy()
+    assert ((probabilities >= 0) & (probabilities <= 1)).all()
+
+
+# ============================================================================
+# FORECAST CACHE TESTS
+# ============================================================================
+
+def cpi_frame(series, sector="Combined"):
+    """Phase 3 style frame with one General Index row per month of `series`."""
+    return pd.DataFrame({
+        "date": series.index, "index_value": series.to_numpy(), "sector": sector, "group": "General Index",
+    })
+
+
+def test_cache_status_transitions(tmp_path):
+    """Test reused, updated and refit, including the forced refit after max_updates updates"""
+    cache = forecasting.ForecastCache(str(tmp_path / "cache.sqlite"), max_updates=2)
+    config = forecasting.CPIForecastingPipeline.model_config()
+    series = seasonal_series(61)
+    stored, next_month = series.iloc[:60], series.iloc[:61]
+    forecast = np.arange(12 * 3 * 6, dtype=float).reshape(12, 3, 6)
+    forecast[0, 1, 0] = np.nan
+
+    assert cache.lookup("Combined", stored, config) == (cache.REFIT, None)
+    cache.store("Combined", stored, config, {"sarima_order": [1, 1, 0, 0, 0, 0]}, forecast)
+
+    status, entry = cache.lookup("Combined", stored, config)
+    assert status == cache.REUSED
+    np.testing.assert_array_equal(entry["forecast"], forecast)
+    assert entry["state"] == {"sarima_order": [1, 1, 0, 0, 0, 0]} and entry["updates"] == 0
+
+    assert cache.lookup("Combined", next_month, config)[0] == cache.UPDATED
+    assert cache.lookup("Combined", seasonal_series(62), config)[0] == cache.REFIT
+    revised = next_month.copy()
+    revised.iloc[10] += 1.0
+    assert cache.lookup("Combined", revised, config)[0] == cache.REFIT
+    assert cache.lookup("Combined", stored, forecasting.CPIForecastingPipeline.model_config({"SARIMA": 2.0}))[0] == cache.REFIT
+
+    cache.store("Combined", stored, config, {}, forecast, updates=2)
+    assert cache.lookup("Combined", next_month, config)[0] == cache.REFIT
+    cache.close()
+
+
+def test_pipeline_returns_reused_forecast():
+    """Test a reused series takes its forecasts from the stored array instead of running the models"""
+    data = cpi_frame(seasonal_series())
+    fitted = forecasting.CPIForecastingPipeline(data)
+    assert fitted.run_forecasting(sarima_order=(1, 1, 0, 0, 0, 0))
+    stored = fitted.forecast_array + 1.0
+
+    reused = forecasting.CPIForecastingPipeline(data)
+    results = reused.run_forecasting(cached_state=fitted.model_state(), cached_forecast=stored)
+    assert "LinearTrend" not in reused.forecasters
+    np.testing.assert_array_equal(reused.forecast_array, stored)
+    base = [point.forecast_index for point in results["forecasts"]["Base"]]
+    np.testing.assert_allclose(base, np.round(forecasting.ensemble_array(stored)[:, forecasting.INDEX], 2))
+    assert [point.date for point in results["forecasts"]["Base"]] == [
+        point.date for point in fitted.forecasts["Base"]
+    ]
+
+
+def test_training_window_ends_with_data():
+    """Test the training series runs from Jan 2020 to the latest month loaded"""
+    series = pd.Series(np.linspace(100, 130, 84), index=pd.date_range("2019-01-01", periods=84, freq="MS"))
+    training = forecasting.CPIForecastingPipeline(cpi_frame(series)).prepare_training_data()
+    assert training.index[0] == pd.Timestamp("2020-01-01")
+    assert training.index[-1] == pd.Timestamp("2025-12-01")
+    assert len(training) == 72
+
+
+# ============================================================================
+# BACKTEST TESTS
+# ============================================================================
+
+def run_backtest(series, **kwargs):
+    backtest = forecasting.RollingOriginBacktest(
+        {"Combined": series}, horizon=6, min_train=36, refit_every=12, max_workers=1, **kwargs
+    )
+    return backtest, backtest.run()
+
+
+def test_backtest_origins_and_metrics():
+    """Test every origin from min_train on is scored, and late origins have fewer reachable horizons"""
+    backtest, metrics = run_backtest(seasonal_series())
+    np.testing.assert_array_equal(backtest.origins["Combined"], np.arange(36, 60))
+    assert set(metrics["model"]) == set(forecasting.BACKTEST_MODELS)
+    sarima = metrics[metrics["model"] == "SARIMA"].set_index("horizon")
+    assert sarima.loc[1, "origins"] == 24 and sarima.loc[6, "origins"] == 19
+    assert np.isfinite(sarima["rmse"]).all()
+
+
+def test_backtest_selects_orders_per_block():
+    """Test each block's SARIMA order is the search result on the months before its first origin"""
+    series = seasonal_series()
+    backtest, _ = run_backtest(series)
+    assert [origin for origin, _ in backtest.block_orders["Combined"]] == [36, 48]
+    for origin, order in backtest.block_orders["Combined"]:
+        search = forecasting.SARIMAOrderSearch({"Combined": series.iloc[:origin]}, max_workers=1)
+        assert order == search.run()["Combined"][0]
+
+
+def test_backtest_ignores_months_after_origin():
+    """Test forecasts from an origin do not change when the months after it change"""
+    series = seasonal_series()
+    shifted = series.copy()
+    shifted.iloc[48:] += 25.0
+    backtest, _ = run_backtest(series)
+    backtest_shifted, _ = run_backtest(shifted)
+    for model in ("SARIMA", "ExponentialSmoothing", "LinearTrend"):
+        np.testing.assert_allclose(
+            backtest.forecasts["Combined"][model][:13], backtest_shifted.forecasts["Combined"][model][:13]
+        )
+
+
+def test_backtest_linear_trend_matches_polyfit():
+    """Test the running-sum linear trend equals a fresh np.polyfit on every expanding window"""
+    values = seasonal_series().to_numpy()
+    origins = np.arange(36, 60)
+    forecasts = forecasting.expanding_linear_trend_forecasts(values, origins, 6)
+    for row, origin in enumerate(origins):
+        slope, intercept = np.polyfit(np.arange(origin), values[:origin], 1)
+        np.testing.assert_allclose(forecasts[row], intercept + slope * np.arange(origin, origin + 6))
+
+
+def test_backtest_fixed_orders():
+    """Test fixed orders skip the search, and a series without an order gets no SARIMA forecasts"""
+    backtest, _ = run_backtest(seasonal_series(), orders={"Combined": (1, 1, 0, 0, 0, 0)})
+    assert [order for _, order in backtest.block_orders["Combined"]] == [(1, 1, 0, 0, 0, 0)] * 2
+    backtest, _ = run_backtest(seasonal_series(), orders={})
+    assert np.isnan(backtest.forecasts["Combined"]["SARIMA"]).all()
+    assert np.isfinite(backtest.forecasts["Combined"]["Ensemble"]).all()
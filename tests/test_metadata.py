@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Metadata Resolution Tests
+Offline tests for the metadata cache, the filter-value index and selector
+resolution used by 9_get_data_by_names
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from mospi.metadata import (  # noqa: E402
+    FilterIndex, MetadataCache, entry_options, invalid_codes, parse_selectors, resolve_selectors,
+)
+
+STATES = ["Andhra Pradesh", "Jammu and Kashmir", "Karnataka", "Kerala", "NCT of Delhi", "Odisha",
+          "Tamil Nadu", "Uttar Pradesh", "Uttarakhand", "West Bengal", "ALL India"]
+
+METADATA = {
+    "data": {
+        "state": [{"state_code": i, "state_name": name} for i, name in enumerate(STATES, start=1)],
+        "sector": [{"sector_code": 1, "sector_name": "Rural"}, {"sector_code": 2, "sector_name": "Urban"},
+                   {"sector_code": 3, "sector_name": "Combined"}],
+        "group": [{"group_code": "1.1", "group_name": "Food and Beverages"},
+                  {"group_code": "2", "group_name": "Pan, Tobacco & Intoxicants"},
+                  {"group_code": "5", "group_name": "Fuel and Light"}],
+        "year": [2023, 2024],
+    },
+    "statusCode": True,
+}
+
+
+@pytest.fixture(scope="module")
+def index():
+    return FilterIndex(METADATA)
+
+
+# ============================================================================
+# FilterIndex TESTS
+# ============================================================================
+
+@pytest.mark.parametrize("dimension, value, method, name", [
+    ("state", "kerala", "exact", "Kerala"),
+    ("state", "4", "exact", "Kerala"),
+    ("state", "Orissa", "alias", "Odisha"),
+    ("state", "J&K", "alias", "Jammu and Kashmir"),
+    ("state", "Delhi", "alias", "NCT of Delhi"),
+    ("sector", "Total", "alias", "Combined"),
+    ("state", "West", "prefix", "West Bengal"),
+    ("group", "tobacco", "tokens", "Pan, Tobacco & Intoxicants"),
+    ("group", "pan tobacco and intoxicants", "exact", "Pan, Tobacco & Intoxicants"),
+    ("state", "Karela", "fuzzy", "Kerala"),
+    ("state", "Kerela", "fuzzy", "Kerala"),
+    ("state", "Tamilnadu", "fuzzy", "Tamil Nadu"),
+    ("year", "2024", "exact", "2024"),
+])
+def test_resolve_single_match(index, dimension, value, method, name):
+    """Test each lookup step resolves to the expected option"""
+    found, matches = index.resolve(dimension, value)
+    assert (found, [option[2] for option in matches]) == (method, [name])
+
+
+def test_resolve_ambiguous_prefix(index):
+    """Test a prefix shared by several names is reported, not guessed"""
+    method, matches = index.resolve("state", "Utt")
+    assert method == "ambiguous"
+    assert [name for _, _, name in matches] == ["Uttar Pradesh", "Uttarakhand"]
+
+
+def test_resolve_none_suggests_closest(index):
+    """Test an unmatched value comes back with the closest names, best first"""
+    method, matches = index.resolve("state", "Bihar")
+    assert method == "none"
+    assert 0 < len(matches) <= 5
+    method, matches = index.resolve("state", "Qqq")
+    assert (method, matches) == ("none", [])
+
+
+def test_dimension_and_known_values(index):
+    """Test selector keys map to dimensions and codes/names are known per param"""
+    assert index.dimension("State") == index.dimension("state_code") == "state"
+    assert index.dimension("district") is None
+    assert {"4", "Kerala"} <= index.known_values("state_code")
+    assert index.known_values("district_code") is None
+
+
+def test_entry_options_shapes():
+    """Test code/name columns are picked from dict entries and plain values pass through"""
+    assert entry_options("state", [{"state_code": 32, "state_name": "Kerala"}]) == [("state_code", "32", "Kerala")]
+    assert entry_options("year", ["2023-24"]) == [("year", "2023-24", "2023-24")]
+    assert entry_options("nic", [{"description": "Food"}]) == [("nic", "Food", "Food")]
+
+
+# ============================================================================
+# SELECTOR TESTS
+# ============================================================================
+
+def test_parse_selectors():
+    """Test string and dict selectors normalise to lists of values"""
+    assert parse_selectors("state=Kerala, Goa, sector=Urban") == {"state": ["Kerala", "Goa"], "sector": ["Urban"]}
+    assert parse_selectors({"state": "Kerala,Goa", "sector": ["Urban"]}) == {
+        "state": ["Kerala", "Goa"], "sector": ["Urban"],
+    }
+    assert parse_selectors(None) == {}
+
+
+def test_resolve_selectors(index):
+    """Test selectors become comma-joined codes with how each value matched"""
+    filters, resolved, unresolved = resolve_selectors(
+        index, {"state": ["Kerala", "Orissa", "kerala"], "sector": ["Urban"], "group": ["Utt"], "district": ["X"]},
+    )
+    assert filters == {"state_code": "4,6", "sector_code": "2"}
+    assert [entry["match"] for entry in resolved["state"]] == ["exact", "alias", "exact"]
+    assert [(item["selector"], item["value"]) for item in unresolved] == [("group", "Utt"), ("district", "X")]
+    assert unresolved[1]["options"] == sorted(METADATA["data"])
+
+
+def test_invalid_codes(index):
+    """Test only *_code params the metadata lists are checked"""
+    assert invalid_codes(index, {"state_code": "4, 40", "sector_code": "Urban", "year": "1999"}) == {
+        "state_code": ["40"],
+    }
+
+
+# ============================================================================
+# MetadataCache TESTS
+# ============================================================================
+
+def test_metadata_cache_fetches_once_and_indexes():
+    """Test responses are cached per params, errors are not, and the index follows the entry"""
+    cache = MetadataCache()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        return METADATA
+
+    assert cache.index("CPI", {"base_year": "2012"}) is None
+    assert cache.get("CPI", {"base_year": "2012"}, fetch) is METADATA
+    assert cache.get("CPI", {"base_year": 2012}, fetch) is METADATA
+    assert len(calls) == 1
+    index = cache.index("CPI", {"base_year": "2012"})
+    assert index is cache.index("CPI", {"base_year": "2012"})
+
+    cache.ttl = -1
+    assert cache.index("CPI", {"base_year": "2012"}) is None
+    assert cache.index("CPI", {"base_year": "2012"}, fetch) is not index
+    assert len(calls) == 2
+
+    error = {"error": "Upstream timeout"}
+    assert cache.get("CPI", {"base_year": "2010"}, lambda: error) is error
+    assert cache.index("CPI", {"base_year": "2010"}) is None
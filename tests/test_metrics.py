@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Derived Metrics Tests
+Offline tests for look-back filters, YoY/MoM/rolling metrics, period parsing
+and 6_get_derived_metrics; the upstream API is replaced by an in-memory fake
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import mospi_server  # noqa: E402
+from mospi.metadata import MetadataCache  # noqa: E402
+from mospi.metrics import derive_metrics, in_window, lookback_filters, metric_lags  # noqa: E402
+from mospi.timeseries import SeriesCache, format_period, row_period, rows_to_series  # noqa: E402
+
+
+@pytest.fixture
+def upstream(monkeypatch):
+    """Fake IIP annual endpoint serving 2011-12 .. 2022-23 for the financial years requested."""
+    calls = []
+
+    def fake_get_data(dataset, params):
+        calls.append((dataset, dict(params)))
+        years = params["financial_year"].split(",")
+        rows = [
+            {"financial_year": year, "base_year": "2011-12", "category": "Mining",
+             "index": 100.0 + 10 * (int(year[:4]) - 2011)}
+            for year in years if 2011 <= int(year[:4]) <= 2022
+        ]
+        return {"data": rows, "meta_data": {"totalRecords": len(rows)}}
+
+    monkeypatch.setattr(mospi_server.mospi, "get_data", fake_get_data)
+    monkeypatch.setattr(mospi_server, "series_cache", SeriesCache())
+    monkeypatch.setattr(mospi_server, "metadata_cache", MetadataCache())
+    return calls
+
+
+# ============================================================================
+# PERIOD TESTS
+# ============================================================================
+
+@pytest.mark.parametrize("row, period", [
+    ({"year": 2024, "month": "March"}, (2024, 3, 12)),
+    ({"year": "2024", "month_code": "11"}, (2024, 11, 12)),
+    ({"year": 2023, "quarter": "Q2 (Jul-Sep)"}, (2023, 2, 4)),
+    ({"year": "2019-20"}, (2019, 1, 1)),
+    ({"financial_year": "2019-20"}, (2019, 1, 1)),
+    ({"month": "March"}, None),
+    ({"year": 2024, "month": "Annual"}, None),
+])
+def test_row_period(row, period):
+    """Test rows map to (year, sub-period, periods per year)"""
+    assert row_period(row) == period
+
+
+def test_rows_to_series_groups_by_key_columns():
+    """Test rows split into one ordered series per descriptive key"""
+    rows = [
+        {"state": state, "year": 2024, "month": month, "index": 100 + i}
+        for i, (state, month) in enumerate([("Kerala", "Feb"), ("Goa", "Jan"), ("Kerala", "Jan")])
+    ]
+    field, series = rows_to_series(rows, None, None)
+    assert field == "index"
+    by_state = {item["key"]["state"]: item for item in series}
+    assert [format_period(p) for p in by_state["Kerala"]["periods"]] == ["2024-01", "2024-02"]
+    assert by_state["Kerala"]["values"] == [102.0, 100.0]
+
+
+# ============================================================================
+# LOOK-BACK TESTS
+# ============================================================================
+
+def test_lookback_monthly_yoy():
+    """Test YoY for March 2024 also fetches March 2023"""
+    fetch, requested = lookback_filters({"year": "2024", "month_code": "3"}, 12, metric_lags(["yoy"], 12, 12))
+    assert fetch == {"year": "2023,2024", "month_code": "3"}
+    assert requested == {(2024, 3)}
+    assert in_window((2024, 3, 12), requested)
+    assert not in_window((2023, 3, 12), requested)
+
+
+def test_lookback_monthly_mom_crosses_year():
+    """Test MoM for January fetches the previous December"""
+    fetch, _ = lookback_filters({"year": "2024", "month_code": "1"}, 12, metric_lags(["mom"], 12, 12))
+    assert fetch == {"year": "2023,2024", "month_code": "1,12"}
+
+
+def test_lookback_financial_year():
+    """Test IIP annual financial_year filters are widened by the look-back, keeping the format"""
+    fetch, requested = lookback_filters(
+        {"financial_year": "2020-21", "base_year": "2011-12"}, 1, metric_lags(["yoy", "rolling_mean"], 1, 3)
+    )
+    assert fetch == {"financial_year": "2018-19,2019-20,2020-21", "base_year": "2011-12"}
+    assert requested == {(2020, None)}
+
+
+def test_lookback_without_years():
+    """Test unrestricted requests are fetched as is"""
+    assert lookback_filters({"month_code": "3"}, 12, {12}) == ({"month_code": "3"}, None)
+
+
+# ============================================================================
+# METRIC TESTS
+# ============================================================================
+
+def test_derive_metrics_with_gap():
+    """Test metrics read the right periods and give None across a missing month"""
+    periods = [(2023, 1, 12), (2023, 2, 12), (2024, 1, 12), (2024, 3, 12)]
+    values = [100.0, 102.0, 110.0, 111.0]
+    points = derive_metrics(periods, values, ["yoy", "mom", "rolling_mean"], window=2)
+    assert points[1] == {"value": 102.0, "yoy": None, "mom": 2.0, "rolling_mean_2": 101.0}
+    assert points[2]["yoy"] == 10.0
+    assert points[3] == {"value": 111.0, "yoy": None, "mom": None, "rolling_mean_2": None}
+
+
+# ============================================================================
+# 6_get_derived_metrics TESTS
+# ============================================================================
+
+def test_derived_metrics_iip_annual(upstream):
+    """Test IIP annual YoY widens financial_year and returns only the requested years"""
+    result = mospi_server.get_derived_metrics(
+        "IIP", filters={"base_year": "2011-12", "type": "All", "financial_year": "2020-21,2021-22"},
+    ).structured_content
+    assert upstream[0][1]["financial_year"] == "2019-20,2020-21,2021-22"
+    assert result["series_count"] == 1
+    points = result["series"][0]["points"]
+    assert [point["period"] for point in points] == ["2020", "2021"]
+    assert points[0] == {"period": "2020", "value": 190.0, "yoy": 5.56}
+
+
+def test_derived_metrics_rejects_non_index_dataset(upstream):
+    """Test datasets without index levels are refused"""
+    result = mospi_server.get_derived_metrics("PLFS", filters={})
+    assert "index dataset" in result["error"]
+    assert upstream == []
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Pagination Tests
+Offline tests for continuation cursors, the page buffer and max_pages
+auto-pagination in 4_get_data; the upstream API is replaced by an in-memory fake
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import mospi_server  # noqa: E402
+from mospi.pagination import (  # noqa: E402
+    InvalidCursorError, PageBuffer, decode_cursor, encode_cursor, normalize_filters,
+)
+
+
+@pytest.fixture
+def upstream(monkeypatch):
+    """Serve 25 numbered rows through a paginating fake of mospi.get_data and count the calls."""
+    rows = [{"year": 2024, "item_code": i, "index_value": 100 + i} for i in range(25)]
+    calls = []
+
+    def fake_get_data(dataset, params):
+        calls.append(dict(params))
+        limit = int(params.get("limit") or mospi_server.DEFAULT_PAGE_LIMIT)
+        page = int(params.get("page") or 1)
+        return {"data": rows[(page - 1) * limit:page * limit], "meta_data": {"totalRecords": len(rows)}}
+
+    monkeypatch.setattr(mospi_server.mospi, "get_data", fake_get_data)
+    monkeypatch.setattr(mospi_server, "page_buffer", PageBuffer())
+    return rows, calls
+
+
+def call(**kwargs):
+    """Call 4_get_data for WPI and return the response dict."""
+    result = mospi_server.get_data("WPI", **kwargs)
+    return result.structured_content if hasattr(result, "structured_content") else result
+
+
+# ============================================================================
+# CURSOR ENCODING TESTS
+# ============================================================================
+
+def test_cursor_round_trip():
+    """Test a cursor decodes to exactly what was encoded"""
+    filters = normalize_filters({"year": "2023, 2024", "limit": "50", "page": "3"})
+    assert filters == {"limit": "50", "year": "2023,2024"}
+
+    cursor = encode_cursor("CPI_GROUP", filters, page=4, offset=7, snapshot=1700000000)
+    assert decode_cursor(cursor) == {
+        "dataset": "CPI_GROUP", "filters": filters, "page": 4, "offset": 7, "snapshot": 1700000000,
+    }
+
+
+@pytest.mark.parametrize("cursor", ["", "not-a-cursor", "eyJhIjogMX0"])
+def test_invalid_cursor_raises(cursor):
+    """Test garbage and incomplete cursors raise InvalidCursorError"""
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor)
+
+
+def test_page_buffer_expires():
+    """Test buffered pages are served until their TTL passes"""
+    buffer = PageBuffer(ttl=60)
+    buffer.put(1, "WPI", {}, 1, {"data": [1]})
+    assert buffer.get(1, "WPI", {}, 1) == {"data": [1]}
+    assert buffer.get(1, "WPI", {}, 2) is None
+
+    buffer.ttl = -1
+    assert buffer.get(1, "WPI", {}, 1) is None
+    assert (buffer.hits, buffer.misses) == (1, 2)
+
+
+# ============================================================================
+# 4_get_data PAGINATION TESTS
+# ============================================================================
+
+def test_next_cursor_walks_all_pages(upstream):
+    """Test following _next_cursor page by page returns every row once"""
+    rows, calls = upstream
+    received = []
+    response = call(filters={"limit": "10"})
+    while True:
+        received.extend(response["data"])
+        if "_next_cursor" not in response:
+            break
+        response = call(cursor=response["_next_cursor"])
+    assert received == rows
+    assert len(calls) == 3
+
+
+def test_max_pages_merges_pages(upstream):
+    """Test max_pages fetches consecutive pages in one call and reports them"""
+    rows, _ = upstream
+    response = call(filters={"limit": "10", "page": "2"}, max_pages=5)
+    assert response["data"] == rows[10:]
+    assert response["_pages_fetched"] == [2, 3]
+    assert "_next_cursor" not in response
+
+
+def test_cursor_for_other_dataset_rejected(upstream):
+    """Test a cursor cannot be replayed against another dataset"""
+    cursor = encode_cursor("WPI", {"limit": "10"}, page=2)
+    response = mospi_server.get_data("CPI", cursor=cursor)
+    assert "Cursor belongs to dataset WPI" in response["error"]
+
+
+@pytest.mark.parametrize("filters", [{"page": "abc"}, {"limit": "abc"}, {"limit": "0"}, {"page": "1.5"}])
+def test_non_numeric_paging_params_rejected(upstream, filters):
+    """Test non-numeric page/limit returns an error dict without calling upstream"""
+    _, calls = upstream
+    response = call(filters=filters)
+    assert response["error"] == "Invalid parameters"
+    assert set(response["invalid_values"]) == set(filters)
+    assert calls == []
+
+
+def test_non_numeric_limit_rejected_by_analysis_tools(upstream):
+    """Test tools that read whole series reject a non-numeric limit instead of raising"""
+    _, calls = upstream
+    response = mospi_server.detect_structural_breaks("WPI", filters={"limit": "abc"})
+    assert response["invalid_values"] == {"limit": "abc"}
+    assert calls == []